@@ -0,0 +1,74 @@
+"""
+Measure the incremental transform against transform_data on a paged catalog
+that mostly repeats the previous run
+
+Usage:
+    python benchmarks/bench_incremental.py [--pages N] [--page-size N] [--repeat N]
+
+The catalog is split into pages like those of extract_batches. For each
+share of changed pages, the store holds the previous run and the next run
+changes one Price on that share of pages. Times cover every page of a run,
+including fingerprinting.
+"""
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_transform import synthetic_frame  # noqa: E402
+from utils.incremental import IncrementalTransform  # noqa: E402
+from utils.transform import transform_data  # noqa: E402
+
+def timed(make_function, pages, repeat):
+    elapsed = 0.0
+    for _ in range(repeat):
+        function = make_function()
+        start = time.perf_counter()
+        for page in pages:
+            function(page)
+        elapsed += time.perf_counter() - start
+    return elapsed * 1000 / repeat
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=500, help="Pages in the synthetic catalog")
+    parser.add_argument("--page-size", type=int, default=20, help="Rows per page")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per variant")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    catalog = synthetic_frame(args.pages * args.page_size)
+    previous = [catalog.iloc[i:i + args.page_size] for i in range(0, len(catalog), args.page_size)]
+    store = os.path.join(tempfile.mkdtemp(), "batches.pkl")
+    transform = IncrementalTransform(store)
+    for page in previous:
+        transform(page)
+    transform.save()
+
+    rng = np.random.default_rng(1)
+    print(f"{args.pages} pages of {args.page_size} rows")
+    print(f"{'changed':>8} {'full ms':>9} {'incremental ms':>15}")
+    for share in (0.0, 0.01, 0.1, 0.5, 1.0):
+        current = []
+        for page in previous:
+            if rng.random() < share:
+                page = page.copy()
+                page.iloc[0, page.columns.get_loc('Price')] += 1
+            current.append(page)
+        transform = IncrementalTransform(store)
+        for page in current[:5]:
+            pd.testing.assert_frame_equal(transform(page), transform_data(page), check_categorical=False)
+        full = timed(lambda: transform_data, current, args.repeat)
+        # A fresh run each time, starting from the previous run's store
+        incremental = timed(lambda: IncrementalTransform(store), current, args.repeat)
+        print(f"{share:>8.0%} {full:>9.1f} {incremental:>15.1f}")
+
+if __name__ == "__main__":
+    main()
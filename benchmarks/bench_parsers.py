@@ -0,0 +1,95 @@
+"""
+Compare the card parser backends on saved pages
+
+Usage:
+    python benchmarks/bench_parsers.py [PAGES_DIR] [--repeat N] [--cards N] [--vectorized]
+
+PAGES_DIR holds saved *.html pages of the catalog. Without it, a synthetic
+page of --cards cards with the same markup as fashion-studio is generated.
+Times cover parsing plus adding the page to the extractor's column buffer.
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.extract import _ColumnBuffer  # noqa: E402
+from utils.parse import PARSER_BACKENDS, CardColumns, check_parser_backend, parse_cards  # noqa: E402
+
+def as_rows(rows):
+    return rows.rows() if isinstance(rows, CardColumns) else rows
+
+CARD_TEMPLATE = """
+<div class="collection-card">
+    <div style="position: relative;">
+        <img src="https://picsum.photos/280/350?random={i}" class="collection-image" alt="Product {i}">
+    </div>
+    <div class="product-details">
+        <h3 class="product-title">T-shirt {i}</h3>
+        <div class="price-container"><span class="price">${price:.2f}</span></div>
+        <p style="font-size: 14px; color: #777;">Rating: ⭐ {rating:.1f} / 5</p>
+        <p style="font-size: 14px; color: #777;">3 Colors</p>
+        <p style="font-size: 14px; color: #777;">Size: M</p>
+        <p style="font-size: 14px; color: #777;">Gender: Women</p>
+    </div>
+</div>
+"""
+
+def synthetic_page(cards=20):
+    body = "".join(
+        CARD_TEMPLATE.format(i=i, price=10 + i * 3.7, rating=1 + (i % 40) / 10)
+        for i in range(cards)
+    )
+    return f"<html><head><title>Fashion Studio</title></head><body><div class='collection-grid'>{body}</div></body></html>".encode()
+
+def load_pages(pages_dir, cards=20):
+    if not pages_dir:
+        return [synthetic_page(cards)]
+    pages = []
+    for path in sorted(glob.glob(os.path.join(pages_dir, "*.html"))):
+        with open(path, "rb") as f:
+            pages.append(f.read())
+    if not pages:
+        raise SystemExit(f"No *.html pages found in {pages_dir}")
+    return pages
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pages_dir", nargs="?", help="Directory of saved HTML pages")
+    parser.add_argument("--repeat", type=int, default=50, help="Passes over the page set per backend")
+    parser.add_argument("--cards", type=int, default=20, help="Cards on the synthetic page")
+    parser.add_argument("--vectorized", action="store_true", help="Parse card fields in bulk per page")
+    args = parser.parse_args()
+
+    pages = load_pages(args.pages_dir, args.cards)
+    expected = [parse_cards(page, backend='html.parser') for page in pages]
+    rows = sum(len(page_rows) for page_rows in expected)
+    print(f"{len(pages)} page(s), {rows} rows, {args.repeat} passes")
+    print(f"{'backend':<12} {'ms/page':>10} {'speedup':>8}")
+
+    baseline = None
+    for backend in PARSER_BACKENDS:
+        try:
+            check_parser_backend(backend)
+        except ValueError as e:
+            print(f"{backend:<12} skipped: {e}")
+            continue
+
+        # All backends must agree before their timings mean anything
+        if [as_rows(parse_cards(page, backend=backend, vectorized=args.vectorized)) for page in pages] != expected:
+            raise SystemExit(f"Backend {backend} returned different rows")
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for page in pages:
+                _ColumnBuffer().extend(parse_cards(page, backend=backend, vectorized=args.vectorized))
+        ms_per_page = (time.perf_counter() - start) * 1000 / (args.repeat * len(pages))
+
+        baseline = baseline or ms_per_page
+        print(f"{backend:<12} {ms_per_page:>10.3f} {baseline / ms_per_page:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
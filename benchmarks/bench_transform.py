@@ -0,0 +1,137 @@
+"""
+Measure peak memory, time and output size of transform_data against the
+previous copy-heavy implementation
+
+Usage:
+    python benchmarks/bench_transform.py [--rows N] [--repeat N] [--workers N ...]
+
+Peak memory is the tracemalloc high-water mark above the input frame,
+reported as a multiple of the input's own size. Output bytes/row excludes
+Title strings, which every variant shares. With --workers, the parallel
+transform is timed for each worker count (its peak only covers the parent
+process). The 'pyarrow' engine runs on the same NumPy-backed frame and on an
+Arrow-backed copy of it; its peak adds the Arrow memory pool's high-water
+mark, which tracemalloc cannot see, so it errs on the high side.
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.metrics import TransformMetrics  # noqa: E402
+from utils.parallel import transform_parallel  # noqa: E402
+from utils.schema import apply_schema  # noqa: E402
+from utils.transform import transform_data  # noqa: E402
+
+def legacy_transform(df):
+    # transform_data before the fused pass: copy, assign, masked write, astype
+    df_transformed = df.copy()
+    df_transformed.isnull().sum()
+    df_transformed = df_transformed.assign(
+        Title=df_transformed['Title'].fillna('Unknown Product'),
+        Rating=df_transformed['Rating'].fillna(0),
+        Size=df_transformed['Size'].fillna('Not Specified'),
+        Gender=df_transformed['Gender'].fillna('Unisex')
+    )
+    df_transformed.loc[df_transformed['Price'] < 0, 'Price'] = 0
+    df_transformed['Price'] = df_transformed['Price'].astype(np.float64)
+    df_transformed['Rating'] = df_transformed['Rating'].round().astype(np.int64)
+    df_transformed['Colors'] = df_transformed['Colors'].astype(np.float64)
+    df_transformed.isnull().sum()
+    return df_transformed
+
+def synthetic_frame(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    ratings = rng.uniform(1, 5, rows)
+    ratings[rng.random(rows) < 0.05] = np.nan
+    titles = np.array([f"T-shirt {i % 500}" for i in range(rows)], dtype=object)
+    titles[rng.random(rows) < 0.01] = None
+    return pd.DataFrame({
+        'Title': titles,
+        'Price': rng.uniform(-5, 500, rows),
+        'Rating': ratings,
+        'Colors': rng.integers(1, 6, rows),
+        'Size': rng.choice(np.array(['S', 'M', 'L', 'XL', None], dtype=object), rows),
+        'Gender': rng.choice(np.array(['Men', 'Women', 'Unisex', None], dtype=object), rows),
+        'Timestamp': datetime(2024, 3, 1, 12, 0, 0)
+    })
+
+def measure(transform, df, repeat, prepare=lambda frame: frame):
+    # prepare runs outside the measurement, e.g. to give inplace runs their own frame
+    frame = prepare(df)
+    if pa is not None:
+        default_pool = pa.default_memory_pool()
+        arrow_pool = pa.proxy_memory_pool(default_pool)
+        pa.set_memory_pool(arrow_pool)
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    result = transform(frame)
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+    if pa is not None:
+        pa.set_memory_pool(default_pool)
+        peak += arrow_pool.max_memory()
+    del result, frame
+
+    elapsed = 0.0
+    for _ in range(repeat):
+        frame = prepare(df)
+        start = time.perf_counter()
+        transform(frame)
+        elapsed += time.perf_counter() - start
+    return peak, elapsed * 1000 / repeat
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Rows in the synthetic frame")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per implementation")
+    parser.add_argument("--workers", type=int, nargs="*", default=[], help="Worker counts for the parallel transform")
+    args = parser.parse_args()
+
+    df = synthetic_frame(args.rows)
+    input_bytes = df.memory_usage(index=True, deep=False).sum()
+
+    # Both implementations must agree (up to the schema dtypes, which the
+    # legacy output lacked) before their numbers mean anything
+    pd.testing.assert_frame_equal(transform_data(df), apply_schema(legacy_transform(df)), check_categorical=False)
+
+    print(f"{args.rows} rows, input {input_bytes / 2**20:.1f} MiB (without string payloads)")
+    print(f"{'transform':<22} {'peak MiB':>9} {'x input':>8} {'ms/run':>9} {'B/row out':>10}")
+    candidates = [
+        ("legacy", legacy_transform, None),
+        ("fused", transform_data, None),
+        ("fused inplace", lambda frame: transform_data(frame, inplace=True), pd.DataFrame.copy),
+        ("fused, step timing", lambda frame: transform_data(frame, metrics=TransformMetrics(trace_memory=False)), None),
+    ]
+    for workers in args.workers:
+        candidates.append((
+            f"parallel x{workers}",
+            lambda frame, workers=workers: transform_parallel(frame, workers=workers, min_partition_rows=1),
+            None
+        ))
+    if pa is not None:
+        arrow_df = df.convert_dtypes(dtype_backend='pyarrow')
+        arrow_transform = lambda frame: transform_data(frame, engine='pyarrow')  # noqa: E731
+        candidates.append(("pyarrow", arrow_transform, None))
+        candidates.append(("pyarrow, Arrow input", arrow_transform, lambda frame: arrow_df))
+    for name, transform, prepare in candidates:
+        prepare = prepare or (lambda frame: frame)
+        peak, ms = measure(transform, df, args.repeat, prepare)
+        output = transform(prepare(df)).drop(columns='Title')
+        row_bytes = output.memory_usage(index=False, deep=True).sum() / len(output)
+        print(f"{name:<22} {peak / 2**20:>9.1f} {peak / input_bytes:>7.2f}x {ms:>9.1f} {row_bytes:>10.1f}")
+
+if __name__ == "__main__":
+    main()
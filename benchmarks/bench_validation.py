@@ -0,0 +1,53 @@
+"""
+Time validate_data against the previous scan-per-statistic validation
+
+Usage:
+    python benchmarks/bench_validation.py [--rows N] [--repeat N] [--sample N]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_transform import synthetic_frame  # noqa: E402
+from utils.transform import transform_data  # noqa: E402
+from utils.validation import validate_data  # noqa: E402
+
+def legacy_validate(df):
+    # validate_transformed_data before the rule engine: one scan per statistic
+    return {
+        'null_values': df.isnull().sum().to_dict(),
+        'price_range': {'min': df['Price'].min(), 'max': df['Price'].max()},
+        'unique_values': {'Gender': df['Gender'].unique().tolist(), 'Size': df['Size'].unique().tolist()},
+        'extraction_time_range': {'earliest': df['Timestamp'].min(), 'latest': df['Timestamp'].max()}
+    }
+
+def timed(function, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Rows in the synthetic frame")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per variant")
+    parser.add_argument("--sample", type=int, default=50_000, help="Rows checked in sampled mode")
+    args = parser.parse_args()
+
+    df = transform_data(synthetic_frame(args.rows))
+    print(f"{args.rows} rows, {args.repeat} runs")
+    print(f"{'validation':<28} {'ms/run':>9}")
+    variants = [
+        ("legacy (stats only)", lambda: legacy_validate(df)),
+        ("rules", lambda: validate_data(df)),
+        (f"rules, sample={args.sample}", lambda: validate_data(df, sample=args.sample)),
+    ]
+    for name, function in variants:
+        print(f"{name:<28} {timed(function, args.repeat):>9.1f}")
+
+if __name__ == "__main__":
+    main()
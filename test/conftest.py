@@ -1,5 +1,7 @@
 import pytest
+import numpy as np
 import pandas as pd
+from datetime import datetime
 
 @pytest.fixture(scope="session")
 def sample_data():
@@ -14,4 +16,50 @@ def sample_data():
 
 @pytest.fixture(scope="session")
 def sample_df(sample_data):
-    return pd.DataFrame(sample_data) 
\ No newline at end of file
+    return pd.DataFrame(sample_data) 
+
+EXTRACTION_TIME = datetime(2024, 3, 1, 12, 0, 0)
+
+@pytest.fixture(scope="session")
+def raw_products():
+    """
+    Build raw product frames shaped like the output of extract_from_web
+
+    Call it with the number of rows, or with the columns to set as lists;
+    every other product column repeats one valid value. With a seed, they
+    are random instead, with some nulls and negative prices like a messy
+    crawl. Extra columns are added after Timestamp.
+    """
+    def make(rows=None, timestamp=EXTRACTION_TIME, seed=None, **columns):
+        columns = {name: values for name, values in columns.items() if values is not None}
+        if rows is None:
+            rows = len(next(iter(columns.values()))) if columns else 3
+        if seed is None:
+            data = {
+                'Title': [f"Product {i}" for i in range(rows)],
+                'Price': [100.0] * rows,
+                'Rating': [4.5] * rows,
+                'Colors': [2] * rows,
+                'Size': ['M'] * rows,
+                'Gender': ['Unisex'] * rows
+            }
+        else:
+            rng = np.random.default_rng(seed)
+            titles = np.array([f"Product {i}" for i in rng.integers(0, 5000, rows)], dtype=object)
+            titles[rng.random(rows) < 0.05] = None
+            ratings = rng.uniform(1, 5, rows)
+            ratings[rng.random(rows) < 0.1] = np.nan
+            data = {
+                'Title': titles,
+                'Price': rng.uniform(-5, 500, rows),
+                'Rating': ratings,
+                'Colors': rng.integers(1, 6, rows),
+                'Size': rng.choice(np.array(['S', 'M', 'L', None], dtype=object), rows, p=[0.2, 0.5, 0.2, 0.1]),
+                'Gender': rng.choice(
+                    np.array(['Men', 'Women', 'Unisex', None], dtype=object), rows, p=[0.45, 0.3, 0.2, 0.05]
+                )
+            }
+        data['Timestamp'] = [timestamp] * rows
+        data.update(columns)
+        return pd.DataFrame(data)
+    return make
@@ -0,0 +1,120 @@
+import gzip
+import pytest
+import requests
+from unittest.mock import Mock, patch
+from utils.archive import ArchiveError, RecordingSession, ReplaySession, iter_archive
+from utils.extract import extract_from_web
+
+CARD_HTML = """
+    <div class="collection-card">
+        <h3 class="product-title">{title}</h3>
+        <span class="price">$100</span>
+        <div class="product-details">
+            <p>Rating: ⭐4.5/5</p>
+            <p>2 Colors</p>
+            <p>Size: M</p>
+            <p>Gender: Unisex</p>
+        </div>
+    </div>
+"""
+
+def _response(url, **kwargs):
+    response = requests.Response()
+    response.url = url
+    response.headers['Content-Type'] = 'text/html'
+    if url.endswith("/page3"):
+        response.status_code = 404
+        response._content = b""
+    else:
+        response.status_code = 200
+        response._content = CARD_HTML.format(title=f"Product at {url}").encode()
+    return response
+
+def test_record_then_replay_without_network(tmp_path):
+    path = str(tmp_path / "archive" / "responses")
+    session = Mock()
+    session.get.side_effect = _response
+
+    with RecordingSession(path, session=session) as recorder:
+        recorded = extract_from_web(base_url="https://test.com", max_pages=5, max_items=10, session=recorder)
+    assert recorder.recorded == 5  # The 404 is archived too
+
+    with patch('requests.get') as mock_get:
+        replay = ReplaySession(path)
+        replayed = extract_from_web(base_url="https://test.com", max_pages=5, max_items=10, session=replay)
+        mock_get.assert_not_called()
+
+    assert len(replay) == 5
+    assert replayed.drop(columns='Timestamp').equals(recorded.drop(columns='Timestamp'))
+    assert replayed['Title'].tolist() == [
+        "Product at https://test.com", "Product at https://test.com/page2",
+        "Product at https://test.com/page4", "Product at https://test.com/page5"
+    ]
+
+def test_each_run_gets_its_own_file(tmp_path):
+    path = str(tmp_path / "responses")
+    session = Mock()
+    session.get.side_effect = _response
+
+    for _ in range(2):
+        with RecordingSession(path, session=session) as recorder:
+            recorder.get("https://test.com")
+
+    records = list(iter_archive(path))
+    assert len(records) == 2
+    assert len(list((tmp_path / "responses").iterdir())) == 2
+    assert records[0]['url'] == "https://test.com"
+    assert records[0]['status'] == 200
+    assert records[0]['headers'] == {'Content-Type': 'text/html'}
+    assert b"Product at https://test.com" in records[0]['body']
+
+def test_replay_serves_latest_record_and_404_on_miss(tmp_path):
+    path = str(tmp_path / "responses")
+    session = Mock()
+    session.get.side_effect = [_response("https://test.com"), _response("https://test.com/page3")]
+    with RecordingSession(path, session=session) as recorder:
+        recorder.get("https://test.com")
+        recorder.get("https://test.com/page3")
+
+    replay = ReplaySession(path)
+    response = replay.get("https://test.com", timeout=5)
+    assert response.status_code == 200
+    assert response.headers['content-type'] == 'text/html'
+    assert replay.get("https://test.com/page3").status_code == 404
+    assert replay.get("https://other.com").status_code == 404
+    assert replay.misses == 1
+
+def test_replay_missing_or_corrupt_archive(tmp_path):
+    with pytest.raises(ArchiveError, match="not found"):
+        ReplaySession(str(tmp_path / "missing.jsonl.gz"))
+
+    path = str(tmp_path / "corrupt.jsonl.gz")
+    with gzip.open(path, 'wt') as f:
+        f.write("{not json\n")
+    with pytest.raises(ArchiveError, match="Corrupt record 1"):
+        ReplaySession(path)
+
+def test_interrupted_recording_keeps_complete_records(tmp_path):
+    path = str(tmp_path / "responses")
+    session = Mock()
+    session.get.side_effect = _response
+    with RecordingSession(path, session=session) as recorder:
+        recorder.get("https://test.com")
+        recorder.get("https://test.com/page2")
+    # Cut the run short, as an interrupted recording would, then record again
+    with open(recorder.file_path, 'rb') as f:
+        data = f.read()
+    with open(recorder.file_path, 'wb') as f:
+        f.write(data[:-8])
+    with RecordingSession(path, session=session) as recorder:
+        recorder.get("https://test.com/page4")
+
+    replay = ReplaySession(path)
+    assert len(replay) == 3
+    assert replay.get("https://test.com/page4").status_code == 200
+
+    path = str(tmp_path / "not_gzip.jsonl.gz")
+    with open(path, 'wb') as f:
+        f.write(b"not gzip")
+    with pytest.raises(ArchiveError, match="Cannot read"):
+        ReplaySession(path)
@@ -0,0 +1,125 @@
+import pytest
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from utils.load import save_to_parquet
+from utils.schema import arrow_schema, numpy_backed, sheet_values
+from utils.transform import TransformationError, transform_chunks, transform_data, validate_transformed_data
+from utils.validation import validate_data
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+@pytest.fixture
+def raw_df(raw_products):
+    return raw_products(
+        Title=['Product A', None, 'Product C', 'Product A', 'Product E'],
+        Price=[100.25, -50.0, np.nan, 3.0, 0.1],
+        Rating=[0.5, 1.5, None, 2.5, 4.9],
+        Colors=[2.0, np.nan, 3.0, 2.0, 1.0],
+        Size=['M', 'L', None, 'M', 'XXXL'],
+        Gender=['Men', None, 'Women', 'Men', 'Robot'],
+        Extra=[1, None, 3, 4, 5]
+    )
+
+def _decoded(df):
+    # Compare values, not encodings: the engines order dictionaries differently
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    columns = [
+        values.cast(values.type.value_type) if pa.types.is_dictionary(values.type) else values
+        for values in table.columns
+    ]
+    return pa.table(dict(zip(table.column_names, columns)))
+
+def _assert_same_result(df):
+    expected = transform_data(df.copy())
+    result = transform_data(df.copy(), engine='pyarrow')
+    assert result.index.equals(expected.index)
+    assert _decoded(result).equals(_decoded(expected))
+
+def test_engines_agree(raw_df):
+    _assert_same_result(raw_df)
+
+def test_engines_agree_on_categorical_and_csv_input(raw_df, tmp_path):
+    categorical = raw_df.astype({'Size': 'category', 'Gender': 'category'})
+    _assert_same_result(categorical)
+
+    path = tmp_path / "product.csv"
+    raw_df.to_csv(path, index=False)
+    _assert_same_result(pd.read_csv(path))
+    _assert_same_result(pd.read_csv(path, dtype_backend='pyarrow'))
+
+def test_engines_agree_on_all_missing_columns(raw_df):
+    raw_df['Title'] = None
+    raw_df['Colors'] = np.nan
+    _assert_same_result(raw_df)
+
+def test_engines_count_the_same_nulls(raw_df):
+    stats = {'pandas': {}, 'pyarrow': {}}
+    for engine, engine_stats in stats.items():
+        list(transform_chunks([raw_df.iloc[:2], raw_df.iloc[2:]], stats=engine_stats, engine=engine))
+    assert stats['pyarrow'] == stats['pandas']
+
+def test_arrow_output_matches_arrow_schema(raw_df):
+    result = transform_data(raw_df.drop(columns='Extra'), engine='pyarrow')
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in result.dtypes)
+    assert pa.Table.from_pandas(result, preserve_index=False).schema.remove_metadata() == arrow_schema()
+
+def test_arrow_output_writes_to_parquet(raw_df, tmp_path):
+    result = transform_data(raw_df.drop(columns='Extra'), engine='pyarrow')
+    path = tmp_path / "product.parquet"
+    save_to_parquet(result, str(path))
+    assert _decoded(pq.read_table(path).to_pandas(types_mapper=pd.ArrowDtype)).equals(_decoded(result))
+
+def test_arrow_output_sheet_values_match(raw_df):
+    raw_df = raw_df.drop(columns='Extra')
+    assert sheet_values(transform_data(raw_df, engine='pyarrow')) == sheet_values(transform_data(raw_df))
+
+def test_arrow_output_decodes_to_pandas_output(raw_df):
+    raw_df = raw_df.drop(columns='Extra')
+    expected = transform_data(raw_df)
+    decoded = numpy_backed(transform_data(raw_df, engine='pyarrow'))
+    pd.testing.assert_frame_equal(decoded, expected, check_dtype=False, check_categorical=False)
+    # Timestamps are written as timestamps, e.g. by COPY loads
+    assert decoded.to_csv(index=False, header=False) == expected.to_csv(index=False, header=False)
+    assert numpy_backed(expected) is expected
+
+@pytest.mark.parametrize("column, value", [('Rating', 300.0), ('Rating', np.inf), ('Colors', 1000.0)])
+def test_engines_reject_the_same_values(raw_df, column, value):
+    raw_df.loc[0, column] = value
+    for engine in ('pandas', 'pyarrow'):
+        with pytest.raises(TransformationError):
+            transform_data(raw_df, engine=engine)
+
+def test_unknown_engine(raw_df):
+    with pytest.raises(ValueError, match="Unknown engine"):
+        transform_data(raw_df, engine='polars')
+    with pytest.raises(ValueError, match="Unknown engine"):
+        validate_data(raw_df, engine='polars')
+
+def _comparable(report):
+    # Per-category value lists follow each engine's dictionary order
+    for stats in report['columns'].values():
+        if 'values' in stats:
+            stats['values'] = sorted(stats['values'])
+    return report
+
+@pytest.mark.parametrize("transform_engine", ['pandas', 'pyarrow'])
+def test_validation_engines_agree(raw_df, transform_engine):
+    transformed = transform_data(raw_df, engine=transform_engine)
+    expected = _comparable(validate_data(transform_data(raw_df)))
+    assert _comparable(validate_data(transformed, engine='pyarrow')) == expected
+    assert _comparable(validate_data(transformed.astype({'Title': object}), engine='pyarrow')) == expected
+
+def test_validate_raw_frame_with_arrow_engine(raw_df):
+    # Unencoded columns with nulls and out-of-range values
+    raw_df['Size'] = raw_df['Size'].astype(pd.ArrowDtype(pa.string()))
+    assert _comparable(validate_data(raw_df, engine='pyarrow')) == _comparable(validate_data(raw_df))
+
+def test_validate_transformed_data_arrow_engine(raw_df):
+    result = validate_transformed_data(transform_data(raw_df, engine='pyarrow'), engine='pyarrow')
+    assert result['total_rows'] == 5
+    assert result['price_range'] == {'min': 0.0, 'max': pytest.approx(100.25)}
+    assert sorted(result['unique_values']['Gender']) == ['Men', 'Robot', 'Unisex', 'Women']
+    assert result['extraction_time_range']['earliest'] == datetime(2024, 3, 1, 12, 0, 0)
+    assert result['rules']['failed_rows'] == 2
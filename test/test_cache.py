@@ -0,0 +1,84 @@
+import pytest
+from unittest.mock import Mock
+from utils.cache import HttpCache
+
+def _response(content=b"<html></html>", headers=None):
+    response = Mock()
+    response.status_code = 200
+    response.content = content
+    response.headers = headers or {}
+    return response
+
+def test_http_cache_roundtrip(tmp_path):
+    cache = HttpCache(str(tmp_path))
+    rows = [{"Title": "A", "Price": 1.0, "Rating": None, "Colors": 2, "Size": "M", "Gender": "Men"}]
+    response = _response(b"<html>page</html>", {'ETag': '"v1"', 'Last-Modified': 'Wed, 21 May 2025 20:30:33 GMT'})
+
+    assert cache.conditional_headers("https://test.com") == {}
+    assert cache.store("https://test.com", response, rows)
+
+    # A fresh instance sees the same entry on disk
+    cache = HttpCache(str(tmp_path))
+    assert cache.conditional_headers("https://test.com") == {
+        'If-None-Match': '"v1"',
+        'If-Modified-Since': 'Wed, 21 May 2025 20:30:33 GMT'
+    }
+    assert cache.cached_rows("https://test.com") == rows
+    assert cache.cached_body("https://test.com") == b"<html>page</html>"
+    assert cache.cached_rows("https://test.com/page2") is None
+    # Rows parsed another way are not reused
+    assert cache.cached_rows("https://test.com", mode="html.parser/vectorized") is None
+
+def test_http_cache_skips_responses_without_validators(tmp_path):
+    cache = HttpCache(str(tmp_path))
+    assert not cache.store("https://test.com", _response(), [])
+    assert cache.conditional_headers("https://test.com") == {}
+
+def test_http_cache_ignores_corrupt_entry(tmp_path):
+    cache = HttpCache(str(tmp_path))
+    cache.store("https://test.com", _response(headers={'ETag': '"v1"'}), [])
+    meta_path, _ = cache._paths("https://test.com")
+    with open(meta_path, 'w') as f:
+        f.write("{not json")
+    assert cache.cached_rows("https://test.com") is None
+
+def test_http_cache_requires_directory():
+    with pytest.raises(ValueError, match="Cache directory is required"):
+        HttpCache("")
+
+def test_parsed_page_cache_lru_eviction(tmp_path):
+    from utils.cache import ParsedPageCache
+
+    cache = ParsedPageCache(str(tmp_path / "parsed.json"), max_entries=2)
+    keys = [ParsedPageCache.digest(body) for body in (b"a", b"b", b"c")]
+    cache.put(keys[0], [{"Title": "A"}], 0.5)
+    cache.put(keys[1], [{"Title": "B"}], 0.5)
+    assert cache.get(keys[0]) == [{"Title": "A"}]  # A becomes most recently used
+    cache.put(keys[2], [{"Title": "C"}], 0.5)
+
+    assert cache.get(keys[1]) is None  # B was evicted
+    assert cache.stats() == {
+        'hits': 1, 'misses': 1, 'evictions': 1, 'entries': 2, 'parse_seconds_saved': 0.5
+    }
+
+def test_parsed_page_cache_persists_and_copies_rows(tmp_path):
+    from utils.cache import ParsedPageCache
+
+    path = str(tmp_path / "nested" / "parsed.json")
+    cache = ParsedPageCache(path)
+    key = ParsedPageCache.digest(b"page")
+    cache.put(key, [{"Title": "A"}], 0.1)
+    cache.get(key)[0]["Timestamp"] = "mutated"  # Callers may mutate the rows they get
+    cache.save()
+
+    reloaded = ParsedPageCache(path)
+    assert len(reloaded) == 1
+    assert reloaded.get(key) == [{"Title": "A"}]
+
+def test_parsed_page_cache_invalid_arguments(tmp_path):
+    from utils.cache import ParsedPageCache
+
+    with pytest.raises(ValueError, match="Cache path is required"):
+        ParsedPageCache("")
+    with pytest.raises(ValueError, match="max_entries must be a positive integer"):
+        ParsedPageCache(str(tmp_path / "parsed.json"), max_entries=0)
@@ -0,0 +1,77 @@
+import pytest
+import numpy as np
+from utils.dedup import Deduplicator, ProductKeyIndex, product_keys
+from utils.pipeline import run_streaming_pipeline
+from utils.transform import transform_data
+
+def test_product_keys_ignore_price_and_category_sets(raw_products):
+    first = transform_data(raw_products(Title=['A', 'B'], Size=['M', 'L'], Price=[1.0, 2.0]))
+    second = transform_data(raw_products(Title=['B'], Size=['L'], Price=[9.0]))
+
+    keys = product_keys(first)
+    assert keys.dtype == np.uint64
+    assert keys[1] == product_keys(second)[0]
+    assert keys[0] != keys[1]
+
+    with pytest.raises(ValueError, match="Missing product key columns"):
+        product_keys(first, key=('Title', 'Brand'))
+
+def test_deduplicator_drops_repeats_within_and_across_batches(raw_products):
+    dedup = Deduplicator()
+
+    first = dedup(transform_data(raw_products(Title=['A', 'B', 'A'])))
+    second = dedup(transform_data(raw_products(Title=['B', 'C'])))
+
+    assert first['Title'].tolist() == ['A', 'B']
+    assert second['Title'].tolist() == ['C']
+    assert dedup.stats == {'rows_in': 5, 'duplicates_in_run': 2, 'seen_before': 0, 'rows_out': 3}
+
+def test_deduplicator_custom_key(raw_products):
+    dedup = Deduplicator(key=('Title',))
+    assert dedup(transform_data(raw_products(Title=['A', 'A'], Size=['M', 'L'])))['Size'].tolist() == ['M']
+
+def test_index_persists_keys_between_runs(tmp_path, raw_products):
+    path = str(tmp_path / "index" / "keys.npy")
+    dedup = Deduplicator(index=ProductKeyIndex(path))
+    dedup(transform_data(raw_products(Title=['A', 'B'])))
+    dedup.save()
+
+    index = ProductKeyIndex(path)
+    assert len(index) == 2
+    dedup = Deduplicator(index=index)
+    result = dedup(transform_data(raw_products(Title=['A', 'C', 'C'])))
+
+    assert result['Title'].tolist() == ['C']
+    assert dedup.stats['seen_before'] == 1
+    assert dedup.stats['duplicates_in_run'] == 1
+
+def test_index_ignores_corrupt_file(tmp_path):
+    path = tmp_path / "keys.npy"
+    path.write_bytes(b"not numpy")
+    assert len(ProductKeyIndex(str(path))) == 0
+
+def test_pipeline_skips_duplicate_batches_and_saves_index(tmp_path, raw_products):
+    path = str(tmp_path / "keys.npy")
+    calls = []
+    sinks = {'memory': lambda df, append: calls.append((df['Title'].tolist(), append))}
+
+    dedup = Deduplicator(index=ProductKeyIndex(path))
+    batches = [raw_products(Title=['A', 'B']), raw_products(Title=['B', 'A']), raw_products(Title=['C'])]
+    summary = run_streaming_pipeline(batches, sinks, dedup=dedup)
+
+    assert calls == [(['A', 'B'], False), (['C'], True)]
+    assert summary['batches'] == 2
+    assert summary['rows'] == 3
+    assert summary['dedup']['duplicates_in_run'] == 2
+    assert len(ProductKeyIndex(path)) == 3
+
+def test_pipeline_keeps_index_when_a_sink_fails(tmp_path, raw_products):
+    path = tmp_path / "keys.npy"
+
+    def failing_sink(df, append):
+        raise RuntimeError("sink down")
+
+    dedup = Deduplicator(index=ProductKeyIndex(str(path)))
+    run_streaming_pipeline([raw_products(Title=['A'])], {'failing': failing_sink}, dedup=dedup)
+
+    assert not path.exists()
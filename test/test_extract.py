@@ -527,3 +527,348 @@ def test_redirect_handling():
         mock_get.side_effect = mock_response
         with pytest.raises(ExtractionError, match="Extraction failed"):
             extract_from_web(base_url="https://test.com", max_pages=1, max_items=1)
+
+def _card_html(title, price=100):
+    return f"""
+        <div class="collection-card">
+            <h3 class="product-title">{title}</h3>
+            <span class="price">${price}</span>
+            <div class="product-details">
+                <p>Rating: ⭐4.5/5</p>
+                <p>2 Colors</p>
+                <p>Size: M</p>
+                <p>Gender: Unisex</p>
+            </div>
+        </div>
+    """
+
+def test_concurrent_fetch_preserves_page_order():
+    import time
+
+    def mock_response(url, **kwargs):
+        mock = Mock()
+        mock.status_code = 200
+        page = 1 if url == "https://test.com" else int(url.rsplit("page", 1)[1])
+        # Later pages answer first so out-of-order completion is exercised
+        time.sleep(0.01 * (5 - page))
+        mock.content = _card_html(f"Page {page} Product").encode()
+        return mock
+
+    session = Mock()
+    session.get.side_effect = mock_response
+    df = extract_from_web(base_url="https://test.com", max_pages=4, max_items=10, workers=4, session=session)
+
+    assert df['Title'].tolist() == [f"Page {page} Product" for page in range(1, 5)]
+    assert session.get.call_count == 4
+
+def test_concurrent_max_items_cancels_outstanding_fetches():
+    session = Mock()
+    session.get.return_value.content = _card_html("Test Product").encode()
+    session.get.return_value.status_code = 200
+
+    df = extract_from_web(base_url="https://test.com", max_pages=50, max_items=1, workers=2, session=session)
+
+    assert len(df) == 1
+    # Only the pages already queued ahead of the consumer may have been fetched
+    assert session.get.call_count <= 5
+
+def test_concurrent_creates_pooled_session():
+    with patch('utils.extract.create_session') as mock_create:
+        session = mock_create.return_value
+        session.get.return_value.content = _card_html("Test Product").encode()
+        session.get.return_value.status_code = 200
+
+        df = extract_from_web(base_url="https://test.com", max_pages=2, max_items=5, workers=2)
+
+        mock_create.assert_called_once_with(pool_size=2)
+        session.close.assert_called_once()
+        assert len(df) == 2
+
+def test_invalid_workers():
+    with pytest.raises(ExtractionError, match="Extraction failed: workers must be a positive integer"):
+        extract_from_web(base_url="https://test.com", max_pages=1, max_items=1, workers=0)
+
+def test_extract_batches_yields_one_frame_per_page():
+    from utils.extract import extract_batches
+
+    def mock_response(url, **kwargs):
+        mock = Mock()
+        mock.status_code = 200
+        mock.content = (_card_html(f"{url} A") + _card_html(f"{url} B")).encode()
+        return mock
+
+    with patch('requests.get') as mock_get:
+        mock_get.side_effect = mock_response
+        batches = list(extract_batches(base_url="https://test.com", max_pages=3, max_items=5))
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]  # Last page trimmed to max_items
+    assert batches[1].iloc[0]['Title'] == "https://test.com/page2 A"
+    assert batches[0]['Timestamp'].iloc[0] == batches[2]['Timestamp'].iloc[0]
+
+def test_extract_batches_no_data():
+    from utils.extract import extract_batches
+
+    with patch('requests.get') as mock_get:
+        mock_get.return_value.content = "<div>No products</div>".encode()
+        mock_get.return_value.status_code = 200
+
+        with pytest.raises(ExtractionError, match="No data was extracted from any page"):
+            list(extract_batches(base_url="https://test.com", max_pages=2, max_items=5))
+
+def test_extract_with_stream_parser(mock_html_multiple_products):
+    with patch('requests.get') as mock_get:
+        mock_get.return_value.content = mock_html_multiple_products.encode()
+        mock_get.return_value.status_code = 200
+
+        df = extract_from_web(base_url="https://test.com", max_pages=1, max_items=5, parser='stream')
+
+        assert df['Title'].tolist() == ["Test Product 1", "Test Product 2"]
+        assert df['Colors'].tolist() == [2, 3]
+
+def test_invalid_parser_backend():
+    with pytest.raises(ExtractionError, match="Extraction failed: Unknown parser backend: regex"):
+        extract_from_web(base_url="https://test.com", max_pages=1, max_items=1, parser='regex')
+
+def test_conditional_requests_reuse_cached_rows(tmp_path, mock_html_multiple_products):
+    from utils.cache import HttpCache
+
+    cache = HttpCache(str(tmp_path))
+    session = Mock()
+
+    def mock_response(url, **kwargs):
+        mock = Mock()
+        if kwargs['headers'].get('If-None-Match') == '"v1"':
+            mock.status_code = 304
+            mock.content = b""
+        else:
+            mock.status_code = 200
+            mock.content = mock_html_multiple_products.encode()
+        mock.headers = {'ETag': '"v1"'}
+        return mock
+
+    session.get.side_effect = mock_response
+    first = extract_from_web(base_url="https://test.com", max_pages=1, max_items=5, session=session, http_cache=cache)
+
+    with patch('utils.extract.parse_cards') as mock_parse:
+        second = extract_from_web(base_url="https://test.com", max_pages=1, max_items=5, session=session, http_cache=cache)
+        mock_parse.assert_not_called()
+
+    assert session.get.call_args.kwargs['headers'] == {'If-None-Match': '"v1"'}
+    pd.testing.assert_frame_equal(first.drop(columns='Timestamp'), second.drop(columns='Timestamp'))
+
+def test_parse_cache_skips_parsing_identical_pages(tmp_path, mock_html_response):
+    from utils.cache import ParsedPageCache
+    from utils.parse import parse_cards
+
+    cache = ParsedPageCache(str(tmp_path / "parsed.json"))
+    with patch('requests.get') as mock_get, patch('utils.extract.parse_cards', wraps=parse_cards) as mock_parse:
+        mock_get.return_value.content = mock_html_response.encode()
+        mock_get.return_value.status_code = 200
+
+        df = extract_from_web(base_url="https://test.com", max_pages=3, max_items=5, parse_cache=cache)
+
+        assert len(df) == 3
+        assert mock_parse.call_count == 1  # Pages 2 and 3 have the same bytes as page 1
+    assert cache.stats()['hits'] == 2
+    assert len(ParsedPageCache(str(tmp_path / "parsed.json"))) == 1
+
+def test_parse_cache_is_keyed_by_parse_mode(tmp_path):
+    from utils.cache import ParsedPageCache
+
+    html = _card_html("Good Product") + _card_html("Bad Price", price="Unavailable")
+    cache = ParsedPageCache(str(tmp_path / "parsed.json"))
+    with patch('requests.get') as mock_get:
+        mock_get.return_value.content = html.encode()
+        mock_get.return_value.status_code = 200
+
+        scalar = extract_from_web(base_url="https://test.com", max_pages=1, max_items=10, parse_cache=cache)
+        # A warm cache from a per-card run does not serve a vectorized one
+        first = extract_from_web(
+            base_url="https://test.com", max_pages=1, max_items=10, parse_cache=cache, vectorized_parse=True
+        )
+        second = extract_from_web(
+            base_url="https://test.com", max_pages=1, max_items=10, parse_cache=cache, vectorized_parse=True
+        )
+
+    assert scalar['Title'].tolist() == ["Good Product"]
+    assert cache.stats()['hits'] == 1
+    pd.testing.assert_frame_equal(first.drop(columns='Timestamp'), second.drop(columns='Timestamp'))
+    assert second['Title'].tolist() == ["Good Product", "Bad Price"]
+    # Error counts come with the cached page
+    assert first.attrs['parse_errors'] == second.attrs['parse_errors']
+    assert second.attrs['parse_errors']['Price'] == 1
+
+def test_not_modified_pages_reuse_rows_of_the_same_parse_mode(tmp_path):
+    from utils.cache import HttpCache
+
+    cache = HttpCache(str(tmp_path))
+    html = _card_html("Good Product") + _card_html("Bad Price", price="Unavailable")
+    session = Mock()
+
+    def mock_response(url, **kwargs):
+        mock = Mock()
+        if kwargs['headers'].get('If-None-Match') == '"v1"':
+            mock.status_code = 304
+            mock.content = b""
+        else:
+            mock.status_code = 200
+            mock.content = html.encode()
+        mock.headers = {'ETag': '"v1"'}
+        return mock
+
+    session.get.side_effect = mock_response
+    extract_from_web(base_url="https://test.com", max_pages=1, max_items=10, session=session, http_cache=cache)
+    df = extract_from_web(
+        base_url="https://test.com", max_pages=1, max_items=10, session=session, http_cache=cache,
+        vectorized_parse=True
+    )
+    assert df['Title'].tolist() == ["Good Product", "Bad Price"]
+    assert df.attrs['parse_errors']['Price'] == 1
+
+def _paged_site(total_pages):
+    def mock_response(url, **kwargs):
+        mock = Mock()
+        page = 1 if url == "https://test.com" else int(url.rsplit("page", 1)[1])
+        if page > total_pages:
+            mock.status_code = 404
+            mock.raise_for_status.side_effect = requests.exceptions.HTTPError("404 Not Found", response=mock)
+            return mock
+        mock.status_code = 200
+        next_link = f'<a class="page-link" href="/page{page + 1}">Next</a>' if page < total_pages else ""
+        mock.content = (
+            _card_html(f"Page {page} Product")
+            + f'<ul class="pagination"><li>Page {page} of {total_pages}</li>{next_link}</ul>'
+        ).encode()
+        return mock
+    return mock_response
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_discover_pages_fetches_only_existing_pages(workers):
+    session = Mock()
+    session.get.side_effect = _paged_site(total_pages=3)
+
+    df = extract_from_web(base_url="https://test.com", max_pages=50, max_items=100, workers=workers,
+                          session=session, discover_pages=True)
+
+    assert df['Title'].tolist() == ["Page 1 Product", "Page 2 Product", "Page 3 Product"]
+    assert session.get.call_count == 3
+
+def test_max_empty_pages_stops_crawl():
+    session = Mock()
+    session.get.side_effect = _paged_site(total_pages=2)
+
+    df = extract_from_web(base_url="https://test.com", max_pages=50, max_items=100,
+                          session=session, max_empty_pages=2)
+
+    assert len(df) == 2
+    assert session.get.call_count == 4  # Pages 3 and 4 answer 404
+
+def test_invalid_max_empty_pages():
+    with pytest.raises(ExtractionError, match="max_empty_pages must be a positive integer"):
+        extract_from_web(base_url="https://test.com", max_pages=1, max_items=1, max_empty_pages=-1)
+
+def test_deferred_retry_recovers_failed_pages():
+    from utils.fetch import FetchPolicy
+
+    attempts = {}
+
+    def mock_response(url, **kwargs):
+        attempts[url] = attempts.get(url, 0) + 1
+        if url.endswith("page2") and attempts[url] == 1:
+            raise requests.exceptions.ConnectionError("Failed to connect")
+        mock = Mock()
+        mock.status_code = 200
+        mock.content = _card_html(url).encode()
+        return mock
+
+    session = Mock()
+    session.get.side_effect = mock_response
+    df = extract_from_web(base_url="https://test.com", max_pages=3, max_items=10, session=session,
+                          fetch_policy=FetchPolicy(deferred_retry=True))
+
+    # Page 2 comes back last, after the retry pass
+    assert df['Title'].tolist() == ["https://test.com", "https://test.com/page3", "https://test.com/page2"]
+    assert attempts["https://test.com/page2"] == 2
+
+def test_deferred_retry_skips_missing_pages():
+    from utils.fetch import FetchPolicy
+
+    session = Mock()
+    session.get.side_effect = _paged_site(total_pages=1)
+    df = extract_from_web(base_url="https://test.com", max_pages=2, max_items=10, session=session,
+                          fetch_policy=FetchPolicy(deferred_retry=True))
+
+    assert len(df) == 1
+    assert session.get.call_count == 2  # The 404 page is not retried
+
+def test_columnar_buffer_builds_typed_frame():
+    from datetime import datetime
+    from utils.extract import _ColumnBuffer
+
+    buffer = _ColumnBuffer()
+    buffer.extend([
+        {"Title": "A", "Price": 10.0, "Rating": 4.5, "Colors": 3, "Size": "M", "Gender": "Men"},
+        {"Title": "B", "Price": 20.5, "Rating": None, "Colors": 1, "Size": "L", "Gender": "Men"},
+        {"Title": "C", "Price": 30.0, "Rating": 2.0, "Colors": 2, "Size": "M", "Gender": "Women"},
+    ])
+    timestamp = datetime(2024, 3, 1, 12, 0, 0)
+    df = buffer.to_frame(timestamp)
+
+    assert len(buffer) == 3
+    assert df.columns.tolist() == ['Title', 'Price', 'Rating', 'Colors', 'Size', 'Gender', 'Timestamp']
+    assert df['Price'].dtype == 'float64'
+    assert df['Colors'].dtype == 'int64'
+    assert pd.isna(df.loc[1, 'Rating'])
+    assert df['Size'].tolist() == ['M', 'L', 'M']
+    assert df.loc[0, 'Size'] is df.loc[2, 'Size']  # Repeated values share one string object
+    assert (df['Timestamp'] == timestamp).all()
+
+def test_extract_all_missing_ratings_are_float():
+    with patch('requests.get') as mock_get:
+        mock_get.return_value.content = _card_html("Test Product").replace("⭐4.5/5", "Not Rated").encode()
+        mock_get.return_value.status_code = 200
+
+        df = extract_from_web(base_url="https://test.com", max_pages=1, max_items=1)
+
+        assert df['Rating'].dtype == 'float64'
+        assert df['Rating'].isna().all()
+
+def test_columnar_buffer_takes_bulk_parsed_columns():
+    from datetime import datetime
+    from utils.extract import _ColumnBuffer
+    from utils.parse import CardColumns
+
+    rows = [
+        {"Title": "A", "Price": 10.0, "Rating": 4.5, "Colors": 3, "Size": "M", "Gender": "Men"},
+        {"Title": "B", "Price": 20.5, "Rating": None, "Colors": None, "Size": None, "Gender": "Men"},
+    ]
+    by_row, by_column = _ColumnBuffer(), _ColumnBuffer()
+    by_row.extend(rows)
+    by_row.extend(rows)
+    columns = CardColumns({
+        "Title": ["A", "B"], "Price": [10.0, 20.5], "Rating": [4.5, float('nan')],
+        "Colors": [3.0, float('nan')], "Size": ["M", None], "Gender": ["Men", "Men"]
+    })
+    by_column.extend(rows)
+    by_column.extend(columns)
+    # Well-formed pages hand over their counts as ints
+    by_row.extend(rows[:1])
+    by_column.extend(CardColumns({
+        "Title": ["A"], "Price": [10.0], "Rating": [4.5], "Colors": [3], "Size": ["M"], "Gender": ["Men"]
+    }))
+
+    timestamp = datetime(2024, 3, 1, 12, 0, 0)
+    pd.testing.assert_frame_equal(by_column.to_frame(timestamp), by_row.to_frame(timestamp))
+
+def test_vectorized_parse_keeps_malformed_cards():
+    html = _card_html("Good Product") + _card_html("Bad Price", price="Unavailable")
+    with patch('requests.get') as mock_get:
+        mock_get.return_value.content = html.encode()
+        mock_get.return_value.status_code = 200
+
+        df = extract_from_web(base_url="https://test.com", max_pages=1, max_items=10, vectorized_parse=True)
+
+        assert df['Title'].tolist() == ["Good Product", "Bad Price"]
+        assert df.loc[0, 'Price'] == 100.0
+        assert pd.isna(df.loc[1, 'Price'])
+        assert df.attrs['parse_errors']['Price'] == 1
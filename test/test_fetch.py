@@ -0,0 +1,88 @@
+import threading
+import time
+import pytest
+import requests
+from unittest.mock import Mock
+from utils.fetch import FetchPolicy, PageFetcher
+
+def _ok(content=b"ok"):
+    response = Mock()
+    response.status_code = 200
+    response.content = content
+    return response
+
+def _http_error(status):
+    response = Mock()
+    response.status_code = status
+    response.raise_for_status.side_effect = requests.exceptions.HTTPError(f"{status} Error", response=response)
+    return response
+
+def test_fetcher_retries_transient_errors_with_backoff():
+    session = Mock()
+    session.get.side_effect = [requests.exceptions.ConnectionError("reset"), _http_error(503), _ok()]
+    delays = []
+    fetcher = PageFetcher(session=session, policy=FetchPolicy(timeout=(3.05, 27), retries=2, backoff=1.0),
+                          sleep=delays.append)
+
+    assert fetcher("https://test.com").content == b"ok"
+    assert session.get.call_count == 3
+    assert session.get.call_args.kwargs['timeout'] == (3.05, 27)
+    assert 0 <= delays[0] <= 1.0 and 0 <= delays[1] <= 2.0  # Full jitter, doubling cap
+
+def test_fetcher_does_not_retry_client_errors():
+    session = Mock()
+    session.get.return_value = _http_error(404)
+    fetcher = PageFetcher(session=session, policy=FetchPolicy(retries=3), sleep=lambda delay: None)
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        fetcher("https://test.com")
+    assert session.get.call_count == 1
+
+def test_fetcher_gives_up_after_retries():
+    session = Mock()
+    session.get.side_effect = requests.exceptions.Timeout("slow")
+    fetcher = PageFetcher(session=session, policy=FetchPolicy(retries=2), sleep=lambda delay: None)
+
+    with pytest.raises(requests.exceptions.Timeout):
+        fetcher("https://test.com")
+    assert session.get.call_count == 3
+
+def test_fetcher_hedges_requests_slower_than_p95():
+    calls = []
+    lock = threading.Lock()
+
+    def get(url, **kwargs):
+        with lock:
+            calls.append(url)
+            attempt = calls.count(url)
+        # The first request for the slow page stalls; its duplicate is fast
+        if url.endswith("slow") and attempt == 1:
+            time.sleep(1.0)
+            return _ok(b"late")
+        return _ok(b"fast")
+
+    session = Mock()
+    session.get.side_effect = get
+    fetcher = PageFetcher(session=session, policy=FetchPolicy(hedge=True, hedge_min_samples=5))
+    for i in range(5):
+        fetcher(f"https://test.com/page{i}")
+
+    start = time.perf_counter()
+    response = fetcher("https://test.com/slow")
+    elapsed = time.perf_counter() - start
+    fetcher.close()
+
+    assert response.content == b"fast"
+    assert fetcher.hedged == 1
+    assert elapsed < 0.5
+    assert fetcher.latency_quantile(0.5) is not None
+
+def test_fetch_policy_validation():
+    with pytest.raises(ValueError, match="timeout must be a positive number"):
+        FetchPolicy(timeout=(1, 2, 3))
+    with pytest.raises(ValueError, match="timeout must be a positive number"):
+        FetchPolicy(timeout=0)
+    with pytest.raises(ValueError, match="retries must be a non-negative integer"):
+        FetchPolicy(retries=-1)
+    with pytest.raises(ValueError, match="backoff delays must not be negative"):
+        FetchPolicy(backoff=-1)
@@ -0,0 +1,97 @@
+import pytest
+import pandas as pd
+from datetime import datetime
+from unittest import mock
+from utils import incremental
+from utils.incremental import IncrementalTransform, batch_fingerprint
+from utils.pipeline import run_streaming_pipeline
+from utils.transform import TransformationError, transform_data
+
+def _assert_matches_transform(result, raw):
+    pd.testing.assert_frame_equal(result, transform_data(raw), check_categorical=False)
+
+def test_batch_fingerprint_ignores_timestamp(raw_products):
+    first = batch_fingerprint(raw_products(6, seed=0))
+    assert first == batch_fingerprint(raw_products(6, seed=0, timestamp=datetime(2024, 3, 2)))
+    changed = raw_products(6, seed=0)
+    changed.loc[5, 'Price'] = 0.0
+    assert first != batch_fingerprint(changed)
+    assert first != batch_fingerprint(raw_products(7, seed=0))
+
+def test_unchanged_batches_are_reused(raw_products):
+    transform = IncrementalTransform()
+    _assert_matches_transform(transform(raw_products(6, seed=0)), raw_products(6, seed=0))
+    transform.save()
+
+    next_run = raw_products(6, seed=0, timestamp=datetime(2024, 3, 2, 12, 0, 0))
+    with mock.patch.object(incremental, 'transform_data', side_effect=AssertionError("transformed")):
+        result = transform(next_run)
+    _assert_matches_transform(result, next_run)
+    assert transform.stats == {'batches': 2, 'reused': 1, 'rows': 12, 'rows_reused': 6}
+
+def test_only_changed_batches_are_transformed(raw_products):
+    pages = [raw_products(12, seed=0).iloc[i:i + 4] for i in range(0, 12, 4)]
+    transform = IncrementalTransform()
+    for page in pages:
+        transform(page)
+    transform.save()
+
+    pages[1] = pages[1].copy()
+    pages[1].loc[5, 'Size'] = 'XXL'
+    with mock.patch.object(incremental, 'transform_data', wraps=transform_data) as transform_mock:
+        results = [transform(page) for page in pages]
+    assert transform_mock.call_count == 1
+    assert transform_mock.call_args.args[0].index.tolist() == [4, 5, 6, 7]
+    for result, page in zip(results, pages):
+        _assert_matches_transform(result, page)
+
+def test_store_persists_across_runs(tmp_path, raw_products):
+    path = str(tmp_path / "store" / "batches.pkl")
+    first = IncrementalTransform(path)
+    first(raw_products(3, seed=0))
+    first(raw_products(6, seed=0).iloc[3:])
+    first.save()
+
+    second = IncrementalTransform(path)
+    assert len(second) == 2
+    raw = raw_products(6, seed=0).iloc[3:]
+    _assert_matches_transform(second(raw), raw)
+    assert second.stats['reused'] == 1
+    second(raw_products(5, seed=0))
+    second.save()
+    # Batches not seen in the latest run drop out of the store
+    assert len(IncrementalTransform(path)) == 2
+
+def test_output_does_not_share_the_store(raw_products):
+    transform = IncrementalTransform()
+    output = transform(raw_products(6, seed=0))
+    output.loc[0, 'Price'] = -1.0
+    price = transform_data(raw_products(6, seed=0)).loc[0, 'Price']
+    result = transform(raw_products(6, seed=0))
+    assert result.loc[0, 'Price'] == price
+    result.loc[0, 'Price'] = -1.0
+    assert transform(raw_products(6, seed=0)).loc[0, 'Price'] == price
+
+def test_unreadable_store_is_ignored(tmp_path, raw_products):
+    path = tmp_path / "batches.pkl"
+    path.write_bytes(b"not a pickle")
+    transform = IncrementalTransform(str(path))
+    assert len(transform) == 0
+    _assert_matches_transform(transform(raw_products(6, seed=0)), raw_products(6, seed=0))
+
+def test_invalid_input(raw_products):
+    with pytest.raises(TransformationError):
+        IncrementalTransform()(pd.DataFrame())
+    with pytest.raises(TransformationError, match="Missing required columns"):
+        IncrementalTransform()(raw_products(6, seed=0).drop(columns='Price'))
+
+def test_streaming_pipeline_saves_the_store(tmp_path, raw_products):
+    path = str(tmp_path / "batches.pkl")
+    loaded = []
+    summary = run_streaming_pipeline(
+        [raw_products(4, seed=0), raw_products(2, seed=0)], {'memory': lambda df, append: loaded.append(df)},
+        incremental=IncrementalTransform(path)
+    )
+    assert summary['rows'] == 6
+    _assert_matches_transform(loaded[1], raw_products(2, seed=0))
+    assert len(IncrementalTransform(path)) == 2
@@ -0,0 +1,82 @@
+import json
+import logging
+import tracemalloc
+import pytest
+import numpy as np
+from utils.metrics import TransformMetrics
+from utils.pipeline import run_streaming_pipeline
+from utils.transform import TransformationError, transform_chunks, transform_data
+
+COLUMNS = ['Title', 'Price', 'Rating', 'Colors', 'Size', 'Gender', 'Timestamp']
+
+@pytest.fixture
+def raw_df(raw_products):
+    return raw_products(
+        Title=['Product A', None, 'Product C'],
+        Price=[100.0, -50.0, np.nan],
+        Rating=[4.5, None, 3.0],
+        Colors=[2, 1, 3],
+        Size=['M', None, 'L'],
+        Gender=['Men', 'Women', None]
+    )
+
+def test_transform_data_records_each_step(raw_df):
+    metrics = TransformMetrics()
+    transform_data(raw_df, metrics=metrics)
+
+    report = metrics.as_dict()
+    assert list(report['steps']) == COLUMNS
+    for stats in report['steps'].values():
+        assert stats['calls'] == 1
+        assert stats['rows'] == 3
+        assert stats['seconds'] >= 0
+        assert stats['peak_bytes'] >= 0
+    assert report['seconds'] == pytest.approx(sum(stats['seconds'] for stats in report['steps'].values()))
+    assert not tracemalloc.is_tracing()
+
+def test_metrics_without_memory_tracing(raw_df):
+    metrics = TransformMetrics(trace_memory=False)
+    transform_data(raw_df, metrics=metrics)
+    assert all(stats['peak_bytes'] is None for stats in metrics.as_dict()['steps'].values())
+
+def test_metrics_accumulate_over_chunks(raw_df):
+    metrics = TransformMetrics()
+    list(transform_chunks([raw_df, raw_df.iloc[:1]], metrics=metrics))
+    assert metrics.steps['Rating']['calls'] == 2
+    assert metrics.steps['Rating']['rows'] == 4
+
+def test_metrics_record_failed_step(raw_df):
+    raw_df.loc[0, 'Rating'] = 300.0
+    metrics = TransformMetrics()
+    with pytest.raises(TransformationError):
+        transform_data(raw_df, metrics=metrics)
+    assert metrics.steps['Rating']['calls'] == 1
+    assert 'Colors' not in metrics.steps
+    assert not tracemalloc.is_tracing()
+
+def test_metrics_arrow_engine_conversions(raw_df):
+    pytest.importorskip("pyarrow")
+    metrics = TransformMetrics(trace_memory=False)
+    transform_data(raw_df, engine='pyarrow', metrics=metrics)
+    assert list(metrics.steps) == ['from_pandas'] + COLUMNS + ['to_pandas']
+
+def test_emit_logs_and_appends_to_file(raw_df, tmp_path, caplog):
+    metrics = TransformMetrics()
+    transform_data(raw_df, metrics=metrics)
+    path = tmp_path / "metrics" / "transform.jsonl"
+
+    with caplog.at_level(logging.INFO):
+        metrics.emit(path=str(path))
+        metrics.emit(log=False, path=str(path))
+
+    assert sum("Transform step" in record.message for record in caplog.records) == len(COLUMNS)
+    lines = path.read_text().splitlines()
+    assert len(lines) == 2
+    record = json.loads(lines[0])
+    assert record['steps']['Price']['rows'] == 3
+    assert 'recorded_at' in record
+
+def test_streaming_pipeline_reports_metrics(raw_df):
+    metrics = TransformMetrics(trace_memory=False)
+    summary = run_streaming_pipeline([raw_df, raw_df], {'memory': lambda df, append: None}, metrics=metrics)
+    assert summary['transform']['steps']['Title']['calls'] == 2
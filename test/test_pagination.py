@@ -0,0 +1,62 @@
+import pytest
+from utils.pagination import PaginationPlanner, discover_pagination
+
+PAGINATION_HTML = b"""
+<ul class="pagination">
+    <li class="page-item current"><span class="page-link">Page 1 of 3</span></li>
+    <li class="page-item next"><a class="page-link" href="/page2">Next</a></li>
+</ul>
+"""
+
+LAST_PAGE_HTML = b"""
+<ul class="pagination">
+    <li class="page-item previous"><a class="page-link" href="/page2">Previous</a></li>
+    <li class="page-item current"><span class="page-link">Page 3 of 3</span></li>
+</ul>
+"""
+
+def test_discover_pagination():
+    assert discover_pagination(PAGINATION_HTML) == {'total_pages': 3, 'has_pagination': True, 'has_next': True}
+    assert discover_pagination(LAST_PAGE_HTML)['has_next'] is False
+    assert discover_pagination(b"<div>No pagination</div>") == {
+        'total_pages': None, 'has_pagination': False, 'has_next': False
+    }
+
+def test_planner_default_walks_all_pages():
+    planner = PaginationPlanner(max_pages=3)
+    assert planner.can_schedule(3)
+    assert not planner.can_schedule(4)
+    planner.observe(1, empty=True)
+    planner.observe(2, empty=True)
+    assert not planner.finished  # No empty-page limit by default
+
+def test_planner_waits_for_first_page_when_discovering():
+    planner = PaginationPlanner(max_pages=50, discover=True)
+    assert planner.can_schedule(1)
+    assert not planner.can_schedule(2)
+    planner.observe(1, content=PAGINATION_HTML)
+    assert planner.last_page == 3
+    assert planner.can_schedule(3)
+    assert not planner.can_schedule(4)
+
+def test_planner_stops_at_page_without_next_link():
+    planner = PaginationPlanner(max_pages=50, discover=True)
+    planner.observe(1, content=b'<a class="page-link" href="/page2">Next</a>')
+    planner.observe(2, content=b'<a class="page-link" href="/page1">Previous</a>')
+    assert planner.finished
+    assert planner.last_page == 2
+
+def test_planner_stops_after_consecutive_empty_pages():
+    planner = PaginationPlanner(max_pages=50, max_empty_pages=2)
+    planner.observe(1, empty=False)
+    planner.observe(2, empty=True)
+    planner.observe(3, empty=False)  # Resets the streak
+    planner.observe(4, empty=True)
+    assert not planner.finished
+    planner.observe(5, empty=True)
+    assert planner.finished
+    assert not planner.can_schedule(6)
+
+def test_planner_invalid_max_empty_pages():
+    with pytest.raises(ValueError, match="max_empty_pages must be a positive integer"):
+        PaginationPlanner(max_pages=5, max_empty_pages=0)
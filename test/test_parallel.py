@@ -0,0 +1,51 @@
+import pytest
+import pandas as pd
+from unittest.mock import patch
+from utils.parallel import transform_parallel
+from utils.transform import TransformationError, transform_data
+
+@pytest.mark.parametrize("start_method", ["fork", "spawn"])
+def test_parallel_matches_serial(start_method, raw_products):
+    df = raw_products(1000, seed=0, Url=[f"https://test.com/{i}" for i in range(1000)])
+    original = df.copy()
+
+    result = transform_parallel(df, workers=3, min_partition_rows=1, start_method=start_method)
+
+    pd.testing.assert_frame_equal(result, transform_data(df))
+    pd.testing.assert_frame_equal(df, original)
+
+@pytest.mark.parametrize("start_method", ["fork", "spawn"])
+def test_parallel_keeps_schema_typed_input(start_method, raw_products):
+    # Frames read back from save_to_parquet are already in the schema's dtypes
+    df = transform_data(raw_products(1000, seed=0))
+    df['Price'] = df['Price'].clip(lower=0)
+
+    result = transform_parallel(df, workers=3, min_partition_rows=1, start_method=start_method)
+
+    pd.testing.assert_frame_equal(result, transform_data(df))
+
+def test_parallel_merges_partition_categories(raw_products):
+    # Each partition sees a different subset of sizes
+    df = raw_products(6, seed=0)
+    df['Size'] = ['S', 'S', 'XL', None, 'M', 'M']
+    result = transform_parallel(df, workers=3, min_partition_rows=1)
+
+    assert result['Size'].tolist() == ['S', 'S', 'XL', 'Not Specified', 'M', 'M']
+    assert result['Size'].cat.categories.tolist() == ['M', 'S', 'XL', 'Not Specified']
+
+def test_parallel_small_frame_runs_in_process(raw_products):
+    df = raw_products(10, seed=0)
+    with patch('utils.parallel.transform_data', wraps=transform_data) as serial:
+        result = transform_parallel(df, workers=4)
+    serial.assert_called_once()
+    assert len(result) == 10
+
+def test_parallel_worker_error(raw_products):
+    df = raw_products(10, seed=0)
+    df.loc[7, 'Rating'] = float('inf')
+    with pytest.raises(TransformationError, match="non-finite"):
+        transform_parallel(df, workers=2, min_partition_rows=1)
+
+def test_parallel_invalid_input():
+    with pytest.raises(TransformationError, match="Missing required columns"):
+        transform_parallel(pd.DataFrame({'Title': ['Test']}), workers=2)
@@ -0,0 +1,149 @@
+import pytest
+from utils.parse import (
+    PARSER_BACKENDS, check_parser_backend, extract_card_fields, parse_card_fields,
+    parse_card_fields_vectorized, parse_cards
+)
+
+PAGE_HTML = """
+<html><head><meta charset="utf-8"><title>Shop</title></head>
+<body>
+<div class="collection-grid">
+    <div class="collection-card featured">
+        <img src="a.jpg" alt="A"><br/>
+        <h3 class="product-title">Test &amp; Product 👕</h3>
+        <span class="price"><b>$</b>100.50</span>
+        <div class="product-details">
+            <p>Rating: ⭐4.5/5</p>
+            <p>2 Colors</p>
+            <p>Size: M</p>
+            <p>Gender: Unisex</p>
+        </div>
+    </div>
+    <div class="collection-card">
+        <h3 class="product-title"></h3>
+        <span class="price">$100</span>
+    </div>
+    <div class="collection-card">
+        <h3 class="product-title">No Rating</h3>
+        <span class="price">$20</span>
+        <div class="product-details">
+            <p>Rating: Not Rated</p>
+            <p>5 Colors</p>
+            <p>Size: XL</p>
+            <p>Gender: Women</p>
+        </div>
+    </div>
+    <div class="collection-card">
+        <h3 class="product-title">Bad Price</h3>
+        <span class="price">Price Unavailable</span>
+        <div class="product-details"><p>Rating: ⭐3.0/5</p></div>
+    </div>
+    <div class="collection-card">
+        <h3 class="product-title">Short Details</h3>
+        <span class="price">$30</span>
+        <div class="product-details">
+            <p>Rating: ⭐3.0/5</p>
+            <p>1 Colors</p>
+        </div>
+    </div>
+</div>
+<p>Page 1 of 50</p>
+</body></html>
+"""
+
+def _available_backends():
+    backends = []
+    for backend in PARSER_BACKENDS:
+        try:
+            check_parser_backend(backend)
+        except ValueError:
+            continue
+        backends.append(backend)
+    return backends
+
+@pytest.mark.parametrize("backend", _available_backends())
+def test_backends_return_same_rows(backend):
+    expected = parse_cards(PAGE_HTML.encode(), backend='html.parser')
+    assert parse_cards(PAGE_HTML.encode(), backend=backend) == expected
+    assert [row['Title'] for row in expected] == ["Test & Product 👕", "No Rating"]
+    assert expected[0]['Price'] == 100.5
+    assert expected[1]['Rating'] is None
+
+@pytest.mark.parametrize("backend", _available_backends())
+def test_backends_return_same_fields(backend):
+    expected = extract_card_fields(PAGE_HTML.encode(), 'html.parser')
+    fields = extract_card_fields(PAGE_HTML.encode(), backend)
+    assert len(fields) == 5
+    # Compare stripped text; surrounding whitespace is normalised later anyway
+    normalise = lambda cards: [
+        (t and t.strip(), p and p.strip(), d and [x.strip() for x in d]) for t, p, d in cards
+    ]
+    assert normalise(fields) == normalise(expected)
+    assert fields[1][0] == ""  # Empty title element is present but blank
+    assert fields[1][2] is None  # Missing details block
+
+@pytest.mark.parametrize("backend", _available_backends())
+def test_backends_no_cards(backend):
+    assert parse_cards(b"<div>No products</div>", page=3, backend=backend) == []
+
+def test_parse_card_fields_errors():
+    with pytest.raises(ValueError, match="Product title not found"):
+        parse_card_fields(None, "$1", [])
+    with pytest.raises(ValueError, match="Price not found"):
+        parse_card_fields("Title", None, [])
+    with pytest.raises(ValueError, match="Product details not found"):
+        parse_card_fields("Title", "$1", None)
+    with pytest.raises(IndexError):
+        parse_card_fields("Title", "$1", ["Rating: ⭐4/5"])
+
+def test_check_parser_backend_unknown():
+    with pytest.raises(ValueError, match="Unknown parser backend: regex"):
+        check_parser_backend("regex")
+
+def test_vectorized_matches_per_card_parsing():
+    cards = [
+        ("  Shirt ", " $10.50 ", ["Rating: ⭐ 4.5 / 5", "3 Colors", "Size: M", "Gender: Men"]),
+        ("Pants", "$20", ["Rating: Not Rated", "1 Colors", "Size: XL", "Gender: Women"]),
+    ]
+    expected = [parse_card_fields(*card) for card in cards]
+    errors = {}
+    assert parse_card_fields_vectorized(cards, errors).rows() == expected
+    assert sum(errors.values()) == 0
+
+@pytest.mark.parametrize("odd_card", [
+    None,
+    ("Odd", "12", ["Rating: Not Rated", "1 Color", "Size : L", "Gender: Unisex"]),
+    ("Odd", "$12", ["Stars ⭐5/5", " 7  Colors", "Fit: L: tall", "Gender:Men "]),
+])
+def test_vectorized_shared_labels_match_per_card_parsing(odd_card):
+    # Well-formed columns are converted in one pass; a card with other
+    # labels sends its columns through per-value parsing
+    cards = [
+        (f"Shirt {i}", f"${i}.50", [f"Rating: ⭐ {i % 5}.5 / 5", f"{i} Colors", "Size: M", "Gender: Women"])
+        for i in range(1, 6)
+    ]
+    if odd_card is not None:
+        cards.insert(2, odd_card)
+    errors = {}
+    assert parse_card_fields_vectorized(cards, errors).rows() == [parse_card_fields(*card) for card in cards]
+    assert sum(errors.values()) == 0
+
+def test_vectorized_keeps_malformed_cards_as_nan():
+    cards = [
+        ("Bad Price", "$Unavailable", ["Rating: ⭐4/5", "2 Colors", "Size: S", "Gender: Men"]),
+        ("Bad Rating", "$5", ["Rating: ⭐ Invalid / 5", "many Colors", "Size: S"]),
+        (None, "$7", None),
+    ]
+    errors = {}
+    columns = parse_card_fields_vectorized(cards, errors)
+    assert len(columns) == 3
+    assert len(columns[1:]) == 2
+    rows = columns.rows()
+
+    assert rows[0]['Price'] != rows[0]['Price']  # NaN
+    assert rows[0]['Colors'] == 2
+    assert columns.columns['Rating'][1] != columns.columns['Rating'][1]
+    assert rows[1]['Colors'] is None
+    assert rows[1]['Gender'] is None
+    assert rows[2]['Title'] is None and rows[2]['Price'] == 7.0
+    assert errors == {'Title': 1, 'Price': 1, 'Rating': 2, 'Colors': 2, 'Size': 1, 'Gender': 2}
@@ -0,0 +1,109 @@
+import threading
+import pytest
+import pandas as pd
+from utils.pipeline import run_sinks, run_streaming_pipeline
+from utils.transform import TransformationError
+
+def test_streaming_pipeline_loads_each_batch(raw_products):
+    calls = []
+    sinks = {'memory': lambda df, append: calls.append((df['Title'].tolist(), append))}
+
+    summary = run_streaming_pipeline(iter([raw_products(Title=['A', 'B']), raw_products(Title=['C'])]), sinks)
+
+    assert calls == [(['A', 'B'], False), (['C'], True)]
+    assert summary['batches'] == 2
+    assert summary['rows'] == 3
+    assert summary['sinks']['memory'] == {'rows': 3, 'error': None}
+
+def test_streaming_pipeline_isolates_failed_sink(raw_products):
+    failing_calls = []
+
+    def failing_sink(df, append):
+        failing_calls.append(append)
+        raise RuntimeError("sink down")
+
+    loaded = []
+    sinks = {'failing': failing_sink, 'memory': lambda df, append: loaded.append(len(df))}
+
+    summary = run_streaming_pipeline([raw_products(Title=['A']), raw_products(Title=['B'])], sinks)
+
+    assert failing_calls == [False]  # Not retried on later batches
+    assert summary['sinks']['failing']['error'] == "sink down"
+    assert loaded == [1, 1]
+
+def test_streaming_pipeline_transforms_batches(raw_products):
+    loaded = []
+    batch = raw_products(Title=['A'])
+    batch.loc[0, 'Price'] = -10.0
+
+    run_streaming_pipeline([batch], {'memory': lambda df, append: loaded.append(df)})
+
+    assert loaded[0].loc[0, 'Price'] == 0
+    assert loaded[0]['Rating'].dtype == 'int8'
+
+def test_streaming_pipeline_invalid_batch():
+    with pytest.raises(TransformationError):
+        run_streaming_pipeline([pd.DataFrame()], {'memory': lambda df, append: None})
+
+def test_run_sinks_loads_concurrently(raw_products):
+    # Every sink waits for the others, so this only passes if they overlap
+    barrier = threading.Barrier(3, timeout=5)
+    loaded = []
+
+    def sink(df, append):
+        barrier.wait()
+        loaded.append((len(df), append))
+
+    results = run_sinks(raw_products(Title=['A', 'B']), {'csv': sink, 'db': sink, 'sheets': sink}, append=True)
+
+    assert loaded == [(2, True)] * 3
+    for result in results.values():
+        assert result['rows'] == 2
+        assert result['error'] is None
+        assert result['seconds'] >= 0
+
+def test_run_sinks_isolates_failures_and_timeouts(raw_products):
+    release = threading.Event()
+
+    def failing_sink(df, append):
+        raise RuntimeError("sink down")
+
+    def stuck_sink(df, append):
+        release.wait(5)
+
+    def mutating_sink(df, append):
+        df['Title'] = 'changed'
+
+    frame = raw_products(Title=['A'])
+    sinks = {'failing': failing_sink, 'stuck': stuck_sink, 'mutating': mutating_sink}
+    try:
+        results = run_sinks(frame, sinks, timeout={'stuck': 0.05})
+    finally:
+        release.set()
+
+    assert results['failing']['error'] == "sink down"
+    assert results['failing']['rows'] == 0
+    assert results['stuck']['error'] == "Timed out after 0.05s"
+    assert results['mutating']['error'] is None
+    # Sinks get their own view of the frame
+    assert frame['Title'].tolist() == ['A']
+
+def test_streaming_pipeline_skips_timed_out_sink(raw_products):
+    release = threading.Event()
+    calls = []
+
+    def slow_sink(df, append):
+        calls.append(append)
+        release.wait(5)
+
+    loaded = []
+    sinks = {'slow': slow_sink, 'memory': lambda df, append: loaded.append(len(df))}
+    try:
+        summary = run_streaming_pipeline([raw_products(Title=['A']), raw_products(Title=['B'])], sinks, timeout=0.05)
+    finally:
+        release.set()
+
+    assert calls == [False]
+    assert summary['sinks']['slow'] == {'rows': 0, 'error': "Timed out after 0.05s"}
+    assert summary['sinks']['memory'] == {'rows': 2, 'error': None}
+    assert loaded == [1, 1]
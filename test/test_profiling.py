@@ -0,0 +1,130 @@
+import pytest
+import numpy as np
+import pandas as pd
+from utils.pipeline import run_streaming_pipeline
+from utils.profiling import DataProfile, DistinctCounter, HeavyHitters, QuantileSketch
+from utils.transform import transform_data
+
+def test_quantile_sketch_is_accurate_and_bounded():
+    values = np.random.default_rng(0).lognormal(3, 1, 500_000)
+    sketch = QuantileSketch(seed=0)
+    for batch in np.array_split(values, 50):
+        sketch.update(batch)
+
+    assert sketch.count == len(values)
+    assert len(sketch) < 3 * sketch.k
+    estimates = sketch.quantiles((0, 0.1, 0.5, 0.9, 1))
+    assert estimates[0] == values.min()
+    assert estimates[1] == values.max()
+    for q in (0.1, 0.5, 0.9):
+        assert abs((values < estimates[q]).mean() - q) < 0.02
+
+def test_quantile_sketch_merge_matches_single_sketch():
+    values = np.random.default_rng(1).normal(size=200_000)
+    parts = [QuantileSketch(seed=seed) for seed in range(4)]
+    for part, chunk in zip(parts, np.array_split(values, 4)):
+        part.update(np.append(chunk, np.nan))
+    merged = parts[0]
+    for part in parts[1:]:
+        merged.merge(part)
+
+    assert merged.count == len(values)
+    assert abs((values < merged.quantiles([0.5])[0.5]).mean() - 0.5) < 0.02
+    with pytest.raises(ValueError):
+        merged.merge(QuantileSketch(k=100))
+
+def test_quantile_sketch_empty():
+    assert QuantileSketch().quantiles([0.5]) == {0.5: None}
+
+def test_distinct_counter_estimate_and_merge():
+    titles = pd.Series([f"Product {i}" for i in range(50_000)])
+    whole = DistinctCounter()
+    whole.update(titles)
+    assert abs(whole.estimate() - 50_000) / 50_000 < 0.03
+
+    # Overlapping halves merge to the same registers as one pass
+    left, right = DistinctCounter(), DistinctCounter()
+    left.update(titles[:30_000])
+    right.update(titles[20_000:])
+    left.merge(right)
+    assert np.array_equal(left.registers, whole.registers)
+
+    small = DistinctCounter()
+    small.update(pd.Series(['a', 'b', 'a', None, 'c']))
+    assert small.estimate() == 3
+
+def test_distinct_counter_hashes_categories_by_value():
+    plain, categorical = DistinctCounter(), DistinctCounter()
+    plain.update(pd.Series(['M', 'L', 'M']))
+    categorical.update(pd.Series(['M', 'L', 'M'], dtype='category'))
+    assert np.array_equal(plain.registers, categorical.registers)
+
+def test_heavy_hitters_exact_below_capacity():
+    summary = HeavyHitters(capacity=5)
+    summary.update(pd.Series(['M', 'L', 'M', None, 'S'], dtype='category'))
+    summary.update(pd.Series(['M', 'XL']))
+    assert summary.top(2) == [('M', 3, 0), ('L', 1, 0)]
+
+def test_heavy_hitters_bounds_over_capacity():
+    values = pd.Series(list('a' * 50 + 'b' * 30 + 'cdefghij' * 2))
+    left, right = HeavyHitters(capacity=3), HeavyHitters(capacity=3)
+    left.update(values[:40])
+    right.update(values[40:])
+    left.merge(right)
+
+    top = left.top()
+    assert len(top) == 3
+    assert [value for value, _, _ in top[:2]] == ['a', 'b']
+    for value, count, error in top:
+        true_count = int((values == value).sum())
+        assert count - error <= true_count <= count
+
+def test_profile_merges_across_workers_and_runs(tmp_path, raw_products):
+    batches = [transform_data(raw_products(2000, seed=seed)) for seed in range(4)]
+    whole = DataProfile()
+    for batch in batches:
+        whole.update(batch)
+
+    first, second = DataProfile(), DataProfile()
+    first.update(batches[0])
+    first.update(batches[1])
+    second.update(batches[2])
+    second.update(batches[3])
+    path = tmp_path / "profile.json"
+    first.save(str(path))
+    restored = DataProfile.load(str(path))
+    restored.merge(second)
+
+    report, expected = restored.report(), whole.report()
+    assert report['rows'] == 8000
+    assert report['columns']['Title']['distinct'] == expected['columns']['Title']['distinct']
+    assert report['columns']['Size'] == expected['columns']['Size']
+    assert report['columns']['Gender']['top'][0][0] == 'Men'
+    assert report['columns']['Price']['min'] == expected['columns']['Price']['min']
+    assert report['columns']['Rating']['quantiles'][0.5] in (3, 4)
+
+def test_profile_widens_float32_values(tmp_path, raw_products):
+    profile = DataProfile()
+    profile.update(transform_data(raw_products(Price=[102.15, 20.1, 7.3])))
+    path = tmp_path / "profile.json"
+    profile.save(str(path))
+
+    price = DataProfile.load(str(path)).report(quantiles=(0.5,))['columns']['Price']
+    assert (price['min'], price['max'], price['quantiles']) == (7.3, 102.15, {0.5: 20.1})
+
+def test_profile_errors(tmp_path):
+    with pytest.raises(ValueError, match="Missing profiled columns"):
+        DataProfile().update(pd.DataFrame({'Title': ['A']}))
+    with pytest.raises(ValueError):
+        DataProfile().merge(DataProfile(columns={'distinct': ('Title',)}))
+    path = tmp_path / "profile.json"
+    path.write_text('{"rows": 1}')
+    with pytest.raises(ValueError, match="Corrupt profile"):
+        DataProfile.load(str(path))
+
+def test_streaming_pipeline_profiles_loaded_batches(raw_products):
+    profile = DataProfile()
+    batches = [transform_data(raw_products(10, seed=0)), transform_data(raw_products(5, seed=1))]
+    summary = run_streaming_pipeline(batches, {'memory': lambda df, append: None}, profile=profile)
+    assert summary['profile']['rows'] == 15
+    assert sum(count for _, count, _ in summary['profile']['columns']['Gender']['top']) == 15
@@ -0,0 +1,56 @@
+import pytest
+import numpy as np
+import pandas as pd
+from sqlalchemy.types import DateTime, REAL, SmallInteger, Text
+from utils.schema import PRODUCT_SCHEMA, apply_schema, sheet_values, sql_dtypes
+from utils.transform import transform_data, validate_transformed_data
+
+def test_transform_output_matches_schema(raw_products):
+    transformed_df = transform_data(raw_products())
+    for column, dtype in PRODUCT_SCHEMA.items():
+        assert transformed_df[column].dtype == dtype, column
+    assert transformed_df['Timestamp'].cat.ordered
+
+def test_apply_schema_matches_transform(raw_products):
+    df = raw_products()
+    pd.testing.assert_frame_equal(apply_schema(df), transform_data(df))
+    assert df['Price'].dtype == np.float64  # Input left alone
+
+def test_apply_schema_rejects_out_of_range_rating(raw_products):
+    df = raw_products()
+    df['Rating'] = 1000.0
+    with pytest.raises(ValueError, match="Rating values out of range"):
+        apply_schema(df)
+
+def test_schema_shrinks_rows(raw_products):
+    df = raw_products(1000)
+    transformed_df = transform_data(df)
+    columns = ['Price', 'Rating', 'Colors', 'Size', 'Gender', 'Timestamp']
+    before = df[columns].memory_usage(index=False, deep=True).sum()
+    after = transformed_df[columns].memory_usage(index=False, deep=True).sum()
+    assert after * 4 < before
+
+def test_validate_transformed_data_with_schema(raw_products):
+    results = validate_transformed_data(transform_data(raw_products()))
+    assert results['extraction_time_range']['earliest'] == pd.Timestamp(2024, 3, 1, 12, 0, 0)
+    assert sorted(results['unique_values']['Size']) == ['M']
+
+@pytest.mark.parametrize("engine", ["pandas", "pyarrow"])
+def test_validate_transformed_data_widens_float32_prices(engine, raw_products):
+    pytest.importorskip("pyarrow")
+    transformed = transform_data(raw_products(Price=[102.15, 20.1, 7.3]), engine=engine)
+    results = validate_transformed_data(transformed, engine=engine)
+    assert results['price_range'] == {'min': 7.3, 'max': 102.15}
+
+def test_sql_dtypes(raw_products):
+    dtypes = sql_dtypes(raw_products().assign(Extra=1))
+    assert isinstance(dtypes['Price'], REAL)
+    assert isinstance(dtypes['Rating'], SmallInteger)
+    assert isinstance(dtypes['Colors'], SmallInteger)
+    assert isinstance(dtypes['Size'], Text)
+    assert isinstance(dtypes['Timestamp'], DateTime)
+    assert 'Extra' not in dtypes
+
+def test_sheet_values(raw_products):
+    values = sheet_values(transform_data(raw_products(Price=[10.5], Rating=[4.0], Gender=['Men'])))
+    assert values == [['Product 0', 10.5, 4, 2, 'M', 'Men', '2024-03-01 12:00:00']]
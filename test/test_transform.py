@@ -1,7 +1,7 @@
 import pytest
 import pandas as pd
 import numpy as np
-from utils.transform import transform_data, TransformationError, validate_transformed_data
+from utils.transform import transform_data, transform_chunks, TransformationError, validate_transformed_data
 from datetime import datetime
 
 @pytest.fixture
@@ -20,9 +20,12 @@ def test_transform_data(sample_raw_df):
     transformed_df = transform_data(sample_raw_df)
     
     # Test data type transformations
-    assert transformed_df['Price'].dtype == np.float64
-    assert transformed_df['Rating'].dtype == np.int64
-    assert transformed_df['Colors'].dtype == np.float64
+    assert transformed_df['Price'].dtype == np.float32
+    assert transformed_df['Rating'].dtype == np.int8
+    assert transformed_df['Colors'].dtype == 'Int8'
+    assert isinstance(transformed_df['Size'].dtype, pd.CategoricalDtype)
+    assert isinstance(transformed_df['Gender'].dtype, pd.CategoricalDtype)
+    assert transformed_df['Timestamp'].cat.categories.tolist() == [pd.Timestamp(2024, 3, 1, 12, 0, 0)]
     
     # Test data cleaning
     assert transformed_df['Title'].isnull().sum() == 0  # No null values in title
@@ -135,3 +138,73 @@ def test_validate_transformed_data_invalid_input():
     
 #     transformed_df = transform_data(timestamps_df)
 #     assert all(isinstance(ts, (datetime, pd.Timestamp)) for ts in transformed_df['Timestamp'])
+
+def test_transform_data_leaves_input_untouched(sample_raw_df):
+    sample_raw_df['Url'] = ['a', 'b', 'c']
+    original = sample_raw_df.copy()
+    transformed_df = transform_data(sample_raw_df)
+
+    pd.testing.assert_frame_equal(sample_raw_df, original)
+    assert transformed_df is not sample_raw_df
+    # Columns that need no cleaning are shared, not copied
+    assert np.shares_memory(transformed_df['Url'].to_numpy(), sample_raw_df['Url'].to_numpy())
+
+def test_transform_data_inplace(sample_raw_df):
+    expected = transform_data(sample_raw_df)
+    sample_raw_df['Price'] = sample_raw_df['Price'].astype(np.float32)
+    price_buffer = sample_raw_df['Price'].to_numpy()
+
+    transformed_df = transform_data(sample_raw_df, inplace=True)
+
+    assert transformed_df is sample_raw_df
+    pd.testing.assert_frame_equal(transformed_df, expected)
+    # Negative prices were clipped inside the existing buffer
+    assert price_buffer[1] == 0
+
+def test_transform_data_rounds_like_series_round(raw_products):
+    df = raw_products(Price=[1.0, np.nan, 3.0, 4.0], Rating=[0.5, 1.5, 2.5, None], Colors=[1, 2, 3, 4])
+    transformed_df = transform_data(df)
+
+    assert transformed_df['Rating'].tolist() == [0, 2, 2, 0]
+    assert pd.isna(transformed_df.loc[1, 'Price'])
+
+def test_transform_data_infinite_rating(raw_products):
+    df = raw_products(Rating=[float('inf')])
+    with pytest.raises(TransformationError, match="non-finite"):
+        transform_data(df)
+
+def test_transform_chunks_merges_stats(tmp_path, sample_raw_df):
+    path = tmp_path / "history.csv"
+    pd.concat([sample_raw_df] * 3, ignore_index=True).to_csv(path, index=False)
+
+    stats = {}
+    chunks = list(transform_chunks(pd.read_csv(path, chunksize=4), stats=stats, inplace=True))
+
+    assert [len(chunk) for chunk in chunks] == [4, 4, 1]
+    assert stats['chunks'] == 3
+    assert stats['rows'] == 9
+    assert stats['null_values_before']['Title'] == 3
+    assert stats['null_values_before']['Rating'] == 3
+    assert stats['null_values_after']['Title'] == 0
+    combined = pd.concat(chunks, ignore_index=True)
+    assert combined['Rating'].dtype == np.int8
+    assert (combined['Price'] >= 0).all()
+    assert combined['Gender'].tolist().count('Unisex') == 3
+
+def test_transform_chunks_is_lazy_and_skips_empty(sample_raw_df):
+    consumed = []
+
+    def source():
+        for chunk in (sample_raw_df, sample_raw_df.iloc[0:0], sample_raw_df):
+            consumed.append(len(chunk))
+            yield chunk
+
+    chunks = transform_chunks(source())
+    assert consumed == []
+    assert len(next(chunks)) == 3
+    assert consumed == [3]
+    assert len(list(chunks)) == 1
+
+def test_transform_chunks_reports_bad_chunk(sample_raw_df):
+    with pytest.raises(TransformationError, match="Failed to transform chunk 1: Missing required columns"):
+        list(transform_chunks([sample_raw_df, pd.DataFrame({'Title': ['Test']})]))
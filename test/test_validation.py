@@ -0,0 +1,74 @@
+import pytest
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from utils.transform import transform_data
+from utils.validation import PRODUCT_RULES, ValidationError, validate_data
+
+@pytest.fixture
+def dirty_df(raw_products):
+    return raw_products(
+        Title=['A', 'B', None, 'A'],
+        Price=[10.0, -5.0, np.nan, 3.0],
+        Rating=[4.5, None, 9.0, 1.0],
+        Colors=[2, 0, 3, 2],
+        Size=['M', 'XXXL', None, 'M'],
+        Gender=['Men', 'Women', 'Robot', 'Men']
+    )
+
+def test_validate_counts_failing_rows(dirty_df):
+    report = validate_data(dirty_df)
+    columns = report['columns']
+
+    assert report['rows'] == report['rows_checked'] == 4
+    assert columns['Title']['failures'] == {'not_null': 1}
+    assert columns['Price'] == {'min': -5.0, 'max': 10.0, 'nulls': 1, 'failures': {'min': 1}}
+    assert columns['Rating']['failures'] == {'min': 0, 'max': 1, 'not_null': 1}
+    assert columns['Size']['failures'] == {'allowed': 1, 'not_null': 1}
+    assert columns['Gender']['values'] == ['Men', 'Women', 'Robot']
+    assert report['unique'] == {'Title+Size+Gender+Colors': 1}
+    assert report['failed_rows'] == 3  # Row 0 is the only clean one
+
+def test_validate_categorical_columns_match_plain_ones(dirty_df):
+    plain = validate_data(dirty_df.assign(Title=dirty_df['Title'].fillna('C')))
+    categorical = validate_data(dirty_df.assign(
+        Title=dirty_df['Title'].fillna('C'),
+        Size=dirty_df['Size'].astype('category'),
+        Gender=dirty_df['Gender'].astype('category'),
+        Timestamp=pd.Categorical(dirty_df['Timestamp'], ordered=True)
+    ))
+
+    for column in ('Size', 'Gender', 'Timestamp'):
+        assert categorical['columns'][column]['failures'] == plain['columns'][column]['failures']
+        assert categorical['columns'][column]['nulls'] == plain['columns'][column]['nulls']
+    assert categorical['columns']['Timestamp']['min'] == datetime(2024, 3, 1, 12, 0, 0)
+    assert categorical['failed_rows'] == plain['failed_rows']
+
+def test_validate_transformed_frame_passes(dirty_df):
+    clean = dirty_df.iloc[[0, 3]].assign(Title=['A', 'D'], Gender=['Men', 'Women'])
+    report = validate_data(transform_data(clean), strict=True)
+    assert report['failed_rows'] == 0
+
+def test_validate_strict_raises(dirty_df):
+    with pytest.raises(ValidationError, match="3 rows failed validation"):
+        validate_data(dirty_df, strict=True)
+
+def test_validate_sampled(raw_products):
+    rows = 10_000
+    df = raw_products(rows, Price=np.where(np.arange(rows) % 10 == 0, -1.0, 5.0))
+    report = validate_data(df, sample=1000)
+
+    assert report['rows_checked'] == 1000
+    assert 50 < report['failed_rows'] < 150
+    assert 500 < report['estimated_failed_rows'] < 1500
+
+def test_validate_custom_rules_and_errors(dirty_df):
+    rules = {'columns': {'Title': {'unique': True}}}
+    assert validate_data(dirty_df, rules=rules)['columns']['Title']['failures'] == {'unique': 1}
+
+    with pytest.raises(ValueError, match="Unknown validation rules for Title"):
+        validate_data(dirty_df, rules={'columns': {'Title': {'regex': '.*'}}})
+    with pytest.raises(ValueError, match="Missing columns for validation rules"):
+        validate_data(dirty_df[['Title']], rules=PRODUCT_RULES)
+    with pytest.raises(ValueError, match="Input DataFrame is empty"):
+        validate_data(pd.DataFrame())
@@ -0,0 +1,203 @@
+import base64
+import gzip
+import json
+import logging
+import os
+import threading
+import time
+import zlib
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+class ArchiveError(Exception):
+    """Custom exception for response archive errors"""
+    pass
+
+def _archive_files(path):
+    # A directory holds one file per recorded run, read oldest first
+    if os.path.isdir(path):
+        return [
+            os.path.join(path, name) for name in sorted(os.listdir(path))
+            if name.endswith('.jsonl.gz')
+        ]
+    return [path]
+
+def _iter_file(path):
+    line_number = 0
+    try:
+        with gzip.open(path, 'rb') as f:
+            while True:
+                try:
+                    line = f.readline()
+                except (EOFError, zlib.error) as e:
+                    # An interrupted recording: keep its complete records
+                    logging.warning(f"Response archive {path} ends early after record {line_number}: {str(e)}")
+                    return
+                if not line:
+                    return
+                line_number += 1
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                    record['body'] = base64.b64decode(record['body'])
+                except (ValueError, KeyError, TypeError) as e:
+                    raise ArchiveError(f"Corrupt record {line_number} in {path}: {str(e)}")
+                yield record
+    except (OSError, EOFError, zlib.error) as e:
+        raise ArchiveError(f"Cannot read response archive {path}: {str(e)}")
+
+def iter_archive(path):
+    """
+    Read the records of a response archive in the order they were written
+
+    A run file cut short by an interrupted recording yields its complete
+    records, with a warning; the runs after it are unaffected.
+
+    Args:
+        path (str): Archive directory written by RecordingSession, or a
+            single archive file
+
+    Yields:
+        dict: 'url', 'status', 'headers', 'body' (bytes) and 'recorded_at'
+
+    Raises:
+        ArchiveError: If the archive cannot be read
+    """
+    for file_path in _archive_files(path):
+        yield from _iter_file(file_path)
+
+class RecordingSession:
+    """
+    Session wrapper that writes every raw response to a compressed archive
+
+    Each response (URL, status, headers and body) is written as one JSON line
+    to a new gzip file in the archive directory, one file per run, so a run
+    interrupted mid-write never damages the runs recorded before or after
+    it. Pass it as the session of extract_from_web or extract_batches, and
+    close it (or use it as a context manager) when done. Record without an
+    http_cache to capture full bodies: a 304 answer has none.
+
+    Args:
+        path (str): Archive directory, created if missing
+        session (requests.Session, optional): Session to fetch with. Falls
+            back to requests.get when omitted
+    """
+
+    def __init__(self, path, session=None):
+        if not path:
+            raise ValueError("Archive path is required")
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.session = session
+        self.recorded = 0
+        # Named by start time, so the directory lists runs in order
+        self.file_path = os.path.join(path, f"run-{time.time_ns()}.jsonl.gz")
+        self._file = gzip.open(self.file_path, 'xb')
+        self._lock = threading.Lock()
+
+    def get(self, url, **kwargs):
+        """
+        Fetch a URL and archive the response, whatever its status
+
+        Args:
+            url (str): URL to fetch
+            **kwargs: Passed on to the underlying get
+
+        Returns:
+            requests.Response: The response, unchanged
+        """
+        http_get = self.session.get if self.session is not None else requests.get
+        response = http_get(url, **kwargs)
+
+        record = {
+            'url': url,
+            'status': response.status_code,
+            'headers': dict(response.headers),
+            'body': base64.b64encode(response.content).decode('ascii'),
+            'recorded_at': time.time()
+        }
+        line = (json.dumps(record) + "\n").encode('utf-8')
+        with self._lock:
+            self._file.write(line)
+            self.recorded += 1
+        return response
+
+    def close(self):
+        """Finish the archive; the wrapped session is left open"""
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+        logging.info(f"Recorded {self.recorded} responses to {self.file_path}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+class ReplaySession:
+    """
+    Session that answers from a response archive without touching the network
+
+    The latest record of each URL, across every recorded run, is served back
+    as a requests.Response with its original status, headers and body. URLs
+    missing from the archive answer 404, exactly like a page the site does
+    not have.
+
+    Args:
+        path (str): Archive directory written by RecordingSession, or a
+            single archive file
+
+    Raises:
+        ArchiveError: If the archive cannot be read
+    """
+
+    def __init__(self, path):
+        if not os.path.exists(path):
+            raise ArchiveError(f"Response archive not found: {path}")
+        self.path = path
+        self.misses = 0
+        self._records = {}
+        for record in iter_archive(path):
+            self._records[record['url']] = record
+        logging.info(f"Replaying {len(self._records)} archived URLs from {path}")
+
+    def __len__(self):
+        return len(self._records)
+
+    def get(self, url, **kwargs):
+        """
+        Answer a URL from the archive
+
+        Args:
+            url (str): URL to look up
+            **kwargs: Accepted for compatibility with requests and ignored
+
+        Returns:
+            requests.Response: The archived response, or a 404 on a miss
+        """
+        record = self._records.get(url)
+        response = requests.Response()
+        response.url = url
+        if record is None:
+            self.misses += 1
+            response.status_code = 404
+            response.reason = "Not Archived"
+            response._content = b""
+            return response
+
+        response.status_code = record['status']
+        response.headers = CaseInsensitiveDict(record['headers'])
+        response._content = record['body']
+        return response
+
+    def close(self):
+        """Nothing to release; present for symmetry with requests.Session"""
+        pass
@@ -0,0 +1,271 @@
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+def _write_atomic(path, data):
+    # Write to a sibling temp file first so readers never see a partial file
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def _copy_rows(rows):
+    # Row dicts, or the columns and error counts of a page parsed in bulk
+    if isinstance(rows, dict):
+        return copy.deepcopy(rows)
+    return [dict(row) for row in rows]
+
+class HttpCache:
+    """
+    On-disk HTTP cache for conditional re-scrapes
+
+    For every URL whose response carried an ETag or Last-Modified header, the
+    validators, the raw body and the parsed card rows are kept under
+    cache_dir. The next fetch of that URL sends If-None-Match /
+    If-Modified-Since, and a 304 answer reuses the stored rows without
+    downloading or parsing the page again.
+    """
+
+    def __init__(self, cache_dir):
+        if not cache_dir:
+            raise ValueError("Cache directory is required")
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        base = os.path.join(self.cache_dir, key)
+        return f"{base}.json", f"{base}.body"
+
+    def _load_meta(self, url):
+        meta_path, _ = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable HTTP cache entry for {url}: {str(e)}")
+            return None
+        return meta if meta.get('url') == url else None
+
+    def conditional_headers(self, url):
+        """
+        Build the conditional request headers for a URL
+
+        Args:
+            url (str): Page URL
+
+        Returns:
+            dict: If-None-Match / If-Modified-Since headers, empty on a cache miss
+        """
+        meta = self._load_meta(url)
+        if meta is None:
+            return {}
+
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    def cached_rows(self, url, mode=None):
+        """
+        Return the parsed rows stored for a URL
+
+        Args:
+            url (str): Page URL
+            mode (str, optional): How the caller parses pages; rows stored
+                under another mode are not returned
+
+        Returns:
+            list: Stored row dicts (a dict of columns for a page parsed
+                in bulk), or None if the URL is not cached
+        """
+        meta = self._load_meta(url)
+        if meta is None or meta.get('mode') != mode:
+            return None
+        return meta.get('rows')
+
+    def cached_body(self, url):
+        """
+        Return the raw body stored for a URL
+
+        Args:
+            url (str): Page URL
+
+        Returns:
+            bytes: Stored response body, or None if the URL is not cached
+        """
+        _, body_path = self._paths(url)
+        try:
+            with open(body_path, 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def store(self, url, response, rows, mode=None):
+        """
+        Store a fresh response and its parsed rows
+
+        Responses without an ETag or Last-Modified header cannot be
+        revalidated and are not stored.
+
+        Args:
+            url (str): Page URL
+            response (requests.Response): The 200 response for the URL
+            rows (list): Parsed row dicts for the page, or a dict of
+                columns, without Timestamp
+            mode (str, optional): How the rows were parsed
+
+        Returns:
+            bool: True if the entry was stored
+        """
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return False
+
+        meta_path, body_path = self._paths(url)
+        meta = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'mode': mode,
+            'rows': rows
+        }
+        _write_atomic(body_path, response.content)
+        _write_atomic(meta_path, json.dumps(meta).encode('utf-8'))
+        return True
+
+class ParsedPageCache:
+    """
+    Persistent LRU cache of parsed card rows keyed by a hash of the page body
+
+    Helps on sites that send no validators but serve byte-identical pages
+    from run to run: a body seen before is never parsed again. Entries are
+    kept in least-recently-used order and the oldest are evicted beyond
+    max_entries. Hit/miss counters and the parse time saved by hits are
+    tracked for the current instance.
+    """
+
+    def __init__(self, path, max_entries=1000):
+        if not path:
+            raise ValueError("Cache path is required")
+        if not isinstance(max_entries, int) or max_entries <= 0:
+            raise ValueError("max_entries must be a positive integer")
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.parse_seconds_saved = 0.0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._load()
+
+    @staticmethod
+    def digest(content, mode=''):
+        """
+        Hash a response body into a cache key
+
+        Args:
+            content (bytes): Raw page body
+            mode (str): How the body is parsed, e.g. parser backend and
+                vectorized mode, which give differently shaped rows
+
+        Returns:
+            str: Hex SHA-256 digest of the mode and body
+        """
+        digest = hashlib.sha256(mode.encode('utf-8') + b'\0')
+        digest.update(content)
+        return digest.hexdigest()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)['entries']
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logging.warning(f"Ignoring unreadable parsed-page cache {self.path}: {str(e)}")
+            return
+        for digest, parse_seconds, rows in entries[-self.max_entries:]:
+            self._entries[digest] = (parse_seconds, rows)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, digest):
+        """
+        Look up the rows parsed from a body
+
+        Args:
+            digest (str): Key from ParsedPageCache.digest
+
+        Returns:
+            list: Copies of the stored row dicts (a dict of columns for a
+                page parsed in bulk), or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(digest)
+            self.hits += 1
+            self.parse_seconds_saved += entry[0]
+            return _copy_rows(entry[1])
+
+    def put(self, digest, rows, parse_seconds=0.0):
+        """
+        Store the rows parsed from a body, evicting the oldest entries
+
+        Args:
+            digest (str): Key from ParsedPageCache.digest
+            rows (list): Parsed row dicts, or a dict of columns, without
+                Timestamp
+            parse_seconds (float): Time it took to parse the body
+        """
+        with self._lock:
+            self._entries[digest] = (parse_seconds, _copy_rows(rows))
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def save(self):
+        """Write the cache to disk in least-recently-used order"""
+        with self._lock:
+            entries = [[digest, seconds, rows] for digest, (seconds, rows) in self._entries.items()]
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        _write_atomic(self.path, json.dumps({'entries': entries}).encode('utf-8'))
+
+    def stats(self):
+        """
+        Report cache effectiveness for this instance
+
+        Returns:
+            dict: hits, misses, evictions, entries and parse_seconds_saved
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'parse_seconds_saved': self.parse_seconds_saved
+            }
@@ -0,0 +1,159 @@
+import logging
+import os
+import numpy as np
+import pandas as pd
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+# What makes two rows the same product: its name and attributes, not the
+# price or rating it happened to show on a given day
+DEFAULT_PRODUCT_KEY = ('Title', 'Size', 'Gender', 'Colors')
+
+def product_keys(df, key=DEFAULT_PRODUCT_KEY):
+    """
+    Hash the key columns of every row into one 64-bit product key
+
+    Args:
+        df (pd.DataFrame): Transformed product rows
+        key (tuple): Columns that identify a product
+
+    Returns:
+        np.ndarray: uint64 key per row
+
+    Raises:
+        ValueError: If a key column is missing
+    """
+    missing_columns = [col for col in key if col not in df.columns]
+    if missing_columns:
+        raise ValueError(f"Missing product key columns: {missing_columns}")
+    # Categories hash by value, so batches with different category sets agree
+    return pd.util.hash_pandas_object(df[list(key)], index=False).to_numpy()
+
+class ProductKeyIndex:
+    """
+    Persistent set of product keys loaded in earlier runs
+
+    Keys live in a Python set, so each lookup is O(1), and are stored on
+    disk as a uint64 .npy array.
+    """
+
+    def __init__(self, path):
+        if not path:
+            raise ValueError("Index path is required")
+        self.path = path
+        self._keys = set()
+        self._load()
+
+    def _load(self):
+        try:
+            keys = np.load(self.path, allow_pickle=False)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable product key index {self.path}: {str(e)}")
+            return
+        self._keys = set(keys.astype(np.uint64).tolist())
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, key):
+        return int(key) in self._keys
+
+    def contains(self, keys):
+        """
+        Look up many keys at once
+
+        Args:
+            keys (np.ndarray): uint64 product keys
+
+        Returns:
+            np.ndarray: Boolean mask, True where the key is already indexed
+        """
+        known = self._keys
+        return np.fromiter((key in known for key in keys.tolist()), dtype=bool, count=len(keys))
+
+    def add(self, keys):
+        """
+        Add keys to the index
+
+        Args:
+            keys (np.ndarray): uint64 product keys
+        """
+        self._keys.update(keys.tolist())
+
+    def save(self):
+        """Write the index to disk, replacing the previous file atomically"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            np.save(f, np.fromiter(self._keys, dtype=np.uint64, count=len(self._keys)))
+        os.replace(tmp_path, self.path)
+
+class Deduplicator:
+    """
+    Drop repeated products between transform and load
+
+    A row is dropped when its product key was already seen in this run
+    (within the same batch or an earlier one) or, with an index, in an
+    earlier run. Keys of rows that pass are remembered for the rest of the
+    run; they only reach the index on save(), which should be called once
+    the rows have been loaded so a failed load is retried next run.
+
+    Args:
+        key (tuple): Columns that identify a product
+        index (ProductKeyIndex, optional): Keys from earlier runs
+    """
+
+    def __init__(self, key=DEFAULT_PRODUCT_KEY, index=None):
+        if not key:
+            raise ValueError("Product key needs at least one column")
+        self.key = tuple(key)
+        self.index = index
+        self.stats = {'rows_in': 0, 'duplicates_in_run': 0, 'seen_before': 0, 'rows_out': 0}
+        self._run_keys = set()
+
+    def __call__(self, df):
+        """
+        Keep only the rows of new products
+
+        Args:
+            df (pd.DataFrame): Transformed batch
+
+        Returns:
+            pd.DataFrame: Rows whose product key is new, possibly empty
+        """
+        keys = product_keys(df, self.key)
+        keep = ~pd.Series(keys).duplicated().to_numpy()
+        run_keys = self._run_keys
+        keep &= np.fromiter((key not in run_keys for key in keys.tolist()), dtype=bool, count=len(keys))
+        duplicates_in_run = len(keys) - int(keep.sum())
+
+        seen_before = 0
+        if self.index is not None:
+            known = self.index.contains(keys) & keep
+            seen_before = int(known.sum())
+            keep &= ~known
+
+        run_keys.update(keys.tolist())
+        self.stats['rows_in'] += len(df)
+        self.stats['duplicates_in_run'] += duplicates_in_run
+        self.stats['seen_before'] += seen_before
+        self.stats['rows_out'] += int(keep.sum())
+        if keep.all():
+            return df
+        return df[keep]
+
+    def save(self):
+        """Add this run's keys to the index and write it to disk"""
+        if self.index is None:
+            return
+        self.index.add(np.fromiter(self._run_keys, dtype=np.uint64, count=len(self._run_keys)))
+        self.index.save()
+        logging.info(f"Product key index now holds {len(self.index)} keys: {self.stats}")
@@ -1,8 +1,19 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 import pandas as pd
+import numpy as np
+from array import array
+from math import nan as NAN
 from datetime import datetime
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from functools import partial
 import logging
+import time
+from utils.parse import CardColumns, parse_cards, check_parser_backend
+from utils.pagination import PaginationPlanner
+from utils.fetch import FetchPolicy, PageFetcher
 
 # Configure logging
 logging.basicConfig(
@@ -14,7 +25,414 @@ class ExtractionError(Exception):
     """Custom exception for extraction errors"""
     pass
 
-def extract_from_web(base_url, max_pages=50, max_items=1000):
+class _ColumnBuffer:
+    """
+    Typed per-column accumulator for extracted product rows
+    
+    Price and Rating go into float arrays (missing ratings become NaN),
+    Colors into an int array and Size/Gender into small integer codes over
+    the few distinct values they take. Pages parsed in bulk are added
+    column by column, without building a dict per product. The DataFrame
+    is built from these buffers directly, with Timestamp broadcast from a
+    single value.
+    """
+    
+    def __init__(self):
+        self.titles = []
+        self.prices = array('d')
+        self.ratings = array('d')
+        self.colors = array('q')
+        self.missing_colors = []
+        self.size_codes = array('i')
+        self.gender_codes = array('i')
+        self.sizes = {}
+        self.genders = {}
+    
+    def __len__(self):
+        return len(self.titles)
+    
+    @staticmethod
+    def _code(categories, value):
+        code = categories.get(value)
+        if code is None:
+            code = categories[value] = len(categories)
+        return code
+    
+    def _codes(self, categories, values):
+        # New values get codes in order of first appearance, as with _code
+        for value in dict.fromkeys(values):
+            if value not in categories:
+                categories[value] = len(categories)
+        return map(categories.__getitem__, values)
+    
+    def extend_columns(self, columns):
+        # NaN marks missing numbers; the typed arrays take the lists as-is
+        start = len(self.colors)
+        try:
+            self.colors.extend(columns["Colors"])
+        except TypeError:
+            # A NaN among the counts; array.extend keeps what it took
+            del self.colors[start:]
+            for colors in columns["Colors"]:
+                if colors != colors:
+                    self.missing_colors.append(len(self.colors))
+                    colors = 0
+                self.colors.append(int(colors))
+        self.titles.extend(columns["Title"])
+        self.prices.extend(columns["Price"])
+        self.ratings.extend(columns["Rating"])
+        self.size_codes.extend(self._codes(self.sizes, columns["Size"]))
+        self.gender_codes.extend(self._codes(self.genders, columns["Gender"]))
+    
+    def extend(self, rows):
+        if isinstance(rows, CardColumns):
+            self.extend_columns(rows.columns)
+            return
+        for row in rows:
+            rating = row["Rating"]
+            self.titles.append(row["Title"])
+            self.prices.append(row["Price"])
+            self.ratings.append(NAN if rating is None else rating)
+            colors = row["Colors"]
+            if colors is None:
+                self.missing_colors.append(len(self.colors))
+                colors = 0
+            self.colors.append(colors)
+            self.size_codes.append(self._code(self.sizes, row["Size"]))
+            self.gender_codes.append(self._code(self.genders, row["Gender"]))
+    
+    @staticmethod
+    def _decode(codes, categories):
+        # Every row points at one shared string object per distinct value
+        values = np.empty(len(categories), dtype=object)
+        values[:] = list(categories)
+        return values[np.frombuffer(codes, dtype=np.intc)]
+    
+    def to_frame(self, timestamp):
+        colors = np.array(self.colors, dtype=np.int64)
+        if self.missing_colors:
+            # Same float fallback pandas infers for ints mixed with None
+            colors = colors.astype(np.float64)
+            colors[self.missing_colors] = np.nan
+        
+        df = pd.DataFrame({
+            "Title": self.titles,
+            "Price": np.array(self.prices, dtype=np.float64),
+            "Rating": np.array(self.ratings, dtype=np.float64),
+            "Colors": colors,
+            "Size": self._decode(self.size_codes, self.sizes),
+            "Gender": self._decode(self.gender_codes, self.genders)
+        })
+        df["Timestamp"] = timestamp
+        return df
+
+def create_session(pool_size=10):
+    """
+    Create a keep-alive HTTP session with a sized connection pool
+    
+    Args:
+        pool_size (int): Maximum number of pooled connections per host
+        
+    Returns:
+        requests.Session: Session that reuses connections across requests
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+def _page_url(base_url, page):
+    # Page 1 lives at the base URL, the rest at /page<N>
+    if page == 1:
+        return base_url
+    return f"{base_url}/page{page}"
+
+def _iter_responses(base_url, planner, fetch, workers=1):
+    """
+    Fetch pages and yield them in page order
+    
+    Pages are scheduled while the planner allows it, and the consumer is
+    expected to report each yielded page back to the planner before asking
+    for the next one. With more than one worker, up to ``2 * workers`` pages
+    are queued on a thread pool ahead of the consumer. Closing the generator
+    cancels every fetch that has not started yet.
+    
+    Args:
+        planner (utils.pagination.PaginationPlanner): Decides which pages exist
+        fetch (callable): Called with a page URL, returns the checked response,
+            e.g. a utils.fetch.PageFetcher
+    
+    Yields:
+        tuple: (page, response, error) where exactly one of response/error is set
+    """
+    if workers == 1:
+        page = 1
+        while planner.can_schedule(page):
+            url = _page_url(base_url, page)
+            logging.info(f"Scraping page {page}: {url}")
+            try:
+                yield page, fetch(url), None
+            except requests.RequestException as e:
+                yield page, None, e
+            page += 1
+        return
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    pending = deque()
+    next_page = 1
+
+    try:
+        while True:
+            # Top up the queue with every page the planner allows by now
+            while len(pending) < 2 * workers and planner.can_schedule(next_page):
+                url = _page_url(base_url, next_page)
+                logging.info(f"Scraping page {next_page}: {url}")
+                pending.append((next_page, executor.submit(fetch, url)))
+                next_page += 1
+
+            if not pending:
+                return
+
+            page, future = pending.popleft()
+            try:
+                yield page, future.result(), None
+            except requests.RequestException as e:
+                yield page, None, e
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+def _is_not_found(error):
+    response = getattr(error, 'response', None)
+    return response is not None and response.status_code == 404
+
+def _cacheable(rows):
+    # Caches hold the columns of a page parsed in bulk, and its error
+    # counts, as a plain dict
+    if isinstance(rows, CardColumns):
+        return {'columns': rows.columns, 'errors': rows.errors}
+    return rows
+
+def _from_cache(rows):
+    return CardColumns(rows['columns'], rows['errors']) if isinstance(rows, dict) else rows
+
+def _parse_page(content, page, parse, parse_cache=None, mode=''):
+    if parse_cache is None:
+        return parse(content, page)
+
+    # Identical bodies parse to identical rows in the same mode, so look
+    # them up by hash
+    digest = parse_cache.digest(content, mode)
+    rows = parse_cache.get(digest)
+    if rows is None:
+        start = time.perf_counter()
+        rows = parse(content, page)
+        parse_cache.put(digest, _cacheable(rows), time.perf_counter() - start)
+    return _from_cache(rows)
+
+def _response_content(url, response, http_cache=None):
+    # A 304 has no body of its own; the cached copy stands in for it
+    if http_cache is not None and response.status_code == 304:
+        return http_cache.cached_body(url) or b""
+    return response.content
+
+def _page_rows(url, page, response, parse, http_cache=None, parse_cache=None, mode=''):
+    # A 304 means the cached copy is still current, so skip parsing entirely
+    # unless the rows were parsed in another mode
+    if http_cache is not None and response.status_code == 304:
+        rows = http_cache.cached_rows(url, mode)
+        if rows is not None:
+            logging.info(f"Page {page} not modified, reusing cached rows")
+            return _from_cache(rows)
+        return _parse_page(_response_content(url, response, http_cache), page, parse, parse_cache, mode)
+
+    rows = _parse_page(response.content, page, parse, parse_cache, mode)
+    if http_cache is not None:
+        http_cache.store(url, response, _cacheable(rows), mode)
+    return rows
+
+def _iter_page_rows(base_url, max_pages, max_items, workers=1, session=None, parser='html.parser',
+                    http_cache=None, parse_cache=None, discover_pages=False, max_empty_pages=None,
+                    fetch_policy=None, vectorized_parse=False, parse_errors=None):
+    """
+    Scrape pages in order and yield the product rows of each page
+    
+    Stops once max_items rows have been yielded or the pagination planner
+    has seen the last page, which closes the fetch generator and cancels any
+    outstanding page fetches. Pages retried by the deferred retry pass are
+    yielded after all other pages.
+    
+    Yields:
+        tuple: (page, rows) for every page that produced at least one row.
+            Rows are dicts without the Timestamp column
+        
+    Raises:
+        ExtractionError: If no data was extracted from any page
+        ValueError: If input parameters are invalid
+    """
+    # Validate input parameters
+    if not isinstance(base_url, str) or not base_url.startswith('http'):
+        raise ValueError("Invalid base URL provided")
+    if not isinstance(max_pages, int) or max_pages <= 0:
+        raise ValueError("max_pages must be a positive integer")
+    if not isinstance(max_items, int) or max_items <= 0:
+        raise ValueError("max_items must be a positive integer")
+    if not isinstance(workers, int) or workers <= 0:
+        raise ValueError("workers must be a positive integer")
+    check_parser_backend(parser)
+    planner = PaginationPlanner(max_pages, discover=discover_pages, max_empty_pages=max_empty_pages)
+
+    if fetch_policy is None:
+        fetch_policy = FetchPolicy()
+    parse = partial(parse_cards, backend=parser, vectorized=vectorized_parse)
+    # Cached rows are only reused by runs parsing the same way
+    parse_mode = f"{parser}/{'vectorized' if vectorized_parse else 'per-card'}"
+
+    total_items = 0
+    failed_pages = []
+    not_found_pages = set()
+
+    def rows_for(page, response, error):
+        # Rows of a fetched page, or None when the fetch failed
+        if error is not None:
+            logging.error(f"Failed to fetch page {page}: {str(error)}")
+            failed_pages.append(page)
+            if _is_not_found(error):
+                not_found_pages.add(page)
+            return None
+        rows = _page_rows(_page_url(base_url, page), page, response, parse, http_cache, parse_cache, parse_mode)
+        # Counted per page, so pages served from a cache count too
+        if parse_errors is not None and isinstance(rows, CardColumns):
+            for field, count in rows.errors.items():
+                parse_errors[field] = parse_errors.get(field, 0) + count
+        return rows
+
+    def take(rows):
+        nonlocal total_items
+        rows = rows[:max_items - total_items]
+        total_items += len(rows)
+        return rows
+
+    # Share one pooled session between fetch workers
+    owns_session = session is None and workers > 1
+    if owns_session:
+        session = create_session(pool_size=workers)
+    fetcher = PageFetcher(session=session, http_cache=http_cache, policy=fetch_policy)
+
+    try:
+        responses = _iter_responses(base_url, planner, fetcher, workers=workers)
+        with closing(responses):
+            for page, response, error in responses:
+                rows = rows_for(page, response, error)
+                if rows is None:
+                    planner.observe(page, empty=page in not_found_pages)
+                else:
+                    url = _page_url(base_url, page)
+                    content = _response_content(url, response, http_cache) if discover_pages else None
+                    planner.observe(page, content=content, empty=not rows)
+
+                if rows:
+                    yield page, take(rows)
+
+                if total_items >= max_items:
+                    logging.info(f"Reached maximum items limit: {max_items}")
+                    return
+                if planner.finished:
+                    break
+
+        # Deferred retry pass over pages that failed for transient reasons
+        retry_pages = [page for page in failed_pages if page not in not_found_pages]
+        if fetch_policy.deferred_retry and retry_pages:
+            logging.info(f"Retrying failed pages: {retry_pages}")
+            failed_pages[:] = [page for page in failed_pages if page in not_found_pages]
+            for page in retry_pages:
+                try:
+                    response, error = fetcher(_page_url(base_url, page)), None
+                except requests.RequestException as e:
+                    response, error = None, e
+
+                rows = rows_for(page, response, error)
+                if rows:
+                    yield page, take(rows)
+
+                if total_items >= max_items:
+                    logging.info(f"Reached maximum items limit: {max_items}")
+                    return
+    finally:
+        fetcher.close()
+        if parse_errors:
+            logging.info(f"Card field parse errors: {parse_errors}")
+        if owns_session:
+            session.close()
+        if parse_cache is not None:
+            parse_cache.save()
+            stats = parse_cache.stats()
+            logging.info(
+                f"Parsed-page cache: {stats['hits']} hits, {stats['misses']} misses, "
+                f"{stats['parse_seconds_saved']:.3f}s parse time saved"
+            )
+
+    if not total_items:
+        raise ExtractionError("No data was extracted from any page")
+
+    if failed_pages:
+        logging.warning(f"Failed to extract from pages: {failed_pages}")
+
+def extract_batches(base_url, max_pages=50, max_items=1000, workers=1, session=None, parser='html.parser',
+                    http_cache=None, parse_cache=None, discover_pages=False, max_empty_pages=None,
+                    fetch_policy=None, vectorized_parse=False):
+    """
+    Extract data from web one page at a time
+    
+    Streaming counterpart of extract_from_web: each page is yielded as soon
+    as it is parsed, so downstream stages can start before the crawl ends.
+    
+    Args:
+        base_url (str): The base URL to scrape
+        max_pages (int): Maximum number of pages to scrape
+        max_items (int): Maximum number of items to collect across all batches
+        workers (int): Number of pages fetched concurrently
+        session (requests.Session, optional): Session to fetch with
+        parser (str): Card parser backend, one of utils.parse.PARSER_BACKENDS
+        http_cache (utils.cache.HttpCache, optional): Cache for conditional
+            requests; unchanged pages reuse their cached rows
+        parse_cache (utils.cache.ParsedPageCache, optional): Rows keyed by a
+            hash of the page body and the parse mode; identical pages are
+            not parsed again
+        discover_pages (bool): Read the real page count from page 1 and stop
+            at the last page instead of walking up to max_pages
+        max_empty_pages (int, optional): Stop after this many consecutive
+            pages without products
+        fetch_policy (utils.fetch.FetchPolicy, optional): Timeouts, retries
+            with backoff, the deferred retry pass and hedged requests
+        vectorized_parse (bool): Parse card fields in bulk per page; malformed
+            values become NaN instead of dropping the card
+        
+    Yields:
+        pd.DataFrame: Extracted rows of one page
+        
+    Raises:
+        ExtractionError: If there are critical errors during extraction
+    """
+    try:
+        extraction_time = datetime.now()
+        for _, rows in _iter_page_rows(
+            base_url, max_pages, max_items, workers=workers, session=session, parser=parser,
+            http_cache=http_cache, parse_cache=parse_cache, discover_pages=discover_pages,
+            max_empty_pages=max_empty_pages, fetch_policy=fetch_policy,
+            vectorized_parse=vectorized_parse
+        ):
+            buffer = _ColumnBuffer()
+            buffer.extend(rows)
+            yield buffer.to_frame(extraction_time)
+
+    except Exception as e:
+        logging.error(f"Critical error during extraction: {str(e)}")
+        raise ExtractionError(f"Extraction failed: {str(e)}")
+
+def extract_from_web(base_url, max_pages=50, max_items=1000, workers=1, session=None, parser='html.parser',
+                     http_cache=None, parse_cache=None, discover_pages=False, max_empty_pages=None,
+                     fetch_policy=None, vectorized_parse=False):
     """
     Extract data from web with error handling
     
@@ -22,6 +440,36 @@ def extract_from_web(base_url, max_pages=50, max_items=1000):
         base_url (str): The base URL to scrape
         max_pages (int): Maximum number of pages to scrape
         max_items (int): Maximum number of items to collect
+        workers (int): Number of pages fetched concurrently. Values above 1
+            fetch through a pooled keep-alive session; rows still come back
+            in page order
+        session (requests.Session, optional): Session to fetch with. When
+            omitted, a pooled session is created for concurrent fetching
+        parser (str): Card parser backend, one of utils.parse.PARSER_BACKENDS.
+            All backends return the same rows
+        http_cache (utils.cache.HttpCache, optional): Cache for conditional
+            requests; pages answered with 304 Not Modified reuse their
+            cached rows without being downloaded or parsed again, if they
+            were parsed with the same parser and vectorized_parse
+        parse_cache (utils.cache.ParsedPageCache, optional): Persistent cache
+            of parsed rows keyed by a hash of the page body, the parser and
+            vectorized_parse; a page whose bytes were seen before skips
+            parsing entirely
+        discover_pages (bool): Fetch page 1 first and use its "Page X of N"
+            label or next link to schedule only pages that exist
+        max_empty_pages (int, optional): Stop after this many consecutive
+            pages without products (404 pages count as empty)
+        fetch_policy (utils.fetch.FetchPolicy, optional): Connect/read
+            timeouts, retries with exponential backoff and jitter, a deferred
+            retry pass over failed pages and hedged requests for pages
+            slower than the run's p95 latency. Defaults to a single attempt
+            with a 30s timeout
+        vectorized_parse (bool): Collect the raw text of every card first and
+            parse the fields of a page a column at a time, straight into
+            the column buffer, which takes less CPU per card than the
+            default per-card parsing. Malformed values become NaN instead
+            of dropping the card; per-field error counts are logged and
+            stored in ``df.attrs['parse_errors']``
         
     Returns:
         pd.DataFrame: Extracted data
@@ -31,94 +479,22 @@ def extract_from_web(base_url, max_pages=50, max_items=1000):
         ValueError: If input parameters are invalid
     """
     try:
-        # Validate input parameters
-        if not isinstance(base_url, str) or not base_url.startswith('http'):
-            raise ValueError("Invalid base URL provided")
-        if not isinstance(max_pages, int) or max_pages <= 0:
-            raise ValueError("max_pages must be a positive integer")
-        if not isinstance(max_items, int) or max_items <= 0:
-            raise ValueError("max_items must be a positive integer")
-
-        all_data = []
+        # Accumulate typed columns instead of one dict per product
+        buffer = _ColumnBuffer()
         extraction_time = datetime.now()
-        failed_pages = []
-
-        for page in range(1, max_pages + 1):
-            try:
-                # Adjust URL for page 1
-                if page == 1:
-                    url = base_url
-                else:
-                    url = f"{base_url}/page{page}"
-
-                logging.info(f"Scraping page {page}: {url}")
-                
-                # Add timeout to prevent hanging
-                response = requests.get(url, timeout=30)
-                response.raise_for_status()  # Raise an exception for bad status codes
-
-                soup = BeautifulSoup(response.content, "html.parser")
-                cards = soup.find_all("div", class_="collection-card")
-
-                if not cards:
-                    logging.warning(f"No product cards found on page {page}")
-                    continue
-
-                for card in cards:
-                    try:
-                        title = card.find("h3", class_="product-title")
-                        if not title:
-                            raise ValueError("Product title not found")
-                        title = title.text.strip()
-
-                        price = card.find("span", class_="price")
-                        if not price:
-                            raise ValueError("Price not found")
-                        price_text = price.text.strip().replace("$", "")
-                        price_usd = float(price_text)
-
-                        details = card.find("div", class_="product-details")
-                        if not details:
-                            raise ValueError("Product details not found")
-                        details = details.find_all("p")
-
-                        rating_text = details[0].text.strip()
-                        rating = float(rating_text.split("⭐")[1].split("/")[0].strip()) if "⭐" in rating_text else None
-
-                        colors = int(details[1].text.strip().split()[0])
-                        size = details[2].text.strip().split(":")[1].strip()
-                        gender = details[3].text.strip().split(":")[1].strip()
-
-                        all_data.append({
-                            "Title": title,
-                            "Price": price_usd,
-                            "Rating": rating,
-                            "Colors": colors,
-                            "Size": size,
-                            "Gender": gender,
-                            "Timestamp": extraction_time
-                        })
-
-                        if len(all_data) >= max_items:
-                            logging.info(f"Reached maximum items limit: {max_items}")
-                            return pd.DataFrame(all_data)
-
-                    except (ValueError, IndexError) as e:
-                        logging.error(f"Error processing product card: {str(e)}")
-                        continue
-
-            except requests.RequestException as e:
-                logging.error(f"Failed to fetch page {page}: {str(e)}")
-                failed_pages.append(page)
-                continue
-
-        if not all_data:
-            raise ExtractionError("No data was extracted from any page")
-
-        if failed_pages:
-            logging.warning(f"Failed to extract from pages: {failed_pages}")
+        parse_errors = {}
+        for _, rows in _iter_page_rows(
+            base_url, max_pages, max_items, workers=workers, session=session, parser=parser,
+            http_cache=http_cache, parse_cache=parse_cache, discover_pages=discover_pages,
+            max_empty_pages=max_empty_pages, fetch_policy=fetch_policy,
+            vectorized_parse=vectorized_parse, parse_errors=parse_errors
+        ):
+            buffer.extend(rows)
 
-        return pd.DataFrame(all_data)
+        df = buffer.to_frame(extraction_time)
+        if vectorized_parse:
+            df.attrs['parse_errors'] = parse_errors
+        return df
 
     except Exception as e:
         logging.error(f"Critical error during extraction: {str(e)}")
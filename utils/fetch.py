@@ -0,0 +1,182 @@
+import logging
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import requests
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+# Status codes worth retrying; other HTTP errors will not change on retry
+RETRYABLE_STATUS_CODES = frozenset([429, 500, 502, 503, 504])
+
+class FetchPolicy:
+    """
+    How pages are fetched: timeouts, retries and hedging
+
+    Args:
+        timeout (float or tuple): Seconds to wait, or a (connect, read) pair
+        retries (int): Extra attempts after a transient failure
+        backoff (float): Base delay in seconds for exponential backoff. Each
+            retry sleeps a random time up to backoff * 2**attempt (full jitter)
+        max_backoff (float): Upper bound for a single backoff delay
+        deferred_retry (bool): Retry pages that still failed once more after
+            the rest of the crawl has finished
+        hedge (bool): Send a duplicate request when a page is slower than
+            the p95 latency seen so far in the run, and use whichever
+            answers first
+        hedge_min_samples (int): Latencies to observe before hedging starts
+    """
+
+    def __init__(self, timeout=30, retries=0, backoff=0.5, max_backoff=10.0, deferred_retry=False,
+                 hedge=False, hedge_min_samples=20):
+        if isinstance(timeout, tuple):
+            if len(timeout) != 2 or any(not isinstance(t, (int, float)) or t <= 0 for t in timeout):
+                raise ValueError("timeout must be a positive number or a (connect, read) pair")
+        elif not isinstance(timeout, (int, float)) or timeout <= 0:
+            raise ValueError("timeout must be a positive number or a (connect, read) pair")
+        if not isinstance(retries, int) or retries < 0:
+            raise ValueError("retries must be a non-negative integer")
+        if backoff < 0 or max_backoff < 0:
+            raise ValueError("backoff delays must not be negative")
+        if not isinstance(hedge_min_samples, int) or hedge_min_samples <= 0:
+            raise ValueError("hedge_min_samples must be a positive integer")
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.deferred_retry = deferred_retry
+        self.hedge = hedge
+        self.hedge_min_samples = hedge_min_samples
+
+def _is_retryable(error):
+    if isinstance(error, requests.HTTPError):
+        response = getattr(error, 'response', None)
+        return response is not None and response.status_code in RETRYABLE_STATUS_CODES
+    return isinstance(error, requests.RequestException)
+
+class PageFetcher:
+    """
+    Fetch pages according to a FetchPolicy
+
+    One fetcher lives for one crawl: it keeps the latencies seen so far in
+    the run, which drive the hedging threshold. Safe to call from several
+    threads at once.
+
+    Args:
+        session (requests.Session, optional): Session to fetch with. Falls
+            back to requests.get when omitted
+        http_cache (utils.cache.HttpCache, optional): Source of conditional
+            request headers
+        policy (FetchPolicy, optional): Timeouts, retries and hedging
+        sleep (callable): Used for backoff delays; replaceable in tests
+    """
+
+    def __init__(self, session=None, http_cache=None, policy=None, sleep=time.sleep):
+        self.session = session
+        self.http_cache = http_cache
+        self.policy = policy or FetchPolicy()
+        self.sleep = sleep
+        self.hedged = 0
+        self._latencies = deque(maxlen=1000)
+        self._lock = threading.Lock()
+        self._hedge_executor = None
+
+    def latency_quantile(self, q):
+        """
+        Return a quantile of the latencies observed so far
+
+        Args:
+            q (float): Quantile between 0 and 1
+
+        Returns:
+            float: Latency in seconds, or None before any request finished
+        """
+        with self._lock:
+            latencies = sorted(self._latencies)
+        if not latencies:
+            return None
+        return latencies[min(len(latencies) - 1, int(q * len(latencies)))]
+
+    def _get(self, url):
+        # Fall back to a bare requests.get when no session is shared
+        http_get = self.session.get if self.session is not None else requests.get
+
+        start = time.perf_counter()
+        if self.http_cache is not None:
+            response = http_get(url, timeout=self.policy.timeout, headers=self.http_cache.conditional_headers(url))
+        else:
+            response = http_get(url, timeout=self.policy.timeout)
+        response.raise_for_status()  # Raise an exception for bad status codes
+
+        with self._lock:
+            self._latencies.append(time.perf_counter() - start)
+        return response
+
+    def _hedge_threshold(self):
+        with self._lock:
+            if len(self._latencies) < self.policy.hedge_min_samples:
+                return None
+        return self.latency_quantile(0.95)
+
+    def _hedged_get(self, url):
+        threshold = self._hedge_threshold()
+        if threshold is None:
+            return self._get(url)
+
+        with self._lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(thread_name_prefix="hedge")
+        primary = self._hedge_executor.submit(self._get, url)
+        done, _ = wait([primary], timeout=threshold)
+        if done:
+            return primary.result()
+
+        # Slower than p95 so far: race a duplicate against the original
+        logging.info(f"Hedging slow request for {url} after {threshold:.2f}s")
+        with self._lock:
+            self.hedged += 1
+        futures = [primary, self._hedge_executor.submit(self._get, url)]
+        while futures:
+            done, futures = wait(futures, return_when=FIRST_COMPLETED)
+            futures = list(futures)
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+        return primary.result()  # Both failed; surface the original error
+
+    def __call__(self, url):
+        """
+        Fetch a page, retrying transient failures with backoff
+
+        Args:
+            url (str): Page URL
+
+        Returns:
+            requests.Response: The checked response
+
+        Raises:
+            requests.RequestException: If the last attempt failed
+        """
+        get = self._hedged_get if self.policy.hedge else self._get
+        attempt = 0
+        while True:
+            try:
+                return get(url)
+            except requests.RequestException as e:
+                if attempt >= self.policy.retries or not _is_retryable(e):
+                    raise
+                delay = random.uniform(0, min(self.policy.max_backoff, self.policy.backoff * 2 ** attempt))
+                logging.warning(f"Retrying {url} in {delay:.2f}s after error: {str(e)}")
+                self.sleep(delay)
+                attempt += 1
+
+    def close(self):
+        """Release the hedging threads without waiting for losing requests"""
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,108 @@
+import json
+import logging
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+class TransformMetrics:
+    """
+    Wall time, rows and peak allocated bytes per named transform step
+
+    Pass one to transform_data, transform_chunks or run_streaming_pipeline;
+    it accumulates over every call it is given to, so a run's totals can be
+    read from as_dict() or logged and written with emit(). Without one, the
+    transform functions skip all of this.
+
+    Peak bytes are the tracemalloc high-water mark above the step's start,
+    which covers NumPy buffers and Python objects but not Arrow's memory
+    pool. Tracing slows the traced step down, so with trace_memory the
+    timings run high; turn it off to time steps alone. A step that finds
+    tracemalloc already running uses it and resets its peak.
+
+    Args:
+        trace_memory (bool): Measure peak allocated bytes with tracemalloc
+    """
+
+    def __init__(self, trace_memory=True):
+        self.trace_memory = trace_memory
+        self.steps = {}
+
+    @contextmanager
+    def step(self, name, rows):
+        """
+        Time the enclosed block as one call of a named step
+
+        Args:
+            name (str): Step name, e.g. the column it cleans
+            rows (int): Rows the step processes
+        """
+        started_tracing = False
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracing = True
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            peak = None
+            if self.trace_memory:
+                peak = tracemalloc.get_traced_memory()[1] - baseline
+                if started_tracing:
+                    tracemalloc.stop()
+
+            stats = self.steps.setdefault(name, {'calls': 0, 'rows': 0, 'seconds': 0.0, 'peak_bytes': None})
+            stats['calls'] += 1
+            stats['rows'] += rows
+            stats['seconds'] += seconds
+            if peak is not None:
+                stats['peak_bytes'] = max(stats['peak_bytes'] or 0, peak)
+
+    def as_dict(self):
+        """
+        Return the metrics recorded so far
+
+        Returns:
+            dict: 'seconds' (total over all steps) and 'steps', mapping each
+                step name to its 'calls', 'rows', 'seconds' and 'peak_bytes'
+                (largest over its calls, None without trace_memory)
+        """
+        return {
+            'seconds': sum(stats['seconds'] for stats in self.steps.values()),
+            'steps': {name: dict(stats) for name, stats in self.steps.items()}
+        }
+
+    def emit(self, log=True, path=None):
+        """
+        Report the metrics recorded so far
+
+        Args:
+            log (bool): Log one line per step
+            path (str, optional): Also append them as one JSON line, with a
+                'recorded_at' epoch time, to this metrics file
+        """
+        metrics = self.as_dict()
+        if log:
+            for name, stats in metrics['steps'].items():
+                peak = stats['peak_bytes']
+                peak = f", peak {peak / 2**20:.2f} MiB" if peak is not None else ""
+                logging.info(
+                    f"Transform step {name}: {stats['calls']} calls, {stats['rows']} rows, "
+                    f"{stats['seconds'] * 1000:.1f} ms{peak}"
+                )
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({'recorded_at': time.time(), **metrics}) + "\n")
@@ -0,0 +1,96 @@
+import logging
+import re
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+_PAGE_OF_RE = re.compile(rb'Page\s+\d+\s+of\s+(\d+)', re.IGNORECASE)
+_PAGINATION_RE = re.compile(rb'class=["\'][^"\']*\bpagination\b|href=["\'][^"\']*/page\d+["\']', re.IGNORECASE)
+_NEXT_LINK_RE = re.compile(rb'rel=["\']next["\']|class=["\'][^"\']*\bnext\b|>\s*Next\s*<', re.IGNORECASE)
+
+def discover_pagination(content):
+    """
+    Read what a page says about the catalog's pagination
+
+    Args:
+        content (bytes): Raw HTML of the page
+
+    Returns:
+        dict: 'total_pages' from a "Page X of N" label (None if absent),
+            'has_pagination' if the page carries pagination links and
+            'has_next' if one of them points to a next page
+    """
+    match = _PAGE_OF_RE.search(content)
+    return {
+        'total_pages': int(match.group(1)) if match else None,
+        'has_pagination': _PAGINATION_RE.search(content) is not None,
+        'has_next': _NEXT_LINK_RE.search(content) is not None
+    }
+
+class PaginationPlanner:
+    """
+    Decide which pages of a catalog are worth fetching
+
+    By default every page up to max_pages is scheduled, which is the blind
+    walk extract_from_web has always done. With discover enabled, page 1 is
+    fetched on its own first and its "Page X of N" label caps the crawl;
+    any page that shows pagination links but no next link ends it. With
+    max_empty_pages set, the crawl stops after that many consecutive pages
+    without products (a 404 counts as empty).
+    """
+
+    def __init__(self, max_pages, discover=False, max_empty_pages=None):
+        if max_empty_pages is not None and (not isinstance(max_empty_pages, int) or max_empty_pages <= 0):
+            raise ValueError("max_empty_pages must be a positive integer")
+        self.max_pages = max_pages
+        self.discover = discover
+        self.max_empty_pages = max_empty_pages
+        self.last_page = max_pages
+        self.finished = False
+        self.empty_streak = 0
+        self._first_page_seen = False
+
+    def can_schedule(self, page):
+        """
+        Check whether a page may be fetched now
+
+        Args:
+            page (int): Page number
+
+        Returns:
+            bool: False when the page is past the known end of the catalog,
+                or while discovery is still waiting for page 1
+        """
+        if self.finished or page > self.last_page:
+            return False
+        return page == 1 or not self.discover or self._first_page_seen
+
+    def observe(self, page, content=None, empty=False):
+        """
+        Record the outcome of a page, in page order
+
+        Args:
+            page (int): Page number
+            content (bytes, optional): Page body, None if the fetch failed
+            empty (bool): True if the page produced no products
+        """
+        if page == 1:
+            self._first_page_seen = True
+
+        if self.discover and content:
+            pagination = discover_pagination(content)
+            if page == 1 and pagination['total_pages']:
+                self.last_page = min(self.last_page, pagination['total_pages'])
+                logging.info(f"Catalog reports {pagination['total_pages']} pages")
+            if pagination['has_pagination'] and not pagination['has_next']:
+                self.last_page = min(self.last_page, page)
+
+        self.empty_streak = self.empty_streak + 1 if empty else 0
+        if self.max_empty_pages is not None and self.empty_streak >= self.max_empty_pages:
+            logging.info(f"Stopping after {self.empty_streak} consecutive empty pages")
+            self.finished = True
+        elif page >= self.last_page:
+            self.finished = True
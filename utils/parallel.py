@@ -0,0 +1,255 @@
+import logging
+import multiprocessing
+import os
+from multiprocessing import shared_memory
+import numpy as np
+import pandas as pd
+from utils.transform import (
+    REQUIRED_COLUMNS, TransformationError, _TRANSFORM_STEPS, _check_input, _count_nulls, _float_values,
+    transform_data
+)
+from utils.schema import PRODUCT_SCHEMA, timestamp_categories
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+# Below this many rows per worker, process start-up costs more than it saves
+MIN_PARTITION_ROWS = 100_000
+
+# Numeric columns can travel through shared memory; object columns cannot.
+# Categorical columns map to the value their missing entries are filled with
+_NUMERIC_COLUMNS = ('Price', 'Rating', 'Colors')
+_OBJECT_COLUMNS = ('Title', 'Size', 'Gender', 'Timestamp')
+_CATEGORY_DEFAULTS = {'Size': 'Not Specified', 'Gender': 'Unisex', 'Timestamp': None}
+
+# Frame inherited by forked workers, so object columns are never pickled
+_FORK_SOURCE = {}
+
+class _SharedBuffers:
+    """
+    Named shared-memory arrays, one block per column buffer
+
+    The parent creates and finally unlinks the blocks; workers attach to
+    them by name and write their row range in place.
+    """
+
+    def __init__(self):
+        self.specs = {}
+        self._blocks = []
+
+    def create(self, name, dtype, length, source=None):
+        dtype = np.dtype(dtype)
+        block = shared_memory.SharedMemory(create=True, size=max(1, dtype.itemsize * length))
+        self._blocks.append(block)
+        self.specs[name] = (block.name, dtype.str, length)
+        if source is not None:
+            np.ndarray(length, dtype=dtype, buffer=block.buf)[:] = source
+
+    def view(self, name):
+        # Views must be dropped before close(); copy anything that outlives it
+        _, dtype, length = self.specs[name]
+        block = self._blocks[list(self.specs).index(name)]
+        return np.ndarray(length, dtype=dtype, buffer=block.buf)
+
+    def copy_out(self, name):
+        return self.view(name).copy()
+
+    def close(self):
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+def _attach(specs):
+    blocks = []
+    arrays = {}
+    for name, (block_name, dtype, length) in specs.items():
+        block = shared_memory.SharedMemory(name=block_name)
+        blocks.append(block)
+        arrays[name] = np.ndarray(length, dtype=dtype, buffer=block.buf)
+    return blocks, arrays
+
+def _run_partition(arrays, columns, start, stop):
+    nulls_before = {}
+    nulls_after = {}
+    categories = {}
+
+    for column in _NUMERIC_COLUMNS:
+        source = columns[column] if column in columns else pd.Series(arrays[f"in_{column}"][start:stop])
+        values, nulls_before[column], nulls_after[column] = _TRANSFORM_STEPS[column](source, False)
+        if values is None:
+            # The column already matches the schema; copy it through as is
+            values = source.array if column == 'Colors' else source.to_numpy()
+        if column == 'Colors':
+            arrays['Colors'][start:stop] = values.to_numpy(dtype=np.int8, na_value=0)
+            arrays['Colors_mask'][start:stop] = values.isna()
+        else:
+            arrays[column][start:stop] = values
+
+    missing = columns['Title'].isna().to_numpy()
+    arrays['Title_missing'][start:stop] = missing
+    nulls_before['Title'], nulls_after['Title'] = int(missing.sum()), 0
+
+    for column in _CATEGORY_DEFAULTS:
+        series = columns[column]
+        if column == 'Timestamp':
+            encoded = timestamp_categories(series)
+        elif isinstance(series.dtype, pd.CategoricalDtype):
+            encoded = series.array
+        else:
+            encoded = pd.Categorical(series)
+        arrays[f"{column}_codes"][start:stop] = encoded.codes
+        categories[column] = encoded.categories
+        nulls_before[column] = int((encoded.codes == -1).sum())
+        nulls_after[column] = nulls_before[column] if column == 'Timestamp' else 0
+
+    return {'nulls_before': nulls_before, 'nulls_after': nulls_after, 'categories': categories}
+
+def _transform_partition(task):
+    # Runs in a worker. Forked workers read every input column from the
+    # frame they inherited; spawned ones get numeric inputs from shared
+    # memory and the object columns with the task. Results always go to
+    # shared memory
+    start, stop, specs, objects = task
+    if objects is None:
+        frame = _FORK_SOURCE['frame']
+        columns = {column: frame[column].iloc[start:stop] for column in _NUMERIC_COLUMNS + _OBJECT_COLUMNS}
+    else:
+        columns = objects
+    blocks, arrays = _attach(specs)
+    try:
+        return _run_partition(arrays, columns, start, stop)
+    finally:
+        arrays.clear()
+        for block in blocks:
+            try:
+                block.close()
+            except BufferError:
+                pass  # A traceback still holds a view; released at exit
+
+def _merge_codes(buffers, column, bounds, results, default):
+    # Union the sorted partition categories and remap each partition's codes.
+    # Partitions of a categorical input all share its categories; keep their
+    # order, as transform_data does
+    parts = [result['categories'][column] for result in results]
+    if all(part.equals(parts[0]) for part in parts[1:]):
+        categories = parts[0]
+    else:
+        categories = parts[0].append(parts[1:]).unique().sort_values()
+    if default is not None and any(result['nulls_before'][column] for result in results):
+        if default not in categories:
+            categories = categories.append(pd.Index([default]))
+    fill_code = categories.get_loc(default) if default in categories else -1
+
+    codes = np.empty(bounds[-1], dtype=np.int32)
+    part_codes = buffers.view(f"{column}_codes")
+    for (start, stop), part in zip(zip(bounds[:-1], bounds[1:]), parts):
+        remap = np.append(categories.get_indexer(part), fill_code).astype(np.int32)
+        codes[start:stop] = remap[part_codes[start:stop]]  # Code -1 picks the trailing fill code
+    del part_codes
+    return pd.Categorical.from_codes(codes, categories=categories, ordered=column == 'Timestamp')
+
+def transform_parallel(df, workers=None, min_partition_rows=MIN_PARTITION_ROWS, start_method=None):
+    """
+    Transform a large frame in row partitions across a process pool
+
+    Produces the same frame as transform_data. Results travel through
+    shared-memory column buffers: every worker writes its row range of the
+    final buffers in place, so partial frames are never pickled or
+    concatenated, and category codes from each partition are remapped onto
+    the union of the partitions' categories. With the 'fork' start method,
+    workers read their input rows from the memory they inherit, so nothing
+    is copied in; otherwise numeric inputs go through shared memory too and
+    only the object columns (Title, Size, Gender, Timestamp) are pickled.
+
+    Args:
+        df (pd.DataFrame): Input DataFrame to transform
+        workers (int, optional): Worker processes, os.cpu_count() by default
+        min_partition_rows (int): Smallest partition worth a worker; frames
+            too small to split are transformed in-process
+        start_method (str, optional): multiprocessing start method, 'fork'
+            where available and 'spawn' otherwise
+
+    Returns:
+        pd.DataFrame: Transformed DataFrame; the input is not modified
+
+    Raises:
+        TransformationError: If there are critical errors during transformation
+    """
+    try:
+        _check_input(df)
+        workers = workers or os.cpu_count() or 1
+        partitions = min(workers, len(df) // max(1, min_partition_rows))
+        if partitions <= 1:
+            return transform_data(df)
+
+        if start_method is None:
+            start_method = 'fork' if 'fork' in multiprocessing.get_all_start_methods() else 'spawn'
+        context = multiprocessing.get_context(start_method)
+        bounds = np.linspace(0, len(df), partitions + 1, dtype=np.int64).tolist()
+
+        buffers = _SharedBuffers()
+        try:
+            rows = len(df)
+            if start_method != 'fork':
+                for column in _NUMERIC_COLUMNS:
+                    values = df[column].to_numpy()
+                    if values.dtype.kind not in 'iuf':
+                        values = _float_values(df[column])
+                    buffers.create(f"in_{column}", values.dtype, rows, source=values)
+            buffers.create('Price', PRODUCT_SCHEMA['Price'], rows)
+            buffers.create('Rating', PRODUCT_SCHEMA['Rating'], rows)
+            buffers.create('Colors', np.int8, rows)
+            buffers.create('Colors_mask', np.bool_, rows)
+            buffers.create('Title_missing', np.bool_, rows)
+            for column in _CATEGORY_DEFAULTS:
+                buffers.create(f"{column}_codes", np.int32, rows)
+
+            tasks = []
+            for start, stop in zip(bounds[:-1], bounds[1:]):
+                objects = None
+                if start_method != 'fork':
+                    objects = {column: df[column].iloc[start:stop] for column in _OBJECT_COLUMNS}
+                tasks.append((start, stop, buffers.specs, objects))
+
+            _FORK_SOURCE['frame'] = df
+            try:
+                with context.Pool(processes=partitions) as pool:
+                    results = pool.map(_transform_partition, tasks)
+            finally:
+                _FORK_SOURCE.clear()
+
+            df_transformed = df.copy(deep=False)
+            df_transformed['Price'] = buffers.copy_out('Price')
+            df_transformed['Rating'] = buffers.copy_out('Rating')
+            df_transformed['Colors'] = pd.arrays.IntegerArray(buffers.copy_out('Colors'), buffers.copy_out('Colors_mask'))
+            title_missing = buffers.copy_out('Title_missing')
+            if title_missing.any():
+                titles = df['Title'].to_numpy(dtype=object, copy=True)
+                titles[title_missing] = 'Unknown Product'
+                df_transformed['Title'] = titles
+            for column, default in _CATEGORY_DEFAULTS.items():
+                df_transformed[column] = _merge_codes(buffers, column, bounds, results, default)
+        finally:
+            buffers.close()
+
+        null_counts_before = {column: 0 for column in df.columns}
+        null_counts_after = dict(null_counts_before)
+        for result in results:
+            for column in REQUIRED_COLUMNS:
+                null_counts_before[column] += result['nulls_before'][column]
+                null_counts_after[column] += result['nulls_after'][column]
+        for column in df.columns:
+            if column not in REQUIRED_COLUMNS:
+                _, null_counts_before[column], null_counts_after[column] = _count_nulls(df[column], False)
+
+        if any(null_counts_before.values()):
+            logging.info(f"Null values handled: Before={null_counts_before}, After={null_counts_after}")
+        return df_transformed
+
+    except Exception as e:
+        logging.error(f"Error during parallel data transformation: {str(e)}")
+        raise TransformationError(f"Failed to transform data: {str(e)}")
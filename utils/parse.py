@@ -0,0 +1,430 @@
+import importlib.util
+import logging
+from html.parser import HTMLParser
+from math import nan as NAN
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as SelectolaxParser
+except ImportError:  # Optional fast backend
+    try:
+        from selectolax.parser import HTMLParser as SelectolaxParser
+    except ImportError:
+        SelectolaxParser = None
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+PARSER_BACKENDS = ('html.parser', 'lxml', 'strainer', 'stream', 'selectolax')
+
+PRODUCT_FIELDS = ('Title', 'Price', 'Rating', 'Colors', 'Size', 'Gender')
+
+# Elements that never have an end tag
+_VOID_ELEMENTS = frozenset([
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+    'link', 'meta', 'param', 'source', 'track', 'wbr'
+])
+
+def check_parser_backend(backend):
+    """
+    Check that a parser backend is known and its dependency is installed
+
+    Args:
+        backend (str): One of PARSER_BACKENDS
+
+    Raises:
+        ValueError: If the backend is unknown or cannot be used
+    """
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown parser backend: {backend}")
+    if backend == 'lxml' and importlib.util.find_spec('lxml') is None:
+        raise ValueError("The 'lxml' parser backend requires the lxml package")
+    if backend == 'selectolax' and SelectolaxParser is None:
+        raise ValueError("The 'selectolax' parser backend requires the selectolax package")
+
+def _has_card_class(value):
+    # The strainer sees the raw attribute string, before it is split into classes
+    return value is not None and 'collection-card' in value.split()
+
+def _soup_card_fields(soup):
+    fields = []
+    for card in soup.find_all("div", class_="collection-card"):
+        title = card.find("h3", class_="product-title")
+        price = card.find("span", class_="price")
+        details = card.find("div", class_="product-details")
+        fields.append((
+            title.text if title is not None else None,
+            price.text if price is not None else None,
+            [p.text for p in details.find_all("p")] if details is not None else None
+        ))
+    return fields
+
+def _selectolax_card_fields(content):
+    fields = []
+    for card in SelectolaxParser(content).css("div.collection-card"):
+        title = card.css_first("h3.product-title")
+        price = card.css_first("span.price")
+        details = card.css_first("div.product-details")
+        fields.append((
+            title.text() if title is not None else None,
+            price.text() if price is not None else None,
+            [p.text() for p in details.css("p")] if details is not None else None
+        ))
+    return fields
+
+class _Capture:
+    """Text collected for one element while it is open"""
+
+    def __init__(self, level):
+        self.level = level
+        self.parts = []
+
+    def text(self):
+        return ''.join(self.parts)
+
+class _CardStreamParser(HTMLParser):
+    """
+    Event-driven card extractor that never builds a document tree
+
+    Only the text of the first title, price and details elements of each
+    collection card is kept, so memory and CPU stay proportional to the
+    card content rather than to the whole page.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.cards = []
+        self._stack = []
+        self._card = None
+        self._captures = []
+
+    def _open(self, name, level):
+        capture = _Capture(level)
+        self._captures.append(capture)
+        if name == 'p':
+            self._card['details_p'].append(capture)
+        else:
+            self._card[name] = capture
+
+    def handle_startendtag(self, tag, attrs):
+        # Self-closing tags never open a capture or a nesting level
+        pass
+
+    def handle_starttag(self, tag, attrs):
+        classes = (dict(attrs).get('class') or '').split()
+        level = len(self._stack)
+
+        if self._card is None:
+            if tag == 'div' and 'collection-card' in classes:
+                self._card = {'level': level, 'title': None, 'price': None, 'details': None, 'details_p': []}
+        else:
+            card = self._card
+            if tag == 'h3' and 'product-title' in classes and card['title'] is None:
+                self._open('title', level)
+            elif tag == 'span' and 'price' in classes and card['price'] is None:
+                self._open('price', level)
+            elif tag == 'div' and 'product-details' in classes and card['details'] is None:
+                self._open('details', level)
+            elif tag == 'p' and card['details'] is not None and card['details'] in self._captures:
+                self._open('p', level)
+
+        if tag not in _VOID_ELEMENTS:
+            self._stack.append(tag)
+
+    def handle_endtag(self, tag):
+        if tag not in self._stack:
+            return
+        while self._stack:
+            if self._stack.pop() == tag:
+                break
+        self._close_to(len(self._stack))
+
+    def handle_data(self, data):
+        for capture in self._captures:
+            capture.parts.append(data)
+
+    def _close_to(self, level):
+        self._captures = [capture for capture in self._captures if capture.level < level]
+        if self._card is not None and self._card['level'] >= level:
+            self._finish_card()
+
+    def _finish_card(self):
+        card = self._card
+        title = card['title'].text() if card['title'] is not None else None
+        price = card['price'].text() if card['price'] is not None else None
+        details = None
+        if card['details'] is not None:
+            details = [p.text() for p in card['details_p']]
+        self.cards.append((title, price, details))
+        self._card = None
+        self._captures = []
+
+    def close(self):
+        super().close()
+        self._close_to(0)
+
+def extract_card_fields(content, backend='html.parser'):
+    """
+    Pull the raw text fields of every product card out of a page
+
+    Args:
+        content (bytes): Raw HTML of the page
+        backend (str): One of PARSER_BACKENDS. 'html.parser' and 'lxml' build
+            a full BeautifulSoup tree, 'strainer' only builds the
+            collection-card subtrees, 'stream' is a tree-less event parser
+            and 'selectolax' uses the selectolax C parser
+
+    Returns:
+        list: (title, price, details) tuples, one per card. Title and price
+            are raw element text, details is the list of paragraph texts.
+            Missing elements are None
+    """
+    if backend == 'html.parser':
+        return _soup_card_fields(BeautifulSoup(content, "html.parser"))
+    if backend == 'lxml':
+        return _soup_card_fields(BeautifulSoup(content, "lxml"))
+    if backend == 'strainer':
+        strainer = SoupStrainer("div", class_=_has_card_class)
+        return _soup_card_fields(BeautifulSoup(content, "html.parser", parse_only=strainer))
+    if backend == 'selectolax':
+        return _selectolax_card_fields(content)
+    if backend == 'stream':
+        parser = _CardStreamParser()
+        if isinstance(content, bytes):
+            content = content.decode('utf-8', errors='replace')
+        parser.feed(content)
+        parser.close()
+        return parser.cards
+    raise ValueError(f"Unknown parser backend: {backend}")
+
+def parse_card_fields(title, price, details):
+    """
+    Convert the raw text fields of one card into a product row
+
+    Args:
+        title (str): Raw title text, or None if missing
+        price (str): Raw price text, or None if missing
+        details (list): Raw paragraph texts of the details block, or None
+
+    Returns:
+        dict: Product row without the Timestamp column
+
+    Raises:
+        ValueError: If a field is missing or malformed
+        IndexError: If the details block has too few entries
+    """
+    if title is None:
+        raise ValueError("Product title not found")
+    title = title.strip()
+
+    if price is None:
+        raise ValueError("Price not found")
+    price_text = price.strip().replace("$", "")
+    price_usd = float(price_text)
+
+    if details is None:
+        raise ValueError("Product details not found")
+
+    rating_text = details[0].strip()
+    rating = float(rating_text.split("⭐")[1].split("/")[0].strip()) if "⭐" in rating_text else None
+
+    colors = int(details[1].strip().split()[0])
+    size = details[2].strip().split(":")[1].strip()
+    gender = details[3].strip().split(":")[1].strip()
+
+    return {
+        "Title": title,
+        "Price": price_usd,
+        "Rating": rating,
+        "Colors": colors,
+        "Size": size,
+        "Gender": gender
+    }
+
+class CardColumns:
+    """
+    Product columns of a page of cards, as parsed in bulk
+
+    Stands in for the list of row dicts of the per-card parser: it has a
+    length and slices by row, and _ColumnBuffer takes its columns as they
+    are. Price, Rating and Colors are numbers with NaN where the value is
+    missing or malformed (or the product unrated); Title, Size and Gender
+    are strings or None.
+
+    Args:
+        columns (dict): One list per field of PRODUCT_FIELDS
+        errors (dict, optional): Per-field error counts of the page
+    """
+
+    def __init__(self, columns, errors=None):
+        self.columns = columns
+        self.errors = errors or {}
+
+    def __len__(self):
+        return len(self.columns['Title'])
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            raise TypeError("CardColumns only slices by row")
+        # Error counts belong to the whole page and stay with it
+        return CardColumns({field: values[index] for field, values in self.columns.items()})
+
+    def rows(self):
+        """
+        Convert to row dicts shaped like those of parse_card_fields
+
+        Returns:
+            list: One dict per card; missing Rating and Colors are None
+        """
+        columns = dict(self.columns)
+        columns['Rating'] = [None if r != r else r for r in columns['Rating']]
+        columns['Colors'] = [None if c != c else int(c) for c in columns['Colors']]
+        return [dict(zip(PRODUCT_FIELDS, values)) for values in zip(*(columns[f] for f in PRODUCT_FIELDS))]
+
+def _price_value(text):
+    try:
+        return float(text.strip().replace("$", ""))
+    except (AttributeError, ValueError):
+        return NAN
+
+def _rating_value(text):
+    # An unrated product has no star marker and is not an error
+    if text is None or "⭐" not in text:
+        return NAN
+    try:
+        return float(text.split("⭐")[1].split("/")[0].strip())
+    except ValueError:
+        return NAN
+
+def _colors_value(text):
+    try:
+        return int(text.strip().split()[0])
+    except (AttributeError, IndexError, ValueError):
+        return NAN
+
+def _label_value(text):
+    try:
+        return text.strip().split(":")[1].strip()
+    except (AttributeError, IndexError):
+        return None
+
+def parse_card_fields_vectorized(cards, errors=None):
+    """
+    Convert the raw text fields of many cards into product columns in bulk
+
+    Each field is converted a column at a time, with one comprehension and
+    one map over the page's values and no dict per product, and the
+    columns go into the extractor's buffer whole. A column holding a
+    missing or malformed value is parsed again value by value. Cards are
+    never dropped: a missing or malformed value becomes NaN (None for text
+    fields) and is counted in errors. A rating without the star marker is
+    an unrated product, not an error, exactly as in parse_card_fields.
+
+    Args:
+        cards (list): (title, price, details) tuples from extract_card_fields
+        errors (dict, optional): Per-field error counts, updated in place
+
+    Returns:
+        CardColumns: The product columns, without Timestamp, and the
+            page's error counts
+    """
+    if not cards:
+        return CardColumns({field: [] for field in PRODUCT_FIELDS})
+    titles, prices, details = zip(*cards)
+    if None not in details and set(map(len, details)) == {4}:
+        ratings, colors, sizes, genders = zip(*details)
+    else:
+        details = [d if d is not None else () for d in details]
+        ratings, colors, sizes, genders = (
+            [d[index] if len(d) > index else None for d in details] for index in range(4)
+        )
+    counts = dict.fromkeys(PRODUCT_FIELDS, 0)
+
+    if None in titles:
+        title = [text.strip() if text is not None else None for text in titles]
+        counts['Title'] = title.count(None)
+    else:
+        title = [text.strip() for text in titles]
+
+    try:
+        price = list(map(float, [text.replace("$", "") for text in prices]))
+    except (AttributeError, ValueError):
+        price = [_price_value(text) for text in prices]
+        counts['Price'] = sum(value != value for value in price)
+
+    try:
+        rating = list(map(float, [text.partition("⭐")[2].partition("/")[0] for text in ratings]))
+    except (AttributeError, ValueError):
+        # Only a rating with the star marker can be malformed
+        rating = [_rating_value(text) for text in ratings]
+        counts['Rating'] = sum(
+            value != value and (text is None or "⭐" in text) for text, value in zip(ratings, rating)
+        )
+
+    try:
+        color = list(map(int, [text.partition(" ")[0] for text in colors]))
+    except (AttributeError, ValueError):
+        color = [_colors_value(text) for text in colors]
+        counts['Colors'] = sum(value != value for value in color)
+
+    labels = {}
+    for field, texts in (('Size', sizes), ('Gender', genders)):
+        try:
+            labels[field] = [text.split(":", 2)[1].strip() for text in texts]
+        except (AttributeError, IndexError):
+            labels[field] = [_label_value(text) for text in texts]
+            counts[field] = labels[field].count(None)
+
+    if errors is not None:
+        for field, count in counts.items():
+            errors[field] = errors.get(field, 0) + count
+
+    return CardColumns({
+        'Title': title,
+        'Price': price,
+        'Rating': rating,
+        'Colors': color,
+        'Size': labels['Size'],
+        'Gender': labels['Gender']
+    }, counts)
+
+def parse_cards(content, page=None, backend='html.parser', vectorized=False, errors=None):
+    """
+    Parse the product cards of one page
+
+    Args:
+        content (bytes): Raw HTML of the page
+        page (int, optional): Page number, used for logging
+        backend (str): One of PARSER_BACKENDS
+        vectorized (bool): Parse all cards in bulk with
+            parse_card_fields_vectorized instead of card by card. Malformed
+            values become NaN instead of dropping the card, and the page
+            comes back as CardColumns
+        errors (dict, optional): Per-field error counts of the vectorized
+            parser, updated in place
+
+    Returns:
+        list: One dict per valid product card, without the Timestamp
+            column, or CardColumns when vectorized
+    """
+    cards = extract_card_fields(content, backend)
+
+    if not cards:
+        logging.warning(f"No product cards found on page {page}")
+        return []
+
+    if vectorized:
+        return parse_card_fields_vectorized(cards, errors)
+
+    rows = []
+    for title, price, details in cards:
+        try:
+            rows.append(parse_card_fields(title, price, details))
+        except (ValueError, IndexError) as e:
+            logging.error(f"Error processing product card: {str(e)}")
+            continue
+
+    return rows
@@ -0,0 +1,165 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from utils.transform import transform_data
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+def _sink_executor(sinks):
+    return ThreadPoolExecutor(max_workers=max(1, len(sinks)), thread_name_prefix='sink')
+
+def run_sinks(df, sinks, append=False, timeout=None, executor=None):
+    """
+    Load one transformed frame into every sink concurrently
+
+    Each sink runs on its own pool thread, so the load takes about as long
+    as the slowest sink instead of their sum. Sinks get shallow copies of
+    the same frame and must not modify its values. A sink that raises or
+    exceeds its timeout is reported in its result without affecting the
+    others. A timed-out sink is abandoned, not interrupted: its thread
+    finishes in the background.
+
+    Args:
+        df (pd.DataFrame): Transformed frame to load
+        sinks (dict): Sink name mapped to a callable ``sink(df, append)``
+        append (bool): Passed on to every sink
+        timeout (float or dict, optional): Seconds each sink may take, or
+            sink name mapped to its seconds. Sinks without one are waited
+            for indefinitely
+        executor (concurrent.futures.Executor, optional): Pool to run the
+            sinks on, e.g. to reuse threads across batches. A pool with one
+            thread per sink is used when omitted
+
+    Returns:
+        dict: Sink name mapped to its 'rows' loaded, 'seconds' taken and
+            'error' (None when the sink succeeded)
+    """
+    own_executor = executor is None
+    if own_executor:
+        executor = _sink_executor(sinks)
+    elapsed = {}
+
+    def load(name, sink, frame):
+        started = time.perf_counter()
+        try:
+            sink(frame, append)
+        finally:
+            elapsed[name] = time.perf_counter() - started
+
+    try:
+        start = time.monotonic()
+        futures = {
+            name: executor.submit(load, name, sink, df.copy(deep=False))
+            for name, sink in sinks.items()
+        }
+        results = {}
+        for name, future in futures.items():
+            limit = timeout.get(name) if isinstance(timeout, dict) else timeout
+            remaining = None if limit is None else max(0.0, start + limit - time.monotonic())
+            wait([future], timeout=remaining)
+            if not future.done():
+                future.cancel()
+                error = f"Timed out after {limit}s"
+            elif future.exception() is not None:
+                error = str(future.exception())
+            else:
+                results[name] = {'rows': len(df), 'seconds': elapsed[name], 'error': None}
+                continue
+            logging.error(f"Sink '{name}' failed: {error}")
+            results[name] = {'rows': 0, 'seconds': elapsed.get(name, limit), 'error': error}
+        return results
+    finally:
+        if own_executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+def run_streaming_pipeline(batches, sinks, dedup=None, metrics=None, profile=None, incremental=None,
+                           timeout=None):
+    """
+    Transform extracted batches one at a time and load each into every sink
+
+    Batches are pulled lazily, so fetching, parsing and loading overlap and
+    only one batch is held in memory at a time. Each batch is loaded into
+    the sinks concurrently (see run_sinks). A sink that fails or times out
+    is logged and skipped for the rest of the run so it never receives a
+    partial stream of appends.
+
+    Args:
+        batches (iterable): Raw pd.DataFrame batches, e.g. from extract_batches
+        sinks (dict): Sink name mapped to a callable ``sink(df, append)``.
+            ``append`` is False for the first loaded batch and True afterwards
+        dedup (utils.dedup.Deduplicator, optional): Drops repeated products
+            between transform and load. Batches left empty are not loaded.
+            Its key index is saved at the end only if every sink succeeded
+        metrics (utils.metrics.TransformMetrics, optional): Records the
+            transform steps of every batch
+        profile (utils.profiling.DataProfile, optional): Updated with every
+            loaded batch
+        incremental (utils.incremental.IncrementalTransform, optional):
+            Transforms batches in place of transform_data, reusing batches
+            unchanged since the previous run. Its store is saved at the end
+        timeout (float or dict, optional): Seconds each sink may take per
+            batch, or sink name mapped to its seconds
+
+    Returns:
+        dict: Run summary with total 'batches' and 'rows' loaded, per-sink
+            'rows' loaded and 'error' (None when the sink succeeded), and
+            the 'dedup' stats when dedup is given and the 'transform' step
+            metrics when metrics is given and the 'profile' report when
+            profile is given
+    """
+    summary = {
+        'batches': 0,
+        'rows': 0,
+        'sinks': {name: {'rows': 0, 'error': None} for name in sinks}
+    }
+
+    # Threads live for the whole run, so per-thread clients are reused
+    executor = _sink_executor(sinks)
+    try:
+        for raw_batch in batches:
+            if incremental is not None:
+                batch = incremental(raw_batch)
+            else:
+                batch = transform_data(raw_batch, metrics=metrics)
+            if dedup is not None:
+                batch = dedup(batch)
+                if batch.empty:
+                    logging.info("Skipping batch without new products")
+                    continue
+            if profile is not None:
+                profile.update(batch)
+            append = summary['batches'] > 0
+            summary['batches'] += 1
+            summary['rows'] += len(batch)
+
+            active = {name: sink for name, sink in sinks.items() if summary['sinks'][name]['error'] is None}
+            for name, loaded in run_sinks(batch, active, append, timeout, executor).items():
+                result = summary['sinks'][name]
+                if loaded['error'] is None:
+                    result['rows'] += loaded['rows']
+                else:
+                    logging.warning(f"Skipping sink '{name}' for the rest of the run")
+                    result['error'] = loaded['error']
+
+            logging.info(f"Loaded batch {summary['batches']} ({len(batch)} rows)")
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    if dedup is not None:
+        summary['dedup'] = dict(dedup.stats)
+        if all(result['error'] is None for result in summary['sinks'].values()):
+            dedup.save()
+        else:
+            logging.warning("Not saving the product key index: a sink failed")
+    if incremental is not None:
+        incremental.save()
+    if metrics is not None:
+        summary['transform'] = metrics.as_dict()
+    if profile is not None:
+        summary['profile'] = profile.report()
+
+    return summary
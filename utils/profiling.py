@@ -0,0 +1,481 @@
+import base64
+import json
+import logging
+import math
+import os
+import numpy as np
+import pandas as pd
+from utils.schema import widen_float32
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+# Which sketch profiles which product column
+PROFILE_COLUMNS = {
+    'quantiles': ('Price', 'Rating'),
+    'distinct': ('Title',),
+    'frequent': ('Size', 'Gender')
+}
+
+DEFAULT_QUANTILES = (0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99)
+
+def _float_values(series):
+    values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    return values[~np.isnan(values)]
+
+def _widened(value):
+    return None if value is None else widen_float32(value).item()
+
+class QuantileSketch:
+    """
+    KLL sketch of a numeric distribution
+
+    Values are kept in levels of sorted compactors; an item at level h
+    stands for 2**h inputs. When a level outgrows its capacity, every other
+    item (from a random offset) moves up a level. Memory stays around 3k
+    items however many values go in, and the rank error of a quantile is
+    roughly 1.7 / k. The exact min and max are kept on the side.
+
+    Args:
+        k (int): Accuracy parameter, the capacity of the top level
+        seed (int, optional): Seed for the compaction offsets
+    """
+
+    def __init__(self, k=200, seed=None):
+        if k < 8:
+            raise ValueError("k must be at least 8")
+        self.k = k
+        self.count = 0
+        self.min = None
+        self.max = None
+        self._levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def __len__(self):
+        return sum(len(level) for level in self._levels)
+
+    def _capacity(self, level):
+        depth = len(self._levels) - level - 1
+        return max(2, int(math.ceil(self.k * (2 / 3) ** depth)))
+
+    def _compress(self):
+        level = 0
+        while level < len(self._levels):
+            items = self._levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self._levels):
+                    self._levels.append(np.empty(0))
+                items = np.sort(items)
+                # An odd item out stays behind so weights are preserved
+                kept = items[:len(items) % 2]
+                promoted = items[len(kept) + self._rng.integers(2)::2]
+                self._levels[level] = kept
+                self._levels[level + 1] = np.concatenate([self._levels[level + 1], promoted])
+                level = 0  # Capacities shift once the sketch grows a level
+                continue
+            level += 1
+
+    def update(self, values):
+        """
+        Add a batch of values; NaN is ignored
+
+        Args:
+            values (array-like): Numeric values
+        """
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return
+        self.count += len(values)
+        low, high = float(values.min()), float(values.max())
+        self.min = low if self.min is None else min(self.min, low)
+        self.max = high if self.max is None else max(self.max, high)
+        self._levels[0] = np.concatenate([self._levels[0], values])
+        self._compress()
+
+    def merge(self, other):
+        """
+        Fold another sketch of the same k into this one
+
+        Args:
+            other (QuantileSketch): Sketch from another batch, worker or run
+
+        Raises:
+            ValueError: If the sketches use a different k
+        """
+        if other.k != self.k:
+            raise ValueError(f"Cannot merge quantile sketches with k={self.k} and k={other.k}")
+        if not other.count:
+            return
+        for level, items in enumerate(other._levels):
+            if level == len(self._levels):
+                self._levels.append(np.empty(0))
+            self._levels[level] = np.concatenate([self._levels[level], items])
+        self.count += other.count
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        self._compress()
+
+    def quantiles(self, qs=DEFAULT_QUANTILES):
+        """
+        Estimate quantiles
+
+        Args:
+            qs (iterable): Probabilities between 0 and 1
+
+        Returns:
+            dict: Probability mapped to its estimated value, or None when
+                the sketch is empty. 0 and 1 give the exact min and max
+        """
+        qs = list(qs)
+        if not self.count:
+            return {q: None for q in qs}
+        values = np.concatenate(self._levels)
+        weights = np.concatenate([np.full(len(items), 2 ** level) for level, items in enumerate(self._levels)])
+        order = np.argsort(values, kind='stable')
+        values = values[order]
+        ranks = np.cumsum(weights[order])
+        estimates = {}
+        for q in qs:
+            if q <= 0:
+                estimates[q] = self.min
+            elif q >= 1:
+                estimates[q] = self.max
+            else:
+                index = min(int(np.searchsorted(ranks, q * ranks[-1])), len(values) - 1)
+                estimates[q] = float(values[index])
+        return estimates
+
+    def to_dict(self):
+        return {
+            'k': self.k, 'count': self.count, 'min': self.min, 'max': self.max,
+            'levels': [items.tolist() for items in self._levels]
+        }
+
+    @classmethod
+    def from_dict(cls, state, seed=None):
+        sketch = cls(k=state['k'], seed=seed)
+        sketch.count = state['count']
+        sketch.min = state['min']
+        sketch.max = state['max']
+        sketch._levels = [np.asarray(items, dtype=np.float64) for items in state['levels']] or [np.empty(0)]
+        return sketch
+
+class DistinctCounter:
+    """
+    HyperLogLog estimate of the number of distinct values
+
+    Values are hashed with pandas' stable 64-bit hash, so counters built in
+    different processes or runs agree and merge by taking the larger
+    register. 2**p one-byte registers give a standard error of about
+    1.04 / sqrt(2**p), 0.8% at the default p=14 (16 KiB).
+
+    Args:
+        p (int): Register index bits, between 12 and 18
+    """
+
+    def __init__(self, p=14):
+        if not 12 <= p <= 18:
+            raise ValueError("p must be between 12 and 18")
+        self.p = p
+        self.registers = np.zeros(2 ** p, dtype=np.uint8)
+
+    def update(self, series):
+        """
+        Add a batch of values; missing values are ignored
+
+        Args:
+            series (pd.Series): Values to count
+        """
+        series = series.dropna()
+        if series.empty:
+            return
+        hashes = pd.util.hash_pandas_object(series, index=False).to_numpy()
+        width = 64 - self.p
+        index = (hashes >> np.uint64(width)).astype(np.intp)
+        remainder = hashes & np.uint64((1 << width) - 1)
+        # Position of the leftmost 1-bit in the remaining bits; frexp's
+        # exponent is the bit length, exact since width <= 52
+        _, bit_length = np.frexp(remainder.astype(np.float64))
+        rank = (width - bit_length + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other):
+        """
+        Fold another counter with the same p into this one
+
+        Args:
+            other (DistinctCounter): Counter from another batch, worker or run
+
+        Raises:
+            ValueError: If the counters use a different p
+        """
+        if other.p != self.p:
+            raise ValueError(f"Cannot merge distinct counters with p={self.p} and p={other.p}")
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self):
+        """
+        Returns:
+            int: Estimated number of distinct values
+        """
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.ldexp(1.0, -self.registers.astype(np.int64)).sum()
+        zeros = int((self.registers == 0).sum())
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)  # Linear counting for small sets
+        return int(round(estimate))
+
+    def to_dict(self):
+        return {'p': self.p, 'registers': base64.b64encode(self.registers.tobytes()).decode('ascii')}
+
+    @classmethod
+    def from_dict(cls, state):
+        counter = cls(p=state['p'])
+        registers = np.frombuffer(base64.b64decode(state['registers']), dtype=np.uint8)
+        if len(registers) != len(counter.registers):
+            raise ValueError("Register count does not match p")
+        counter.registers = registers.copy()
+        return counter
+
+class HeavyHitters:
+    """
+    Space-saving summary of the most frequent values
+
+    At most capacity values are tracked, each with an upper-bound count and
+    the most that count may overstate the truth. While fewer distinct
+    values than capacity have been seen, counts are exact. Batches are
+    counted exactly and merged in, so updating and merging are the same
+    operation.
+
+    Args:
+        capacity (int): Values tracked
+    """
+
+    def __init__(self, capacity=64):
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.counters = {}  # value -> [count, error]
+
+    def _floor(self):
+        # What an untracked value may have been counted at
+        if len(self.counters) < self.capacity:
+            return 0
+        return min(count for count, _ in self.counters.values())
+
+    def _merge_counters(self, counters, floor):
+        own_floor = self._floor()
+        merged = {}
+        for value in self.counters.keys() | counters.keys():
+            count, error = self.counters.get(value, (own_floor, own_floor))
+            other_count, other_error = counters.get(value, (floor, floor))
+            merged[value] = [count + other_count, error + other_error]
+        if len(merged) > self.capacity:
+            merged = dict(sorted(merged.items(), key=lambda item: -item[1][0])[:self.capacity])
+        self.counters = merged
+
+    def update(self, series):
+        """
+        Add a batch of values; missing values are ignored
+
+        Args:
+            series (pd.Series): Values to count
+        """
+        counts = series.value_counts(dropna=True, sort=False)
+        counts = counts[counts > 0]  # Unused categories
+        counters = {}
+        for value, count in counts.items():
+            if isinstance(value, np.generic):
+                value = value.item()  # Plain values, so the summary saves as JSON
+            counters[value] = (int(count), 0)
+        self._merge_counters(counters, 0)
+
+    def merge(self, other):
+        """
+        Fold another summary into this one
+
+        Args:
+            other (HeavyHitters): Summary from another batch, worker or run
+        """
+        self._merge_counters(other.counters, other._floor())
+
+    def top(self, n=None):
+        """
+        Return the most frequent values
+
+        Args:
+            n (int, optional): How many, all tracked values by default
+
+        Returns:
+            list: (value, count, error) tuples, most frequent first
+        """
+        ranked = sorted(self.counters.items(), key=lambda item: (-item[1][0], str(item[0])))
+        return [(value, count, error) for value, (count, error) in ranked[:n]]
+
+    def to_dict(self):
+        return {'capacity': self.capacity, 'counters': [[value, count, error] for value, count, error in self.top()]}
+
+    @classmethod
+    def from_dict(cls, state):
+        summary = cls(capacity=state['capacity'])
+        summary.counters = {value: [count, error] for value, count, error in state['counters']}
+        return summary
+
+class DataProfile:
+    """
+    Approximate profile of transformed product data, built batch by batch
+
+    Keeps one mergeable sketch per profiled column: quantiles for numeric
+    columns, a distinct count for Title and heavy hitters for Size and
+    Gender. Memory does not grow with the rows seen, profiles from parallel
+    workers merge into one, and a saved profile can be loaded and extended
+    by the next run.
+
+    Args:
+        columns (dict): 'quantiles', 'distinct' and 'frequent' column tuples
+        k (int): QuantileSketch accuracy
+        p (int): DistinctCounter register bits
+        capacity (int): HeavyHitters values tracked
+    """
+
+    def __init__(self, columns=PROFILE_COLUMNS, k=200, p=14, capacity=64):
+        self.rows = 0
+        self.sketches = {}
+        for column in columns.get('quantiles', ()):
+            self.sketches[column] = QuantileSketch(k=k)
+        for column in columns.get('distinct', ()):
+            self.sketches[column] = DistinctCounter(p=p)
+        for column in columns.get('frequent', ()):
+            self.sketches[column] = HeavyHitters(capacity=capacity)
+        self.nulls = {column: 0 for column in self.sketches}
+        # Numeric columns seen as float32, whose report values are widened
+        # without binary noise
+        self.float32 = set()
+
+    def update(self, df):
+        """
+        Add a batch of rows
+
+        Args:
+            df (pd.DataFrame): Transformed batch with every profiled column
+
+        Raises:
+            ValueError: If a profiled column is missing
+        """
+        missing_columns = [col for col in self.sketches if col not in df.columns]
+        if missing_columns:
+            raise ValueError(f"Missing profiled columns: {missing_columns}")
+        self.rows += len(df)
+        for column, sketch in self.sketches.items():
+            series = df[column]
+            self.nulls[column] += int(series.isna().sum())
+            if isinstance(sketch, QuantileSketch):
+                if getattr(series.dtype, 'numpy_dtype', series.dtype) == np.float32:
+                    self.float32.add(column)
+                sketch.update(_float_values(series))
+            else:
+                sketch.update(series)
+
+    def merge(self, other):
+        """
+        Fold another profile of the same columns into this one
+
+        Args:
+            other (DataProfile): Profile from another worker or run
+
+        Raises:
+            ValueError: If the profiles cover different columns or sketches
+        """
+        if self.sketches.keys() != other.sketches.keys():
+            raise ValueError("Cannot merge profiles of different columns")
+        for column, sketch in self.sketches.items():
+            if type(sketch) is not type(other.sketches[column]):
+                raise ValueError(f"Cannot merge different sketches for {column}")
+            sketch.merge(other.sketches[column])
+            self.nulls[column] += other.nulls[column]
+        self.float32 |= other.float32
+        self.rows += other.rows
+
+    def report(self, quantiles=DEFAULT_QUANTILES, top=10):
+        """
+        Summarize the profile
+
+        Args:
+            quantiles (iterable): Probabilities to estimate per numeric column
+            top (int): Most frequent values to list per column
+
+        Returns:
+            dict: 'rows' and per-column 'nulls' plus 'min', 'max' and
+                'quantiles', or 'distinct', or 'top' (value, count, error)
+        """
+        columns = {}
+        for column, sketch in self.sketches.items():
+            stats = {'nulls': self.nulls[column]}
+            if isinstance(sketch, QuantileSketch):
+                stats.update(min=sketch.min, max=sketch.max, quantiles=sketch.quantiles(quantiles))
+                if column in self.float32:
+                    stats['min'], stats['max'] = _widened(stats['min']), _widened(stats['max'])
+                    stats['quantiles'] = {q: _widened(value) for q, value in stats['quantiles'].items()}
+            elif isinstance(sketch, DistinctCounter):
+                stats['distinct'] = sketch.estimate()
+            else:
+                stats['top'] = sketch.top(top)
+            columns[column] = stats
+        return {'rows': self.rows, 'columns': columns}
+
+    def save(self, path):
+        """
+        Write the profile as JSON, replacing the previous file atomically
+
+        Args:
+            path (str): Profile file
+        """
+        state = {
+            'rows': self.rows,
+            'nulls': self.nulls,
+            'float32': sorted(self.float32),
+            'sketches': {
+                column: {'type': type(sketch).__name__, 'state': sketch.to_dict()}
+                for column, sketch in self.sketches.items()
+            }
+        }
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read a profile written by save
+
+        Args:
+            path (str): Profile file
+
+        Returns:
+            DataProfile: The saved profile, ready to update or merge
+
+        Raises:
+            ValueError: If the file is not a saved profile
+        """
+        sketch_types = {sketch_type.__name__: sketch_type for sketch_type in (QuantileSketch, DistinctCounter, HeavyHitters)}
+        with open(path, encoding='utf-8') as f:
+            try:
+                state = json.load(f)
+                profile = cls(columns={})
+                profile.rows = state['rows']
+                profile.nulls = dict(state['nulls'])
+                profile.float32 = set(state.get('float32', ()))
+                for column, sketch in state['sketches'].items():
+                    profile.sketches[column] = sketch_types[sketch['type']].from_dict(sketch['state'])
+            except (ValueError, KeyError, TypeError) as e:
+                raise ValueError(f"Corrupt profile {path}: {str(e)}")
+        return profile
@@ -0,0 +1,227 @@
+import logging
+import numpy as np
+import pandas as pd
+from sqlalchemy.types import DateTime, REAL, SmallInteger, Text
+
+try:
+    import pyarrow as pa
+except ImportError:  # Optional Arrow engine
+    pa = None
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+# Column dtypes of a transformed product frame. Size and Gender take a handful
+# of values and the Timestamp is one value per run, so they are stored as
+# categories (small integer codes plus one copy of each distinct value)
+PRODUCT_SCHEMA = {
+    'Title': np.dtype(object),
+    'Price': np.dtype(np.float32),  # Exact to the cent below 100,000
+    'Rating': np.dtype(np.int8),
+    'Colors': pd.Int8Dtype(),  # Nullable: unparsable color counts stay missing
+    'Size': 'category',
+    'Gender': 'category',
+    'Timestamp': 'category'  # Ordered, so min/max work
+}
+
+# Matching database column types, used instead of whatever pandas infers
+SQL_TYPES = {
+    'Title': Text(),
+    'Price': REAL(),
+    'Rating': SmallInteger(),
+    'Colors': SmallInteger(),
+    'Size': Text(),
+    'Gender': Text(),
+    'Timestamp': DateTime()
+}
+
+SHEETS_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# transform_data and validate_transformed_data engines: 'pandas' works on
+# NumPy-backed columns, 'pyarrow' on Arrow arrays with pyarrow.compute
+ENGINES = ('pandas', 'pyarrow')
+
+def check_engine(engine):
+    """
+    Check that an engine is known and its dependency is installed
+
+    Args:
+        engine (str): One of ENGINES
+
+    Raises:
+        ValueError: If the engine is unknown or cannot be used
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine: {engine}")
+    if engine == 'pyarrow' and pa is None:
+        raise ValueError("The 'pyarrow' engine requires the pyarrow package")
+
+def arrow_schema():
+    """
+    Arrow equivalent of PRODUCT_SCHEMA, as produced by the 'pyarrow' engine
+
+    Size, Gender and Timestamp are dictionary-encoded and Colors is a plain
+    int8 column, since every Arrow array carries its own null bitmap.
+
+    Returns:
+        pa.Schema: Schema of the product columns
+
+    Raises:
+        ValueError: If pyarrow is not installed
+    """
+    check_engine('pyarrow')
+    return pa.schema([
+        ('Title', pa.string()),
+        ('Price', pa.float32()),
+        ('Rating', pa.int8()),
+        ('Colors', pa.int8()),
+        ('Size', pa.dictionary(pa.int32(), pa.string())),
+        ('Gender', pa.dictionary(pa.int32(), pa.string())),
+        ('Timestamp', pa.dictionary(pa.int32(), pa.timestamp('ns')))
+    ])
+
+def int_bounds(dtype):
+    """
+    Return the range of values a schema integer dtype can hold
+
+    Args:
+        dtype: numpy or pandas nullable integer dtype
+
+    Returns:
+        tuple: (min, max)
+    """
+    info = np.iinfo(getattr(dtype, 'numpy_dtype', dtype))
+    return info.min, info.max
+
+def timestamp_categories(series):
+    """
+    Dictionary-encode a timestamp column
+
+    Args:
+        series (pd.Series): Datetimes, or strings read back from CSV
+
+    Returns:
+        pd.Categorical: Ordered categorical over the distinct timestamps
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        if series.cat.ordered:
+            return series.array
+        return series.cat.as_ordered().array
+    return pd.Categorical(pd.to_datetime(series), ordered=True)
+
+def apply_schema(df):
+    """
+    Cast the product columns of a frame to PRODUCT_SCHEMA
+
+    Meant for already-clean frames from other sources; transform_data
+    produces these dtypes directly. Columns outside the schema are kept.
+
+    Args:
+        df (pd.DataFrame): Frame with cleaned product columns
+
+    Returns:
+        pd.DataFrame: Shallow copy with the schema dtypes applied
+
+    Raises:
+        ValueError: If a value does not fit its schema dtype
+    """
+    df_typed = df.copy(deep=False)
+    for column, dtype in PRODUCT_SCHEMA.items():
+        if column not in df_typed.columns:
+            continue
+        if column == 'Timestamp':
+            df_typed[column] = timestamp_categories(df_typed[column])
+        elif column == 'Rating':
+            values = df_typed[column].round()
+            low, high = int_bounds(dtype)
+            if ((values < low) | (values > high)).any():
+                raise ValueError(f"{column} values out of range for {dtype}")
+            df_typed[column] = values.astype(dtype)
+        else:
+            df_typed[column] = df_typed[column].astype(dtype)
+    return df_typed
+
+def sql_dtypes(df):
+    """
+    Pick the database column types for the schema columns of a frame
+
+    Args:
+        df (pd.DataFrame): Frame about to be written with to_sql
+
+    Returns:
+        dict: Column name mapped to a SQLAlchemy type
+    """
+    return {column: SQL_TYPES[column] for column in df.columns if column in SQL_TYPES}
+
+def _decode_arrow(series):
+    if not isinstance(series.dtype, pd.ArrowDtype):
+        return series.array
+    return pa.array(series).to_pandas(types_mapper={pa.int8(): pd.Int8Dtype()}.get).array
+
+def numpy_backed(df):
+    """
+    Decode the Arrow-backed columns of a frame into their NumPy-backed equivalents
+
+    Dictionary columns become categoricals and int8 columns nullable Int8.
+    Frames without Arrow columns are returned as they are.
+
+    Args:
+        df (pd.DataFrame): Frame to decode
+
+    Returns:
+        pd.DataFrame: Frame with NumPy-backed columns only
+    """
+    if not any(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes):
+        return df
+    return pd.DataFrame({column: _decode_arrow(series) for column, series in df.items()}, index=df.index)
+
+def widen_float32(values):
+    """
+    Widen float32 values to float64 through their shortest decimal repr
+
+    123.45 stays 123.45 instead of becoming 123.44999694824219. Values
+    already widened to float64 without this are narrowed back first.
+
+    Args:
+        values (float or array-like): float32 values
+
+    Returns:
+        np.ndarray: float64 values, 0-d for a single value
+    """
+    return np.asarray(values, dtype=np.float32).astype(str).astype(np.float64)
+
+def _plain_values(series):
+    dtype = series.dtype
+    if isinstance(dtype, pd.ArrowDtype):
+        # Decode Arrow columns into their NumPy-backed equivalents first
+        return _plain_values(pd.Series(_decode_arrow(series)))
+    if isinstance(dtype, pd.CategoricalDtype):
+        if dtype.categories.dtype.kind == 'M':
+            return _plain_values(series.astype(dtype.categories.dtype))
+        series = series.astype(object)
+    elif dtype.kind == 'M':
+        formatted = series.dt.strftime(SHEETS_TIMESTAMP_FORMAT)
+        return formatted.where(series.notna(), None).tolist()
+    elif dtype == np.float32:
+        values = widen_float32(series.to_numpy())
+        return [None if v != v else v for v in values.tolist()]
+    return series.astype(object).where(series.notna(), None).tolist()
+
+def sheet_values(df):
+    """
+    Convert a frame into rows of plain JSON-safe values
+
+    Categories are decoded, timestamps formatted, float32 values widened
+    without binary noise and missing values become None.
+
+    Args:
+        df (pd.DataFrame): Frame to convert
+
+    Returns:
+        list: One list of cell values per row
+    """
+    columns = [_plain_values(df[column]) for column in df.columns]
+    return [list(row) for row in zip(*columns)]
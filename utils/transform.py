@@ -2,6 +2,15 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 import logging
+from contextlib import nullcontext
+from utils.schema import PRODUCT_SCHEMA, check_engine, int_bounds, timestamp_categories
+from utils.validation import PRODUCT_RULES, validate_data
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # Optional Arrow engine
+    pa = pc = None
 
 # Configure logging
 logging.basicConfig(
@@ -13,61 +22,304 @@ class TransformationError(Exception):
     """Custom exception for transformation errors"""
     pass
 
-def transform_data(df):
+REQUIRED_COLUMNS = ['Title', 'Price', 'Rating', 'Colors', 'Size', 'Gender', 'Timestamp']
+
+def _writable_values(series, inplace):
+    # Reuse the column's own buffer only when allowed and possible; under
+    # copy-on-write pandas hands out read-only views, so copy instead.
+    # Returns the buffer and whether it is the column's own
+    values = series.to_numpy()
+    if inplace and values.flags.writeable:
+        return values, True
+    return values.copy(), False
+
+def _float_values(series):
+    # Float columns are read as a view; passing na_value would force a copy
+    if series.dtype == np.float64:
+        return series.to_numpy()
+    return series.to_numpy(dtype=np.float64, na_value=np.nan)
+
+def _check_bounds(column, values, dtype):
+    low, high = int_bounds(dtype)
+    if len(values) and (np.nanmin(values) < low or np.nanmax(values) > high):
+        raise ValueError(f"{column} values out of range for {dtype}")
+
+def _title_step(series, inplace):
+    missing = series.isna().to_numpy()
+    null_count = int(missing.sum())
+    if not null_count:
+        return None, null_count, 0
+    if series.dtype == object:
+        values, shared = _writable_values(series, inplace)
+    else:
+        # An all-missing column read from CSV is float; upcast like fillna
+        values, shared = series.to_numpy(dtype=object), False
+    values[missing] = 'Unknown Product'
+    return None if shared else values, null_count, 0
+
+def _category_step(default):
+    # Encode first and fill the codes, so the strings are never copied
+    def step(series, inplace):
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            values = series.array
+        else:
+            values = pd.Categorical(series)
+        missing = values.codes == -1
+        null_count = int(missing.sum())
+        if null_count:
+            if default not in values.categories:
+                values = values.add_categories([default])
+            values = values.fillna(default)
+        elif values is series.array:
+            return None, null_count, 0
+        return values, null_count, 0
+    return step
+
+def _price_step(series, inplace):
+    # Clip negative prices to 0; missing prices stay NaN
+    dtype = PRODUCT_SCHEMA['Price']
+    if series.dtype == dtype:
+        values = series.to_numpy()
+        negative = values < 0
+        null_count = int(np.isnan(values).sum())
+        if not negative.any():
+            return None, null_count, null_count
+        values, shared = _writable_values(series, inplace)
+    else:
+        source = _float_values(series)
+        negative = source < 0
+        null_count = int(np.isnan(source).sum())
+        values, shared = source.astype(dtype), False
+    values[negative] = 0
+    return None if shared else values, null_count, null_count
+
+def _rating_step(series, inplace):
+    # Round half to even, like Series.round, straight into the schema's
+    # small integer buffer; missing ratings become 0
+    dtype = PRODUCT_SCHEMA['Rating']
+    if series.dtype == dtype:
+        return None, 0, 0
+    values = _float_values(series)
+    missing = np.isnan(values)
+    if np.isinf(values).any():
+        raise ValueError("Cannot convert non-finite values (NA or inf) to integer")
+    null_count = int(missing.sum())
+    if null_count < len(values):
+        _check_bounds('Rating', values, dtype)
+    ratings = np.empty(len(values), dtype=dtype)
+    with np.errstate(invalid='ignore'):
+        np.rint(values, out=ratings, casting='unsafe')
+    ratings[missing] = 0
+    return ratings, null_count, 0
+
+def _colors_step(series, inplace):
+    # Colors stay nullable; a count that failed to parse is kept missing
+    dtype = PRODUCT_SCHEMA['Colors']
+    null_count = int(series.isna().sum())
+    if series.dtype == dtype:
+        return None, null_count, null_count
+    if null_count < len(series):
+        _check_bounds('Colors', _float_values(series), dtype)
+    return series.astype(dtype).array, null_count, null_count
+
+def _timestamp_step(series, inplace):
+    # One dictionary entry per run instead of a datetime per row
+    null_count = int(series.isna().sum())
+    if isinstance(series.dtype, pd.CategoricalDtype) and series.cat.ordered:
+        return None, null_count, null_count
+    return timestamp_categories(series), null_count, null_count
+
+def _count_nulls(series, inplace):
+    null_count = int(series.isna().sum())
+    return None, null_count, null_count
+
+# One step per column: (new values, or None if the column needs no
+# reassignment, nulls before, nulls after). Output dtypes follow
+# utils.schema.PRODUCT_SCHEMA
+_TRANSFORM_STEPS = {
+    'Title': _title_step,
+    'Price': _price_step,
+    'Rating': _rating_step,
+    'Colors': _colors_step,
+    'Size': _category_step('Not Specified'),
+    'Gender': _category_step('Unisex'),
+    'Timestamp': _timestamp_step,
+}
+
+def _arrow_decoded(values):
+    # Categorical input arrives dictionary-encoded; work on plain values
+    if pa.types.is_dictionary(values.type):
+        return values.cast(values.type.value_type)
+    return values
+
+def _arrow_check_bounds(column, values, dtype):
+    low, high = int_bounds(dtype)
+    extremes = pc.min_max(values).as_py()
+    if extremes['min'] is not None and (extremes['min'] < low or extremes['max'] > high):
+        raise ValueError(f"{column} values out of range for {dtype}")
+
+def _arrow_title_step(values):
+    null_count = values.null_count
+    # An all-missing column arrives with Arrow's null type
+    values = _arrow_decoded(values).cast(pa.string())
+    if null_count:
+        values = pc.fill_null(values, 'Unknown Product')
+    return values, null_count, 0
+
+def _arrow_category_step(default):
+    def step(values):
+        null_count = values.null_count
+        values = _arrow_decoded(values).cast(pa.string())
+        if null_count:
+            values = pc.fill_null(values, default)
+        return pc.dictionary_encode(values), null_count, 0
+    return step
+
+def _arrow_price_step(values):
+    # Clip negative prices to 0; missing prices stay null
+    values = _arrow_decoded(values).cast(pa.float64())
+    null_count = values.null_count
+    values = pc.if_else(pc.less(values, 0), 0.0, values)
+    return values.cast(pa.float32(), safe=False), null_count, null_count
+
+def _arrow_rating_step(values):
+    # Round half to even, like the pandas engine; missing ratings become 0
+    values = _arrow_decoded(values).cast(pa.float64())
+    null_count = values.null_count
+    if pc.any(pc.is_inf(values)).as_py():
+        raise ValueError("Cannot convert non-finite values (NA or inf) to integer")
+    if null_count < len(values):
+        _arrow_check_bounds('Rating', values, PRODUCT_SCHEMA['Rating'])
+    values = pc.round(pc.fill_null(values, 0.0), round_mode='half_to_even')
+    return values.cast(pa.int8()), null_count, 0
+
+def _arrow_colors_step(values):
+    # Colors stay nullable; a count that failed to parse is kept missing
+    values = _arrow_decoded(values)
+    null_count = values.null_count
+    if null_count < len(values):
+        _arrow_check_bounds('Colors', values, PRODUCT_SCHEMA['Colors'])
+    return values.cast(pa.int8()), null_count, null_count
+
+def _arrow_timestamp_step(values):
+    # One dictionary entry per run instead of a datetime per row
+    null_count = values.null_count
+    values = _arrow_decoded(values)
+    if not pa.types.is_timestamp(values.type):
+        # Strings read back from CSV
+        values = pa.chunked_array([pa.array(pd.to_datetime(values.to_pandas()))])
+    values = values.cast(pa.timestamp('ns', values.type.tz))
+    return pc.dictionary_encode(values), null_count, null_count
+
+def _arrow_count_nulls(values):
+    return values, values.null_count, values.null_count
+
+# Arrow counterparts of _TRANSFORM_STEPS: each maps a ChunkedArray to
+# (new values, nulls before, nulls after). Output types follow
+# utils.schema.arrow_schema()
+_ARROW_TRANSFORM_STEPS = {
+    'Title': _arrow_title_step,
+    'Price': _arrow_price_step,
+    'Rating': _arrow_rating_step,
+    'Colors': _arrow_colors_step,
+    'Size': _arrow_category_step('Not Specified'),
+    'Gender': _arrow_category_step('Unisex'),
+    'Timestamp': _arrow_timestamp_step,
+}
+
+def _check_input(df):
+    if not isinstance(df, pd.DataFrame):
+        raise ValueError("Input must be a pandas DataFrame")
+    
+    if df.empty:
+        raise ValueError("Input DataFrame is empty")
+    
+    missing_columns = [col for col in REQUIRED_COLUMNS if col not in df.columns]
+    if missing_columns:
+        raise ValueError(f"Missing required columns: {missing_columns}")
+
+def _timed(metrics, name, rows):
+    # Steps are only wrapped in instrumentation when metrics were asked for
+    return nullcontext() if metrics is None else metrics.step(name, rows)
+
+def _transform_arrow_frame(df, metrics):
+    # Arrow-backed input converts without copying; NumPy-backed columns
+    # are converted once, and the output wraps the Arrow arrays as they are
+    rows = len(df)
+    with _timed(metrics, 'from_pandas', rows):
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    
+    columns = {}
+    null_counts_before = {}
+    null_counts_after = {}
+    for column, values in zip(table.column_names, table.columns):
+        step = _ARROW_TRANSFORM_STEPS.get(column, _arrow_count_nulls)
+        with _timed(metrics, column, rows):
+            columns[column], null_counts_before[column], null_counts_after[column] = step(values)
+    
+    with _timed(metrics, 'to_pandas', rows):
+        df_transformed = pa.table(columns).to_pandas(types_mapper=pd.ArrowDtype)
+        df_transformed.index = df.index
+    return df_transformed, null_counts_before, null_counts_after
+
+def _transform_frame(df, inplace, engine='pandas', metrics=None):
+    # Validate and clean one frame; returns it with its null counts
+    _check_input(df)
+    if engine == 'pyarrow':
+        return _transform_arrow_frame(df, metrics)
+    
+    # A shallow copy shares every column until it is replaced below
+    df_transformed = df if inplace else df.copy(deep=False)
+    
+    rows = len(df_transformed)
+    null_counts_before = {}
+    null_counts_after = {}
+    for column in df_transformed.columns:
+        step = _TRANSFORM_STEPS.get(column, _count_nulls)
+        with _timed(metrics, column, rows):
+            values, null_counts_before[column], null_counts_after[column] = step(df_transformed[column], inplace)
+            if values is not None:
+                df_transformed[column] = values
+    
+    return df_transformed, null_counts_before, null_counts_after
+
+def transform_data(df, inplace=False, engine='pandas', metrics=None):
     """
     Transform the extracted data with error handling
     
+    Each column is cleaned in a single fused pass: fill, clip and cast
+    happen together and null counts are taken along the way. Columns come
+    out in the compact dtypes of utils.schema.PRODUCT_SCHEMA. Only columns
+    that actually change get a new array; the rest are shared with the
+    input, which is never modified unless inplace is set.
+    
+    The 'pyarrow' engine applies the same rules with pyarrow.compute and
+    returns pd.ArrowDtype columns typed by utils.schema.arrow_schema(), so
+    the result goes to Parquet or Arrow without conversion. It is fastest
+    on Arrow-backed input, e.g. from read_csv(dtype_backend='pyarrow').
+    
     Args:
         df (pd.DataFrame): Input DataFrame to transform
+        inplace (bool): Clean df itself instead of a shallow copy, filling
+            and clipping inside its existing column buffers where the dtype
+            already fits. Ignored by the 'pyarrow' engine
+        engine (str): One of utils.schema.ENGINES
+        metrics (utils.metrics.TransformMetrics, optional): Records wall
+            time, rows and peak memory of each column's step (and, for
+            'pyarrow', of the conversions to and from Arrow)
         
     Returns:
-        pd.DataFrame: Transformed DataFrame
+        pd.DataFrame: Transformed DataFrame (df itself when inplace)
         
     Raises:
         TransformationError: If there are critical errors during transformation
-        ValueError: If input DataFrame is invalid
+        ValueError: If input DataFrame is invalid or the engine is unknown
     """
+    check_engine(engine)
     try:
-        # Validate input
-        if not isinstance(df, pd.DataFrame):
-            raise ValueError("Input must be a pandas DataFrame")
-        
-        if df.empty:
-            raise ValueError("Input DataFrame is empty")
-            
-        required_columns = ['Title', 'Price', 'Rating', 'Colors', 'Size', 'Gender', 'Timestamp']
-        
-        missing_columns = [col for col in required_columns if col not in df.columns]
-        if missing_columns:
-            raise ValueError(f"Missing required columns: {missing_columns}")
-            
-        # Create a copy to avoid modifying the original dataframe
-        df_transformed = df.copy()
-        
-        # Handle null values with logging
-        null_counts_before = df_transformed.isnull().sum()
-        
-        # Update fillna operations to avoid FutureWarnings
-        df_transformed = df_transformed.assign(
-            Title=df_transformed['Title'].fillna('Unknown Product'),
-            Rating=df_transformed['Rating'].fillna(0),
-            Size=df_transformed['Size'].fillna('Not Specified'),
-            Gender=df_transformed['Gender'].fillna('Unisex')
-        )
-        
-        # Handle negative prices and convert numeric columns
-        df_transformed.loc[df_transformed['Price'] < 0, 'Price'] = 0
-        df_transformed['Price'] = df_transformed['Price'].astype(np.float64)
-        
-        # Convert Rating to int64 - first round to nearest integer then convert
-        df_transformed['Rating'] = df_transformed['Rating'].round().astype(np.int64)
-        
-        # Convert Colors to float64
-        df_transformed['Colors'] = df_transformed['Colors'].astype(np.float64)
+        df_transformed, null_counts_before, null_counts_after = _transform_frame(df, inplace, engine, metrics)
         
-        null_counts_after = df_transformed.isnull().sum()
-        
-        if null_counts_before.any():
+        if any(null_counts_before.values()):
             logging.info(f"Null values handled: Before={null_counts_before}, After={null_counts_after}")
             
         return df_transformed
@@ -76,15 +328,78 @@ def transform_data(df):
         logging.error(f"Error during data transformation: {str(e)}")
         raise TransformationError(f"Failed to transform data: {str(e)}")
 
-def validate_transformed_data(df):
+def transform_chunks(chunks, stats=None, inplace=False, engine='pandas', metrics=None):
+    """
+    Transform an iterator of DataFrames one chunk at a time
+    
+    Only the current chunk is held in memory, so arbitrarily long histories
+    can be reprocessed, e.g. ``pd.read_csv("product.csv", chunksize=50_000)``.
+    Empty chunks are skipped. Null-handling counts are merged across chunks
+    and logged once at the end.
+    
+    Args:
+        chunks (iterable): Raw pd.DataFrame chunks
+        stats (dict, optional): Updated in place with 'chunks', 'rows',
+            'null_values_before' and 'null_values_after' (per-column totals)
+        inplace (bool): Clean each chunk itself instead of a shallow copy;
+            safe for chunks nobody else holds, like those from read_csv
+        engine (str): One of utils.schema.ENGINES
+        metrics (utils.metrics.TransformMetrics, optional): Accumulates
+            step metrics over all chunks
+        
+    Yields:
+        pd.DataFrame: One transformed chunk per non-empty input chunk
+        
+    Raises:
+        TransformationError: If a chunk cannot be transformed
+        ValueError: If the engine is unknown
+    """
+    check_engine(engine)
+    if stats is None:
+        stats = {}
+    stats.setdefault('chunks', 0)
+    stats.setdefault('rows', 0)
+    before = stats.setdefault('null_values_before', {})
+    after = stats.setdefault('null_values_after', {})
+    
+    for index, chunk in enumerate(chunks):
+        try:
+            if isinstance(chunk, pd.DataFrame) and chunk.empty:
+                continue
+            chunk_transformed, null_counts_before, null_counts_after = _transform_frame(chunk, inplace, engine, metrics)
+        except Exception as e:
+            logging.error(f"Error during transformation of chunk {index}: {str(e)}")
+            raise TransformationError(f"Failed to transform chunk {index}: {str(e)}")
+        
+        stats['chunks'] += 1
+        stats['rows'] += len(chunk_transformed)
+        for column, count in null_counts_before.items():
+            before[column] = before.get(column, 0) + count
+        for column, count in null_counts_after.items():
+            after[column] = after.get(column, 0) + count
+        yield chunk_transformed
+    
+    if any(before.values()):
+        logging.info(
+            f"Null values handled over {stats['chunks']} chunks: Before={before}, After={after}"
+        )
+
+def validate_transformed_data(df, rules=None, sample=None, engine='pandas'):
     """
     Validate the transformed data with error handling
     
+    Delegates to utils.validation.validate_data, so every column is scanned
+    once, and keeps the summary keys this function has always returned.
+    
     Args:
         df (pd.DataFrame): DataFrame to validate
+        rules (dict, optional): Declarative rules, PRODUCT_RULES by default
+        sample (int, optional): Validate a random sample of this many rows
+        engine (str): One of utils.schema.ENGINES; 'pyarrow' evaluates the
+            rules with pyarrow.compute
         
     Returns:
-        dict: Validation results
+        dict: Validation results, including the full rule report under 'rules'
         
     Raises:
         ValueError: If input DataFrame is invalid
@@ -95,25 +410,35 @@ def validate_transformed_data(df):
         
         if df.empty:
             raise ValueError("Input DataFrame is empty")
+        
+        # Columns without rules are still scanned for their null counts
+        rules = rules or PRODUCT_RULES
+        column_rules = {column: {} for column in df.columns}
+        column_rules.update(rules.get('columns', {}))
+        report = validate_data(df, rules={**rules, 'columns': column_rules}, sample=sample, engine=engine)
+        columns = report['columns']
 
         validation_results = {
-            'null_values': df.isnull().sum().to_dict(),
+            'null_values': {column: stats['nulls'] for column, stats in columns.items()},
             'data_types': df.dtypes.to_dict(),
             'total_rows': len(df),
             'price_range': {
-                'min': df['Price'].min(),
-                'max': df['Price'].max()
+                'min': columns['Price'].get('min'),
+                'max': columns['Price'].get('max')
             },
             'unique_values': {
-                'Gender': df['Gender'].unique().tolist(),
-                'Size': df['Size'].unique().tolist()
+                'Gender': columns['Gender'].get('values'),
+                'Size': columns['Size'].get('values')
             },
             'extraction_time_range': {
-                'earliest': df['Timestamp'].min(),
-                'latest': df['Timestamp'].max()
-            }
+                'earliest': columns['Timestamp'].get('min'),
+                'latest': columns['Timestamp'].get('max')
+            },
+            'rules': report
         }
         
+        if report['failed_rows']:
+            logging.warning(f"{report['failed_rows']} rows failed validation rules")
         logging.info("Data validation completed successfully")
         return validation_results
 
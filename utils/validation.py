@@ -0,0 +1,274 @@
+import logging
+import numpy as np
+import pandas as pd
+from utils.dedup import DEFAULT_PRODUCT_KEY
+from utils.schema import check_engine, widen_float32
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # Optional Arrow engine
+    pa = pc = None
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+class ValidationError(Exception):
+    """Custom exception for data that breaks validation rules"""
+    pass
+
+# Declarative rules for transformed product data. Column rules may set
+# 'not_null', 'min', 'max', 'allowed' (collection of values) and 'unique';
+# 'unique' at the top level lists column combinations that must not repeat
+PRODUCT_RULES = {
+    'columns': {
+        'Title': {'not_null': True},
+        'Price': {'min': 0},
+        'Rating': {'not_null': True, 'min': 0, 'max': 5},
+        'Colors': {'min': 1},
+        'Size': {'not_null': True, 'allowed': ('XS', 'S', 'M', 'L', 'XL', 'XXL', 'Not Specified')},
+        'Gender': {'not_null': True, 'allowed': ('Men', 'Women', 'Unisex')},
+        'Timestamp': {'not_null': True}
+    },
+    'unique': [DEFAULT_PRODUCT_KEY]
+}
+
+_COLUMN_RULES = frozenset(['not_null', 'min', 'max', 'allowed', 'unique'])
+
+def _plain(value):
+    # Report values as plain Python objects
+    if value is None or value is pd.NaT:
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.to_pydatetime()
+    if isinstance(value, np.float32):
+        return widen_float32(value).item()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+def _range_failures(values, rules, failures):
+    # values holds the non-null entries the min/max rules apply to
+    fail = np.zeros(len(values), dtype=bool)
+    if 'min' in rules:
+        below = values < rules['min']
+        failures['min'] = int(below.sum())
+        fail |= below
+    if 'max' in rules:
+        above = values > rules['max']
+        failures['max'] = int(above.sum())
+        fail |= above
+    return fail
+
+def _check_categorical(series, rules, stats, failures):
+    # Rules are checked once per category and mapped to rows through the
+    # codes; per-rule row counts weigh each category by its frequency
+    categories = series.cat.categories
+    codes = series.cat.codes.to_numpy()
+    null = codes == -1
+    counts = np.bincount(codes[~null], minlength=len(categories))
+    used = categories[counts > 0]
+    kind = categories.dtype.kind
+
+    checks = []
+    if kind in 'iufM':
+        convert = pd.Timestamp if kind == 'M' else (lambda bound: bound)
+        if 'min' in rules:
+            checks.append(('min', np.asarray(categories < convert(rules['min']))))
+        if 'max' in rules:
+            checks.append(('max', np.asarray(categories > convert(rules['max']))))
+        stats['min'] = _plain(used.min()) if len(used) else None
+        stats['max'] = _plain(used.max()) if len(used) else None
+    else:
+        stats['values'] = [_plain(value) for value in used]
+    if 'allowed' in rules:
+        checks.append(('allowed', ~categories.isin(list(rules['allowed']))))
+
+    bad = np.zeros(len(categories), dtype=bool)
+    for rule, mask in checks:
+        failures[rule] = int(counts[mask].sum())
+        bad |= mask
+    fail = bad[np.where(null, 0, codes)] & ~null if len(categories) else np.zeros(len(codes), dtype=bool)
+    return null, fail, codes
+
+def _check_values(series, rules, stats, failures):
+    kind = series.dtype.kind
+    if kind == 'M':
+        values = series.to_numpy()
+        null = np.isnat(values)
+    elif kind in 'iufb':
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        null = np.isnan(values)
+    else:
+        values = series.to_numpy()
+        null = series.isna().to_numpy()
+
+    fail = np.zeros(len(values), dtype=bool)
+    present = values[~null] if null.any() else values
+    if kind in 'iufbM':
+        bounds = {rule: rules[rule] for rule in ('min', 'max') if rule in rules}
+        if kind == 'M':
+            bounds = {rule: np.datetime64(pd.Timestamp(bound)) for rule, bound in bounds.items()}
+        fail[~null] = _range_failures(present, bounds, failures)
+        # float32 extremes go back to float32, so they are reported without
+        # the binary noise of the float64 copy
+        narrow = np.float32 if series.dtype == np.float32 else (lambda value: value)
+        stats['min'] = _plain(narrow(present.min())) if len(present) else None
+        stats['max'] = _plain(narrow(present.max())) if len(present) else None
+        if kind == 'M':
+            stats['min'] = _plain(pd.Timestamp(stats['min'])) if stats['min'] is not None else None
+            stats['max'] = _plain(pd.Timestamp(stats['max'])) if stats['max'] is not None else None
+    if 'allowed' in rules:
+        allowed = pd.Series(present).isin(list(rules['allowed'])).to_numpy()
+        failures['allowed'] = int((~allowed).sum())
+        fail[~null] |= ~allowed
+        stats['values'] = [_plain(value) for value in pd.unique(present)]
+    return null, fail, values
+
+def _check_arrow(series, rules, stats, failures):
+    # Rules run as pyarrow.compute kernels. Dictionary columns, like
+    # categoricals, are checked once per dictionary entry and mapped to
+    # rows through the indices
+    array = pa.array(series)
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks()
+    null = array.is_null().to_numpy(zero_copy_only=False)
+    if pa.types.is_dictionary(array.type):
+        indices = array.indices
+        values = array.dictionary
+        used = values.take(pc.unique(indices).drop_null())
+        keys = indices.fill_null(-1).to_numpy(zero_copy_only=False)
+    else:
+        indices = None
+        values = used = array
+        keys = series
+    value_type = values.type
+
+    checks = []
+    if pa.types.is_integer(value_type) or pa.types.is_floating(value_type) or pa.types.is_timestamp(value_type):
+        convert = pd.Timestamp if pa.types.is_timestamp(value_type) else (lambda bound: bound)
+        if 'min' in rules:
+            checks.append(('min', pc.less(values, pa.scalar(convert(rules['min']), type=value_type))))
+        if 'max' in rules:
+            checks.append(('max', pc.greater(values, pa.scalar(convert(rules['max']), type=value_type))))
+        extremes = pc.min_max(used).as_py()
+        if pa.types.is_float32(value_type):
+            # Arrow hands float32 extremes out as Python floats with binary noise
+            extremes = {name: None if value is None else np.float32(value) for name, value in extremes.items()}
+        stats['min'] = _plain(extremes['min'])
+        stats['max'] = _plain(extremes['max'])
+    elif indices is not None or 'allowed' in rules:
+        stats['values'] = [_plain(value) for value in pc.unique(used).drop_null().to_pylist()]
+    if 'allowed' in rules:
+        allowed = pa.array(list(rules['allowed']), type=value_type)
+        checks.append(('allowed', pc.invert(pc.is_in(values, value_set=allowed))))
+
+    fail = np.zeros(len(array), dtype=bool)
+    for rule, mask in checks:
+        if indices is not None:
+            mask = mask.take(indices)
+        mask = mask.fill_null(False).to_numpy(zero_copy_only=False) & ~null
+        failures[rule] = int(mask.sum())
+        fail |= mask
+    return null, fail, keys
+
+def _check_column(series, rules, engine='pandas'):
+    unknown = set(rules) - _COLUMN_RULES
+    if unknown:
+        raise ValueError(f"Unknown validation rules for {series.name}: {sorted(unknown)}")
+
+    stats = {}
+    failures = {}
+    if engine == 'pyarrow':
+        null, fail, keys = _check_arrow(series, rules, stats, failures)
+    elif isinstance(series.dtype, pd.CategoricalDtype):
+        null, fail, keys = _check_categorical(series, rules, stats, failures)
+    else:
+        null, fail, keys = _check_values(series, rules, stats, failures)
+
+    stats['nulls'] = int(null.sum())
+    if rules.get('not_null'):
+        failures['not_null'] = stats['nulls']
+        fail = fail | null
+    if rules.get('unique'):
+        repeated = pd.Series(keys).duplicated().to_numpy() & ~null
+        failures['unique'] = int(repeated.sum())
+        fail = fail | repeated
+    stats['failures'] = failures
+    return stats, fail
+
+def validate_data(df, rules=PRODUCT_RULES, sample=None, random_state=0, strict=False, engine='pandas'):
+    """
+    Evaluate declarative rules against a frame in one pass per column
+
+    Each column is read once: its null mask, range, allowed-values and
+    uniqueness checks and its summary statistics all come from the same
+    array. Categorical columns are checked per category and mapped to
+    rows through their codes. The 'pyarrow' engine evaluates the same
+    rules with pyarrow.compute, which suits Arrow-backed frames.
+
+    Args:
+        df (pd.DataFrame): Frame to validate
+        rules (dict): 'columns' mapping column names to rule dicts, and an
+            optional 'unique' list of column combinations
+        sample (int, optional): Check a random sample of at most this many
+            rows instead of the whole frame. Failing-row counts are then
+            also extrapolated to the full frame; uniqueness is only checked
+            within the sample
+        random_state (int): Seed for the sample
+        strict (bool): Raise ValidationError when any row fails a rule
+        engine (str): One of utils.schema.ENGINES
+
+    Returns:
+        dict: 'rows', 'rows_checked', 'columns' (per column 'nulls',
+            'min'/'max' or 'values', and 'failures' per rule), 'unique'
+            (repeated rows per column combination), 'failed_rows' and
+            'estimated_failed_rows', all plain Python values
+
+    Raises:
+        ValueError: If the input, the rules or the engine are invalid
+        ValidationError: In strict mode, if any row fails a rule
+    """
+    check_engine(engine)
+    if not isinstance(df, pd.DataFrame):
+        raise ValueError("Input must be a pandas DataFrame")
+
+    if df.empty:
+        raise ValueError("Input DataFrame is empty")
+
+    column_rules = rules.get('columns', {})
+    missing_columns = [col for col in column_rules if col not in df.columns]
+    missing_columns += [col for key in rules.get('unique', []) for col in key if col not in df.columns]
+    if missing_columns:
+        raise ValueError(f"Missing columns for validation rules: {sorted(set(missing_columns))}")
+
+    checked = df
+    if sample is not None and len(df) > sample:
+        rng = np.random.default_rng(random_state)
+        checked = df.take(np.sort(rng.choice(len(df), size=sample, replace=False)))
+
+    failed = np.zeros(len(checked), dtype=bool)
+    report = {'rows': len(df), 'rows_checked': len(checked), 'columns': {}, 'unique': {}}
+    for column, rules_for_column in column_rules.items():
+        stats, fail = _check_column(checked[column], rules_for_column, engine)
+        report['columns'][column] = stats
+        failed |= fail
+
+    for key in rules.get('unique', []):
+        repeated = checked.duplicated(subset=list(key)).to_numpy()
+        report['unique']['+'.join(key)] = int(repeated.sum())
+        failed |= repeated
+
+    report['failed_rows'] = int(failed.sum())
+    report['estimated_failed_rows'] = round(report['failed_rows'] * len(df) / len(checked))
+
+    if strict and report['failed_rows']:
+        failing = {
+            column: stats['failures'] for column, stats in report['columns'].items()
+            if any(stats['failures'].values())
+        }
+        raise ValidationError(f"{report['failed_rows']} rows failed validation: {failing}")
+    return report